@@ -0,0 +1,80 @@
+# File        :   benchmarkCoarseToFine.py (Coarse-to-fine Grab Cut Benchmark)
+# Version     :   1.0.0
+# Description :   Latency and mask IoU of the coarse-to-fine Grab Cut of
+#                 grabCutSegmenter.py (automatic or fixed pyramid levels, band
+#                 tiles or one band crop) against Grab Cut at full resolution
+#                 (5 iterations, as main.py). Images: backgroundTest.png (1x and
+#                 2x) and synthetic 1280 x 960 object photos (IoU also against
+#                 the ground truth).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from grabCutSegmenter import findObjectRect, grabCutFull, grabCutCoarseToFine
+from syntheticScenes import makeScene, objectRect
+
+# Coarse-to-fine settings: (pyramid level (None: auto), tile size):
+fineSettings = [(None, 64), (1, 64), (2, 64), (2, 0), (3, 64)]
+totalScenes = 4
+
+
+# Intersection over union of two masks:
+def maskIou(maskA, maskB):
+    unionPixels = np.count_nonzero((maskA > 0) | (maskB > 0))
+    return 1.0 if unionPixels == 0 else np.count_nonzero((maskA > 0) & (maskB > 0)) / unionPixels
+
+
+# Runs a segmentation with a fixed OpenCV seed (Grab Cut initializes its
+# models with k-means), returns the mask and the seconds:
+def timedSegmentation(segmentFunction, *segmentArgs, **segmentKwargs):
+    cv2.setRNGSeed(0)
+    startTime = time.perf_counter()
+    outputMask = segmentFunction(*segmentArgs, **segmentKwargs)
+    return outputMask, time.perf_counter() - startTime
+
+
+# Test sets: (image, rect, ground truth or None):
+sampleImage = cv2.imread("backgroundTest.png")
+sampleImage2x = cv2.resize(sampleImage, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
+testSets = {"sample 1x": [(sampleImage, findObjectRect(sampleImage), None)],
+            "sample 2x": [(sampleImage2x, findObjectRect(sampleImage2x), None)],
+            "synthetic": []}
+for i in range(totalScenes):
+    sceneImage, labelImage = makeScene(1280, 960, randomSeed=i)
+    testSets["synthetic"].append((sceneImage, objectRect(labelImage), labelImage > 0))
+
+print("%-10s | %-16s | %9s | %7s | %12s | %12s" % ("images", "method", "ms", "speedup", "IoU vs full",
+                                                   "IoU vs truth"))
+for setName, testImages in testSets.items():
+    # Full resolution reference:
+    fullMasks, fullTimes = [], []
+    for inputImage, maskRect, _ in testImages:
+        fullMask, fullTime = timedSegmentation(grabCutFull, inputImage, maskRect)
+        fullMasks.append(fullMask)
+        fullTimes.append(fullTime)
+
+    truthIous = [maskIou(m, t) for m, (_, _, t) in zip(fullMasks, testImages) if t is not None]
+    print("%-10s | %-16s | %9.0f | %7s | %12s | %12s" % (setName, "full resolution", 1e3 * np.mean(fullTimes), "1.0x",
+                                                         "-", "%.4f" % np.mean(truthIous) if truthIous else "-"))
+
+    for pyramidLevel, tileSize in fineSettings:
+        methodTimes, fullIous, truthIous = [], [], []
+        for (inputImage, maskRect, truthMask), fullMask in zip(testImages, fullMasks):
+            fineMask, fineTime = timedSegmentation(grabCutCoarseToFine, inputImage, maskRect, pyramidLevel,
+                                                   tileSize=tileSize)
+            methodTimes.append(fineTime)
+            fullIous.append(maskIou(fineMask, fullMask))
+            if truthMask is not None:
+                truthIous.append(maskIou(fineMask, truthMask))
+
+        methodName = "L%s %s" % ("auto" if pyramidLevel is None else pyramidLevel,
+                                 "tiles %d" % tileSize if tileSize else "band crop")
+        print("%-10s | %-16s | %9.0f | %6.1fx | %5.4f (min %4.2f) | %12s" % (
+            setName, methodName, 1e3 * np.mean(methodTimes), np.sum(fullTimes) / np.sum(methodTimes),
+            np.mean(fullIous), np.min(fullIous), "%.4f" % np.mean(truthIous) if truthIous else "-"))
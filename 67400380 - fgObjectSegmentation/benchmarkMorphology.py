@@ -0,0 +1,95 @@
+# File        :   benchmarkMorphology.py (Morphology Engine Benchmark)
+# Version     :   1.0.0
+# Description :   Checks that morphology.py is bit-exact with cv2.morphologyEx and
+#                 hand-built kernels (every operation, border and iteration case
+#                 on small images), then times the morphology calls of the
+#                 projects (fgObjectSegmentation, colorCardLocation,
+#                 multicolumSplitting) and large binary closings on 4K, 12 MP and
+#                 20 MP images against the hand-built kernel + morphologyEx calls.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import itertools
+import time
+
+import numpy as np
+import cv2
+
+from morphology import morphology, morphOperations
+
+# Image sizes (width, height):
+imageSizes = [(3840, 2160), (4000, 3000), (5472, 3648)]
+
+# Timed cases: (name, image type, operation, kernel size, iterations, border):
+timedCases = [("fgObject close 3x3 x10", "Binary", "Closing", 3, 10, cv2.BORDER_REFLECT101),
+              ("colorCard close 3x3 x5", "Binary", "Closing", 3, 5, cv2.BORDER_REFLECT101),
+              ("multicolumn close 3x3 x2", "Binary", "Closing", 3, 2, cv2.BORDER_CONSTANT),
+              ("colorCard close 100 (BGR)", "Color", "Closing", 100, 1, cv2.BORDER_REFLECT101),
+              ("mask close 100x100", "Binary", "Closing", 100, 1, cv2.BORDER_REFLECT101),
+              ("mask open 15x15 x10", "Binary", "Opening", 15, 10, cv2.BORDER_REFLECT101),
+              ("mask dilate 201x201", "Binary", "Dilation", 201, 1, cv2.BORDER_CONSTANT)]
+
+
+# Reference: a new kernel and cv2.morphologyEx, as the projects call it:
+def referenceMorphology(inputImage, opString, kernelSize, opIterations, borderType, kernelShape=cv2.MORPH_RECT):
+    kernelSize = (kernelSize, kernelSize) if isinstance(kernelSize, int) else kernelSize
+    morphKernel = cv2.getStructuringElement(kernelShape, kernelSize)
+    return cv2.morphologyEx(inputImage, morphOperations[opString], morphKernel, None, None, opIterations, borderType)
+
+
+# Best of totalRuns, in ms, and the last result:
+def timedRuns(runFunction, totalRuns=3):
+    bestTime = np.inf
+    for _ in range(totalRuns):
+        startTime = time.perf_counter()
+        runResult = runFunction()
+        bestTime = min(bestTime, time.perf_counter() - startTime)
+    return 1e3 * bestTime, runResult
+
+
+# Test images: smooth random binary masks and a grayscale/color photo:
+def testImages(imageWidth, imageHeight, randomSeed=0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    noiseImage = randomGenerator.random((imageHeight // 8, imageWidth // 8)).astype(np.float32)
+    noiseImage = cv2.resize(cv2.GaussianBlur(noiseImage, (0, 0), 1.5), (imageWidth, imageHeight))
+    binaryImage = np.where(noiseImage > 0.5, 255, 0).astype(np.uint8)
+    colorImage = cv2.resize(cv2.imread("backgroundTest.png"), (imageWidth, imageHeight),
+                            interpolation=cv2.INTER_CUBIC)
+    return {"Binary": binaryImage, "Color": colorImage, "Gray": cv2.cvtColor(colorImage, cv2.COLOR_BGR2GRAY)}
+
+
+# Bit-exactness over all operations, shapes, borders and iteration cases:
+smallImages = testImages(403, 297)
+exactCases = itertools.product(morphOperations, [(3, 1), (3, 10), (4, 3), ((7, 31), 2), (50, 1), (101, 1)],
+                               ["Rect", "Ellipse", "Cross"],
+                               [cv2.BORDER_CONSTANT, cv2.BORDER_REPLICATE, cv2.BORDER_REFLECT101],
+                               ["Binary", "Gray", "Color"])
+totalCases, failedCases = 0, []
+for opString, (kernelSize, opIterations), kernelShape, borderType, imageType in exactCases:
+    inputImage = smallImages[imageType]
+    referenceImage = referenceMorphology(inputImage, opString, kernelSize, opIterations, borderType,
+                                         {"Rect": cv2.MORPH_RECT, "Ellipse": cv2.MORPH_ELLIPSE,
+                                          "Cross": cv2.MORPH_CROSS}[kernelShape])
+    outputImage = morphology(inputImage, opString, kernelSize, opIterations, kernelShape, borderType,
+                             binaryInput=imageType == "Binary")
+    totalCases += 1
+    if not np.array_equal(referenceImage, outputImage):
+        failedCases.append((opString, kernelSize, opIterations, kernelShape, borderType, imageType))
+print("Bit-exact: %d of %d cases %s" % (totalCases - len(failedCases), totalCases, failedCases if failedCases else ""))
+
+# Timings:
+print("%-27s | %-9s | %9s | %9s | %7s | %s" % ("case", "size", "ref ms", "engine ms", "speedup", "bit-exact"))
+for imageWidth, imageHeight in imageSizes:
+    largeImages = testImages(imageWidth, imageHeight)
+    for caseName, imageType, opString, kernelSize, opIterations, borderType in timedCases:
+        inputImage = largeImages[imageType]
+        referenceTime, referenceImage = timedRuns(
+            lambda: referenceMorphology(inputImage, opString, kernelSize, opIterations, borderType))
+        engineTime, outputImage = timedRuns(
+            lambda: morphology(inputImage, opString, kernelSize, opIterations, borderType=borderType,
+                               binaryInput=imageType == "Binary"))
+        print("%-27s | %-9s | %9.1f | %9.1f | %6.2fx | %s" % (
+            caseName, "%.1f MP" % (imageWidth * imageHeight / 1e6), referenceTime, engineTime,
+            referenceTime / engineTime, np.array_equal(referenceImage, outputImage)))
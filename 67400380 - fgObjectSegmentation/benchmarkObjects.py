@@ -0,0 +1,87 @@
+# File        :   benchmarkObjects.py (Multi-object Grab Cut Benchmark)
+# Version     :   1.0.0
+# Description :   Latency and per-object IoU of grabCutObjects.py (Grab Cut on ROI
+#                 crops, serial, thread pool and process pool) against Grab Cut on
+#                 the full frame for every rectangle (main.py, once per object),
+#                 on synthetic scenes with 1 to 9 objects. The same scenes padded
+#                 to twice the width and height (same objects, 4x the frame area)
+#                 show how each method scales with the frame.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import os
+import time
+
+import numpy as np
+import cv2
+
+from grabCutObjects import grabCutObjects
+from grabCutSegmenter import grabCutFull
+from syntheticScenes import makeScene, objectRect
+
+# Objects per scene, crop methods: (name, grabCutObjects arguments):
+objectCounts = [1, 4, 9]
+cropMethods = [("crops serial", {"poolType": "Serial"}),
+               ("crops threads", {"poolType": "Thread"}),
+               ("crops processes", {"poolType": "Process"})]
+
+
+# Mean IoU of the objects of two label images (labels 1..totalObjects):
+def objectIou(labelImage, truthImage, totalObjects):
+    objectIous = []
+    for k in range(1, totalObjects + 1):
+        unionPixels = np.count_nonzero((labelImage == k) | (truthImage == k))
+        objectIous.append(np.count_nonzero((labelImage == k) & (truthImage == k)) / max(unionPixels, 1))
+    return np.mean(objectIous)
+
+
+# Full frame Grab Cut for every rectangle, stitched as grabCutObjects:
+def grabCutFullObjects(inputImage, maskRects):
+    labelImage = np.zeros(inputImage.shape[:2], np.uint8)
+    objectMasks = [(k + 1, grabCutFull(inputImage, r) > 0) for k, r in enumerate(maskRects)]
+    for objectLabel, objectMask in sorted(objectMasks, key=lambda m: np.count_nonzero(m[1]), reverse=True):
+        labelImage[objectMask] = objectLabel
+    return labelImage
+
+
+# Runs a segmentation with a fixed OpenCV seed, returns the label image and
+# the seconds:
+def timedSegmentation(segmentFunction, *segmentArgs, **segmentKwargs):
+    cv2.setRNGSeed(0)
+    startTime = time.perf_counter()
+    labelImage = segmentFunction(*segmentArgs, **segmentKwargs)
+    return labelImage, time.perf_counter() - startTime
+
+
+if __name__ == "__main__":
+    # Test scenes: (name, image, rects, ground truth, objects):
+    testScenes = []
+    for totalObjects in objectCounts:
+        sceneImage, truthImage = makeScene(1280, 960, totalObjects, randomSeed=totalObjects)
+        maskRects = [objectRect(truthImage, k) for k in range(1, totalObjects + 1)]
+        testScenes.append(("%d obj" % totalObjects, sceneImage, maskRects, truthImage, totalObjects))
+
+        # Padded to 2x (same objects, rects shifted to the center):
+        padX, padY = sceneImage.shape[1] // 2, sceneImage.shape[0] // 2
+        paddedImage = cv2.copyMakeBorder(sceneImage, padY, padY, padX, padX, cv2.BORDER_REFLECT)
+        paddedTruth = cv2.copyMakeBorder(truthImage, padY, padY, padX, padX, cv2.BORDER_CONSTANT, value=0)
+        paddedRects = [(x + padX, y + padY, w, h) for x, y, w, h in maskRects]
+        testScenes.append(("%d obj 2x" % totalObjects, paddedImage, paddedRects, paddedTruth, totalObjects))
+
+    print("CPU cores: %d" % os.cpu_count())
+    print("%-9s | %-9s | %-16s | %9s | %7s | %9s | %9s" % ("scene", "frame", "method", "ms", "speedup",
+                                                           "IoU truth", "IoU full"))
+    for sceneName, sceneImage, maskRects, truthImage, totalObjects in testScenes:
+        frameText = "%dx%d" % (sceneImage.shape[1], sceneImage.shape[0])
+        fullLabels, fullTime = timedSegmentation(grabCutFullObjects, sceneImage, maskRects)
+        print("%-9s | %-9s | %-16s | %9.0f | %7s | %9.4f | %9s" % (sceneName, frameText, "full frame each",
+                                                                   1e3 * fullTime, "1.0x",
+                                                                   objectIou(fullLabels, truthImage, totalObjects),
+                                                                   "-"))
+        for methodName, methodArgs in cropMethods:
+            cropLabels, cropTime = timedSegmentation(grabCutObjects, sceneImage, maskRects, rngSeed=0, **methodArgs)
+            print("%-9s | %-9s | %-16s | %9.0f | %6.1fx | %9.4f | %9.4f" % (
+                sceneName, frameText, methodName, 1e3 * cropTime, fullTime / cropTime,
+                objectIou(cropLabels, truthImage, totalObjects), objectIou(cropLabels, fullLabels, totalObjects)))
@@ -0,0 +1,102 @@
+# File        :   benchmarkSequence.py (Grab Cut Sequence Mode Benchmark)
+# Version     :   1.0.1
+# Description :   Per-frame latency and drift of the sequence mode of
+#                 grabCutSequence.py (warm start from the previous mask and
+#                 models) against a cold start per frame (Grab Cut with the rect,
+#                 5 iterations, as main.py) on two turntable sequences: synthetic
+#                 (ground truth available) and backgroundTest.png rotated frame to
+#                 frame. Drift: IoU of every frame against the cold start of the
+#                 same frame (and the ground truth), first vs second half.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from grabCutSegmenter import findObjectRect, grabCutFull
+from grabCutSequence import createSequence, segmentFrame
+from syntheticScenes import makeSceneSequence, objectRect
+
+# Sequence mode settings: (name, createSequence arguments):
+totalFrames = 40
+sequenceSettings = [("warm, models", {"warmIterations": 1}),
+                    ("warm, models x2", {"warmIterations": 2}),
+                    ("warm, refit x2", {"warmIterations": 2, "carryModels": False}),
+                    ("warm, full frame", {"warmIterations": 1, "roiMargin": -1})]
+
+
+# Intersection over union of two masks:
+def maskIou(maskA, maskB):
+    unionPixels = np.count_nonzero((maskA > 0) | (maskB > 0))
+    return 1.0 if unionPixels == 0 else np.count_nonzero((maskA > 0) & (maskB > 0)) / unionPixels
+
+
+# Latency percentiles in ms:
+def latencyText(frameTimes):
+    return "%7.1f | %7.1f | %7.1f" % tuple(1e3 * np.percentile(frameTimes, [50, 95, 100]))
+
+
+# IoU means of the first and second half of the frames (None: no values):
+def halvesText(frameIous):
+    if not frameIous:
+        return "-"
+    halfFrames = len(frameIous) // 2
+    return "%.4f / %.4f" % (np.mean(frameIous[:halfFrames]), np.mean(frameIous[halfFrames:]))
+
+
+# Turntable sequence of the sample image: rotated around its center by
+# rotationStep degrees per frame, with sensor noise. (image, rect, None):
+def sampleSequence(sampleImage, totalFrames, rotationStep=1.5, randomSeed=0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    (imageHeight, imageWidth) = sampleImage.shape[:2]
+    sequenceFrames = []
+    for i in range(totalFrames):
+        rotationMatrix = cv2.getRotationMatrix2D((imageWidth / 2, imageHeight / 2), rotationStep * i, 1.0)
+        frameImage = cv2.warpAffine(sampleImage, rotationMatrix, (imageWidth, imageHeight),
+                                    flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        frameImage = np.clip(frameImage + randomGenerator.normal(0, 2, frameImage.shape), 0, 255).astype(np.uint8)
+        sequenceFrames.append((frameImage, findObjectRect(frameImage), None))
+    return sequenceFrames
+
+
+# Test sequences: lists of (image, rect, ground truth or None):
+testSequences = {"synthetic": [(f, objectRect(l), l > 0) for f, l in makeSceneSequence(totalFrames)],
+                 "sample": sampleSequence(cv2.imread("backgroundTest.png"), totalFrames)}
+
+print("%-9s | %-16s | %7s | %7s | %7s | %7s | %-29s | %-15s | %s" % (
+    "sequence", "method", "p50 ms", "p95 ms", "max ms", "speedup", "IoU vs cold (1st/2nd half)",
+    "IoU vs truth", "cold frames"))
+for sequenceName, sequenceFrames in testSequences.items():
+    # Cold start baseline, every frame with its own rect:
+    cv2.setRNGSeed(0)
+    coldMasks, coldTimes = [], []
+    for frameImage, frameRect, _ in sequenceFrames:
+        startTime = time.perf_counter()
+        coldMasks.append(grabCutFull(frameImage, frameRect))
+        coldTimes.append(time.perf_counter() - startTime)
+    coldTruth = [maskIou(m, t) for m, (_, _, t) in zip(coldMasks, sequenceFrames) if t is not None]
+    print("%-9s | %-16s | %s | %7s | %-29s | %-15s | %d" % (sequenceName, "cold start", latencyText(coldTimes),
+                                                            "1.0x", "-", halvesText(coldTruth), len(coldMasks)))
+
+    # Sequence modes, the rect of the frame only on cold starts:
+    for settingName, sequenceArgs in sequenceSettings:
+        cv2.setRNGSeed(0)
+        sequence = createSequence(**sequenceArgs)
+        frameTimes, coldIous, truthIous = [], [], []
+        for (frameImage, frameRect, truthMask), coldMask in zip(sequenceFrames, coldMasks):
+            startTime = time.perf_counter()
+            outputMask, _ = segmentFrame(sequence, frameImage, frameRect)
+            frameTimes.append(time.perf_counter() - startTime)
+            coldIous.append(maskIou(outputMask, coldMask))
+            if truthMask is not None:
+                truthIous.append(maskIou(outputMask, truthMask))
+
+        # Latency of the frames after the first one:
+        print("%-9s | %-16s | %s | %6.1fx | %-29s | %-15s | %d" % (
+            sequenceName, settingName, latencyText(frameTimes[1:]), np.median(coldTimes) / np.median(frameTimes[1:]),
+            "%s (min %.2f)" % (halvesText(coldIous[1:]), np.min(coldIous)), halvesText(truthIous[1:]),
+            sequence["Stats"]["Cold"]))
@@ -0,0 +1,172 @@
+# File        :   grabCutSegmenter.py (Foreground object segmentation via Grab Cut)
+# Version     :   1.3.0
+# Description :   The segmentation of main.py as functions: the object rectangles
+#                 (adaptive threshold, closing, external contours), Grab Cut on
+#                 the full resolution image and a coarse-to-fine mode. The fine
+#                 mode runs Grab Cut on a downscaled image, upsamples the mask
+#                 and runs Grab Cut again (GC_INIT_WITH_MASK) at full resolution
+#                 only on tiles covering a narrow uncertain band around the
+#                 boundary; everything else is fixed as definite fg/bg. This
+#                 mode is lossy: parts of the object lost at the coarse scale
+#                 can not come back in the band. The coarse cut is checked
+#                 against the next coarser level and a finer level (down to
+#                 full resolution) is used where they disagree.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+from morphology import getKernel, morphology
+
+# Grab Cut fits 5 Gaussians per model (k-means needs a sample per component):
+gmmComponents = 5
+
+
+# Gets the bounding rectangles (x, y, w, h) of all targets as in main.py:
+# adaptive threshold, closing and the external contours above minArea:
+def findObjectRects(inputImage, windowSize=31, windowConstant=11, closingIterations=10, minArea=1000):
+    grayscaleImage = cv2.cvtColor(inputImage, cv2.COLOR_BGR2GRAY)
+    binaryImage = cv2.adaptiveThreshold(grayscaleImage, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV,
+                                        windowSize, windowConstant)
+    binaryImage = morphology(binaryImage, "Closing", 3, closingIterations, borderType=cv2.BORDER_REFLECT101,
+                             binaryInput=True)
+
+    contours, _ = cv2.findContours(binaryImage, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return [cv2.boundingRect(c) for c in contours if cv2.contourArea(c) > minArea]
+
+
+# Gets the target bounding rectangle (x, y, w, h) as in main.py: the last
+# of findObjectRects. Returns None if there is no target:
+def findObjectRect(inputImage, windowSize=31, windowConstant=11, closingIterations=10, minArea=1000):
+    maskRects = findObjectRects(inputImage, windowSize, windowConstant, closingIterations, minArea)
+    return maskRects[-1] if maskRects else None
+
+
+# Foreground (definite and probable) of a Grab Cut mask, as 0/255:
+def foregroundMask(grabCutMask):
+    return np.where((grabCutMask == cv2.GC_FGD) | (grabCutMask == cv2.GC_PR_FGD), 255, 0).astype(np.uint8)
+
+
+# Grab Cut on the full resolution image (INIT_WITH_RECT), as main.py.
+# Returns the foreground mask (0/255):
+def grabCutFull(inputImage, maskRect, grabCutIterations=5):
+    grabCutMask = np.zeros(inputImage.shape[:2], np.uint8)
+    bgModel = np.zeros((1, 65), np.float64)
+    fgModel = np.zeros((1, 65), np.float64)
+    cv2.grabCut(inputImage, grabCutMask, maskRect, bgModel, fgModel, grabCutIterations, mode=cv2.GC_INIT_WITH_RECT)
+    return foregroundMask(grabCutMask)
+
+
+# Grab Cut mask of an upsampled coarse foreground: definite fg/bg away from
+# the boundary, probable fg/bg in the band of bandRadius pixels around it:
+def bandMask(coarseMask, bandRadius):
+    bandKernel = getKernel(2 * bandRadius + 1, "Ellipse")
+    uncertainBand = cv2.dilate(coarseMask, bandKernel) != cv2.erode(coarseMask, bandKernel)
+
+    grabCutMask = np.where(coarseMask > 0, cv2.GC_FGD, cv2.GC_BGD).astype(np.uint8)
+    grabCutMask[uncertainBand] += 2  # GC_BGD -> GC_PR_BGD, GC_FGD -> GC_PR_FGD
+    return grabCutMask, uncertainBand
+
+
+# Grab Cut (INIT_WITH_MASK) on one crop of the mask, in place. Skipped if
+# one of the models would not have enough samples:
+def refineCrop(inputImage, grabCutMask, x1, y1, x2, y2, grabCutIterations):
+    cropMask = grabCutMask[y1:y2, x1:x2]
+    fgSamples = np.count_nonzero(cropMask & 1)
+    if fgSamples < gmmComponents or cropMask.size - fgSamples < gmmComponents:
+        return False
+
+    bgModel = np.zeros((1, 65), np.float64)
+    fgModel = np.zeros((1, 65), np.float64)
+    refinedMask = np.ascontiguousarray(cropMask)
+    cv2.grabCut(np.ascontiguousarray(inputImage[y1:y2, x1:x2]), refinedMask, None, bgModel, fgModel,
+                grabCutIterations, mode=cv2.GC_INIT_WITH_MASK)
+    cropMask[:] = refinedMask
+    return True
+
+
+# Deepest pyramid level that keeps the short side of the rectangle at
+# least minCoarseSize pixels (too few pixels and the coarse cut collapses):
+def autoPyramidLevel(maskRect, minCoarseSize=128):
+    rectSize = min(maskRect[2], maskRect[3])
+    return max(0, int(np.floor(np.log2(max(rectSize, 1) / minCoarseSize))))
+
+
+# Grab Cut (INIT_WITH_RECT) at 1 / 2^pyramidLevel. Returns the coarse
+# foreground mask (0/255):
+def grabCutCoarse(inputImage, maskRect, pyramidLevel, grabCutIterations=5):
+    (imageHeight, imageWidth) = inputImage.shape[:2]
+    scaleFactor = 2 ** pyramidLevel
+    coarseImage = cv2.resize(inputImage, (max(1, imageWidth // scaleFactor), max(1, imageHeight // scaleFactor)),
+                             interpolation=cv2.INTER_AREA)
+    (x, y, w, h) = maskRect
+    coarseRect = (x // scaleFactor, y // scaleFactor, max(1, w // scaleFactor), max(1, h // scaleFactor))
+    return grabCutFull(coarseImage, coarseRect, grabCutIterations)
+
+
+# Intersection over union of a coarse mask and the mask of the next coarser
+# level (upsampled to it):
+def coarseAgreement(coarseMask, coarserMask):
+    coarserMask = cv2.resize(coarserMask, coarseMask.shape[::-1], interpolation=cv2.INTER_LINEAR) > 127
+    unionPixels = np.count_nonzero((coarseMask > 0) | coarserMask)
+    return 1.0 if unionPixels == 0 else np.count_nonzero((coarseMask > 0) & coarserMask) / unionPixels
+
+
+# Coarse-to-fine Grab Cut: Grab Cut (INIT_WITH_RECT) at 1 / 2^pyramidLevel
+# (None: autoPyramidLevel), the mask upsampled and refined at full
+# resolution only in the band of bandRadius pixels (default: two coarse
+# pixels) around the boundary, on tiles of tileSize (0: one crop around
+# the whole band). Lossy: if the coarse mask and the one of the next
+# coarser level agree less than minAgreement (IoU, 0: no check), the
+# object does not survive the downscale and the next finer level is used
+# (level 0: Grab Cut at full resolution). Returns the foreground mask
+# (0/255):
+def grabCutCoarseToFine(inputImage, maskRect, pyramidLevel=None, coarseIterations=5, fineIterations=2,
+                        bandRadius=None, tileSize=64, minCoarseSize=128, minAgreement=0.9):
+    (imageHeight, imageWidth) = inputImage.shape[:2]
+    if pyramidLevel is None:
+        pyramidLevel = autoPyramidLevel(maskRect, minCoarseSize)
+
+    # Coarse Grab Cut, the finest level that agrees with the next coarser one:
+    coarserMask = None
+    while pyramidLevel > 0:
+        coarseMask = grabCutCoarse(inputImage, maskRect, pyramidLevel, coarseIterations)
+        if minAgreement <= 0:
+            break
+        if coarserMask is None:
+            coarserMask = grabCutCoarse(inputImage, maskRect, pyramidLevel + 1, coarseIterations)
+        if coarseAgreement(coarseMask, coarserMask) >= minAgreement:
+            break
+        coarserMask = coarseMask
+        pyramidLevel -= 1
+
+    if pyramidLevel == 0:
+        return grabCutFull(inputImage, maskRect, coarseIterations)
+    if bandRadius is None:
+        bandRadius = 2 * 2 ** pyramidLevel
+
+    # Upsampled (smooth) mask and the uncertain band:
+    coarseMask = cv2.resize(coarseMask, (imageWidth, imageHeight), interpolation=cv2.INTER_LINEAR)
+    cv2.threshold(coarseMask, 127, 255, cv2.THRESH_BINARY, dst=coarseMask)
+    grabCutMask, uncertainBand = bandMask(coarseMask, bandRadius)
+    bandRows, bandColumns = np.nonzero(uncertainBand)
+    if len(bandRows) == 0:
+        return coarseMask
+
+    # Fine Grab Cut, only where the band is:
+    bx1, by1, bx2, by2 = bandColumns.min(), bandRows.min(), bandColumns.max() + 1, bandRows.max() + 1
+    if tileSize <= 0:
+        refineCrop(inputImage, grabCutMask, bx1, by1, bx2, by2, fineIterations)
+    else:
+        # Band pixels per tile (one histogram):
+        tileCounts = np.zeros(((imageHeight - 1) // tileSize + 1, (imageWidth - 1) // tileSize + 1), np.int64)
+        np.add.at(tileCounts, (bandRows // tileSize, bandColumns // tileSize), 1)
+        for tileRow, tileColumn in zip(*np.nonzero(tileCounts)):
+            x1, y1 = tileColumn * tileSize, tileRow * tileSize
+            refineCrop(inputImage, grabCutMask, x1, y1, min(x1 + tileSize, imageWidth),
+                       min(y1 + tileSize, imageHeight), fineIterations)
+
+    return foregroundMask(grabCutMask)
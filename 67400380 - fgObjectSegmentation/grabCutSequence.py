@@ -0,0 +1,139 @@
+# File        :   grabCutSequence.py (Grab Cut on Image Sequences)
+# Version     :   1.1.0
+# Description :   Sequence mode for the Grab Cut segmentation of main.py (video,
+#                 turntable shoots). The first frame runs a cold Grab Cut
+#                 (INIT_WITH_RECT). Every next frame starts from the previous
+#                 mask (eroded: definite foreground, dilated: probable band,
+#                 outside: definite background) and the previous fg/bg models
+#                 (frozen, GC_EVAL_FREEZE_MODEL), with fewer iterations, inside a
+#                 ROI around the previous object. A cold start runs again, with
+#                 the object rectangle of that frame, if the area jumps.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+from grabCutSegmenter import foregroundMask
+from morphology import getKernel
+
+
+# Creates the sequence state dictionary:
+def createSequence(coldIterations=5, warmIterations=2, bandRadius=8, roiMargin=0.15, carryModels=True,
+                   maxAreaChange=0.3, refreshInterval=0):
+    sequenceParams = {"ColdIterations": coldIterations,  # Grab Cut iterations of a cold start
+                      "WarmIterations": warmIterations,  # Grab Cut iterations from the previous frame
+                      "BandRadius": bandRadius,  # Erosion/dilation radius of the previous mask (px)
+                      "RoiMargin": roiMargin,  # ROI margin, fraction of the object size (<0: full frame)
+                      "CarryModels": carryModels,  # Freeze the fg/bg models (GC_EVAL_FREEZE_MODEL) or refit
+                      "MaxAreaChange": maxAreaChange,  # Max relative change of the object area per frame
+                      "RefreshInterval": refreshInterval}  # Cold start every N warm frames (0: never)
+
+    stats = {"Frames": 0, "Cold": 0, "Warm": 0, "AreaResets": 0}
+
+    return {"Params": sequenceParams, "Rect": None, "Mask": None, "BgModel": None, "FgModel": None,
+            "WarmFrames": 0, "Stats": stats}
+
+
+# Cold start: Grab Cut with the rectangle on the full frame:
+def coldStart(sequence, inputImage, maskRect):
+    grabCutMask = np.zeros(inputImage.shape[:2], np.uint8)
+    bgModel = np.zeros((1, 65), np.float64)
+    fgModel = np.zeros((1, 65), np.float64)
+    cv2.grabCut(inputImage, grabCutMask, maskRect, bgModel, fgModel, sequence["Params"]["ColdIterations"],
+                mode=cv2.GC_INIT_WITH_RECT)
+
+    sequence["Rect"] = maskRect
+    sequence["BgModel"], sequence["FgModel"] = bgModel, fgModel
+    sequence["WarmFrames"] = 0
+    return foregroundMask(grabCutMask)
+
+
+# Grab Cut mask from the previous foreground: eroded -> definite fg,
+# dilated band -> probable fg/bg, outside -> definite bg:
+def priorMask(previousMask, bandRadius):
+    bandKernel = getKernel(2 * bandRadius + 1, "Ellipse")
+    grabCutMask = np.full(previousMask.shape, cv2.GC_BGD, np.uint8)
+    grabCutMask[cv2.dilate(previousMask, bandKernel) > 0] = cv2.GC_PR_BGD
+    grabCutMask[previousMask > 0] = cv2.GC_PR_FGD
+    grabCutMask[cv2.erode(previousMask, bandKernel) > 0] = cv2.GC_FGD
+    return grabCutMask
+
+
+# Warm start: Grab Cut from the previous mask (and models) in a ROI around
+# the previous object. Returns the foreground mask or None if the object
+# is lost (no pixels of one of the classes):
+def warmStart(sequence, inputImage):
+    sequenceParams = sequence["Params"]
+    (imageHeight, imageWidth) = inputImage.shape[:2]
+    previousMask = sequence["Mask"]
+
+    # ROI around the previous object (band and margin included):
+    x, y, w, h = cv2.boundingRect(previousMask)
+    if w == 0 or h == 0:
+        return None
+    x1, y1, x2, y2 = 0, 0, imageWidth, imageHeight
+    if sequenceParams["RoiMargin"] >= 0:
+        mx = int(sequenceParams["RoiMargin"] * w) + 2 * sequenceParams["BandRadius"]
+        my = int(sequenceParams["RoiMargin"] * h) + 2 * sequenceParams["BandRadius"]
+        x1, y1, x2, y2 = max(0, x - mx), max(0, y - my), min(imageWidth, x + w + mx), min(imageHeight, y + h + my)
+
+    grabCutMask = priorMask(previousMask[y1:y2, x1:x2], sequenceParams["BandRadius"])
+    fgSamples = np.count_nonzero(grabCutMask & 1)
+    if fgSamples == 0 or fgSamples == grabCutMask.size:
+        return None
+
+    # GC_EVAL_FREEZE_MODEL keeps the given models (GC_EVAL and
+    # GC_INIT_WITH_MASK learn them again on every iteration):
+    roiImage = np.ascontiguousarray(inputImage[y1:y2, x1:x2])
+    if sequenceParams["CarryModels"]:
+        cv2.grabCut(roiImage, grabCutMask, None, sequence["BgModel"], sequence["FgModel"],
+                    sequenceParams["WarmIterations"], mode=cv2.GC_EVAL_FREEZE_MODEL)
+    else:
+        cv2.grabCut(roiImage, grabCutMask, None, sequence["BgModel"], sequence["FgModel"],
+                    sequenceParams["WarmIterations"], mode=cv2.GC_INIT_WITH_MASK)
+
+    outputMask = np.zeros((imageHeight, imageWidth), np.uint8)
+    outputMask[y1:y2, x1:x2] = foregroundMask(grabCutMask)
+    sequence["WarmFrames"] += 1
+    return outputMask
+
+
+# Segments the next frame of the sequence. The object rectangle (x, y, w, h)
+# is only needed for cold starts (first frame, resets): rectFinder(inputImage)
+# finds it on the cold frame, else (or if it finds none) maskRect or the last
+# cold start rectangle is used. Returns the foreground mask (0/255) and the
+# frame mode ("Cold" or "Warm"):
+def segmentFrame(sequence, inputImage, maskRect=None, rectFinder=None):
+    sequenceParams = sequence["Params"]
+    sequence["Stats"]["Frames"] += 1
+
+    # Warm start unless a refresh is due:
+    outputMask = None
+    refreshDue = 0 < sequenceParams["RefreshInterval"] <= sequence["WarmFrames"]
+    if sequence["Mask"] is not None and not refreshDue:
+        outputMask = warmStart(sequence, inputImage)
+        # The area must not jump:
+        if outputMask is not None:
+            previousArea = max(np.count_nonzero(sequence["Mask"]), 1)
+            areaChange = abs(np.count_nonzero(outputMask) / previousArea - 1.0)
+            if areaChange > sequenceParams["MaxAreaChange"]:
+                sequence["Stats"]["AreaResets"] += 1
+                outputMask = None
+
+    frameMode = "Warm"
+    if outputMask is None:
+        if rectFinder is not None:
+            maskRect = rectFinder(inputImage) or maskRect
+        if maskRect is None:
+            maskRect = sequence["Rect"]
+        if maskRect is None:
+            raise ValueError("segmentFrame>> Error: A cold start needs the object rectangle.")
+        outputMask = coldStart(sequence, inputImage, maskRect)
+        frameMode = "Cold"
+
+    sequence["Mask"] = outputMask
+    sequence["Stats"][frameMode] += 1
+    return outputMask, frameMode
@@ -1,7 +1,13 @@
 # File        :   main.py (Foreground object segmentation via Grab Cut)
-# Version     :   1.0.0
+# Version     :   1.3.2
 # Description :   Script that segments a foreground object via Grab Cut algorithm.
 #                 Answer for: https://stackoverflow.com/questions/67400380/background-removal-from-images-with-opencv-in-android
+#                 Grab Cut runs at full resolution or coarse-to-fine (downscaled
+#                 Grab Cut refined at full resolution around the boundary,
+#                 lossy: it falls back to finer levels when the object does not
+#                 survive the downscale).
+#                 "Objects" segments every target on its own crop, in parallel,
+#                 into one label image.
 # Date:       :   Fab 09, 2022
 # Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
 # License     :   Creative Commons CC0
@@ -10,6 +16,10 @@
 import cv2
 import numpy as np
 
+from grabCutObjects import grabCutObjects
+from grabCutSegmenter import grabCutCoarseToFine
+from morphology import morphOperations, morphology
+
 
 # Defines a re-sizable image window:
 def showImage(imageName, inputImage):
@@ -18,18 +28,16 @@ def showImage(imageName, inputImage):
     cv2.waitKey(0)
 
 
-# Applies a morpho operation:
+# Applies a morpho operation (rectangular SE, see morphology.py):
 def morphoOperation(binaryImage, kernelSize, opIterations, opString):
-    # Get the structuring element:
-    morphKernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernelSize, kernelSize))
-    # Perform Operation:
-    if opString == "Closing":
-        op = cv2.MORPH_CLOSE
-    else:
+    # Check the operation:
+    if opString not in morphOperations:
         print("Morpho Operation not defined!")
         return None
 
-    outImage = cv2.morphologyEx(binaryImage, op, morphKernel, None, None, opIterations, cv2.BORDER_REFLECT101)
+    # Perform Operation (cached kernel):
+    outImage = morphology(binaryImage, opString, kernelSize, opIterations, borderType=cv2.BORDER_REFLECT101,
+                          binaryInput=True)
 
     return outImage
 
@@ -38,6 +46,9 @@ def morphoOperation(binaryImage, kernelSize, opIterations, opString):
 path = "D://opencvImages//"
 fileName = "backgroundTest.png"
 
+# Grab Cut mode: "Full" (full resolution), "CoarseToFine" (faster, lossy) or "Objects" (all targets):
+grabCutMode = "Full"
+
 # Reading an image in default mode:
 inputImage = cv2.imread(path + fileName)
 
@@ -62,6 +73,8 @@ contours, hierarchy = cv2.findContours(binaryImage, cv2.RETR_EXTERNAL, cv2.CHAIN
 
 # This list will store the target bounding box
 maskRect = []
+# All the target bounding boxes (for the "Objects" mode):
+maskRects = []
 
 # Look for the outer bounding boxes (no children):
 for i, c in enumerate(contours):
@@ -79,6 +92,7 @@ for i, c in enumerate(contours):
     if currentArea > minArea:
         # Found the target bounding rectangle:
         maskRect = boundRect
+        maskRects.append(boundRect)
 
         # (Optional) Draw the rectangle on the input image:
         # Get the dimensions of the bounding rect:
@@ -95,28 +109,49 @@ for i, c in enumerate(contours):
         # (Optional) Show image:
         showImage("Bounding Rectangle", inputImageCopy)
 
-# Create mask for Grab n Cut,
-# The mask is a uint8 type, same dimensions as
-# original input:
-mask = np.zeros(inputImage.shape[:2], np.uint8)
-
-# Grab n Cut needs two empty matrices of
-# Float type (64 bits) and size 1 (rows) x 65 (columns):
-bgModel = np.zeros((1, 65), np.float64)
-fgModel = np.zeros((1, 65), np.float64)
-
-# Run Grab n Cut on INIT_WITH_RECT mode:
+# Run Grab n Cut:
 grabCutIterations = 5
-mask, bgModel, fgModel = cv2.grabCut(inputImage, mask, maskRect, bgModel, fgModel, grabCutIterations,
-                                     mode=cv2.GC_INIT_WITH_RECT)
-
-# Set all definite background (0) and probable background pixels (2)
-# to 0 while definite foreground and probable foreground pixels are
-# set to 1
-outputMask = np.where((mask == cv2.GC_BGD) | (mask == cv2.GC_PR_BGD), 0, 1)
 
-# Scale the mask from the range [0, 1] to [0, 255]
-outputMask = (outputMask * 255).astype("uint8")
+if grabCutMode == "CoarseToFine":
+    # Downscaled Grab Cut, refined at full resolution around the boundary.
+    # Lossy: parts lost at the coarse scale do not come back (a finer level
+    # is used when two coarse levels disagree):
+    outputMask = grabCutCoarseToFine(inputImage, maskRect, coarseIterations=grabCutIterations)
+
+elif grabCutMode == "Objects":
+    # Every target on its own crop, crops in a thread pool:
+    labelImage = grabCutObjects(inputImage, maskRects, grabCutIterations, poolType="Thread")
+
+    # (Optional) Show the objects in color:
+    labelColors = cv2.applyColorMap((labelImage * (255 // max(len(maskRects), 1))).astype(np.uint8),
+                                    cv2.COLORMAP_JET)
+    labelColors[labelImage == 0] = 0
+    showImage("Objects", labelColors)
+
+    outputMask = np.where(labelImage > 0, 255, 0).astype("uint8")
+
+else:
+    # Create mask for Grab n Cut,
+    # The mask is a uint8 type, same dimensions as
+    # original input:
+    mask = np.zeros(inputImage.shape[:2], np.uint8)
+
+    # Grab n Cut needs two empty matrices of
+    # Float type (64 bits) and size 1 (rows) x 65 (columns):
+    bgModel = np.zeros((1, 65), np.float64)
+    fgModel = np.zeros((1, 65), np.float64)
+
+    # Run Grab n Cut on INIT_WITH_RECT mode:
+    mask, bgModel, fgModel = cv2.grabCut(inputImage, mask, maskRect, bgModel, fgModel, grabCutIterations,
+                                         mode=cv2.GC_INIT_WITH_RECT)
+
+    # Set all definite background (0) and probable background pixels (2)
+    # to 0 while definite foreground and probable foreground pixels are
+    # set to 1
+    outputMask = np.where((mask == cv2.GC_BGD) | (mask == cv2.GC_PR_BGD), 0, 1)
+
+    # Scale the mask from the range [0, 1] to [0, 255]
+    outputMask = (outputMask * 255).astype("uint8")
 
 # (Optional) Apply a morphological closing with:
 # Rectangular SE size 3 x 3 and 5 iterations:
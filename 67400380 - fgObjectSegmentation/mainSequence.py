@@ -0,0 +1,85 @@
+# File        :   mainSequence.py (Foreground object segmentation on image sequences)
+# Version     :   1.0.1
+# Description :   Sequence version of main.py for turntable shoots and video.
+#                 The first frame runs Grab Cut with the object rectangle; every
+#                 next frame starts from the previous mask and fg/bg models with
+#                 fewer iterations. Cold starts (first frame, resets) find the
+#                 rectangle on their own frame. Reads an image folder, a video
+#                 file or a synthetic turntable sequence and prints the per-frame
+#                 latency.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+# imports:
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+
+from grabCutSegmenter import findObjectRect
+from grabCutSequence import createSequence, segmentFrame
+from syntheticScenes import makeSceneSequence
+
+# Frame source: image folder, video file path or "Synthetic":
+frameSource = "Synthetic"
+
+# Colors per frame mode:
+modeColors = {"Cold": (0, 0, 255), "Warm": (0, 255, 0)}
+
+
+# Yields BGR frames from the frame source:
+def readFrames(frameSource):
+    if frameSource == "Synthetic":
+        for sceneImage, _ in makeSceneSequence(100):
+            yield sceneImage
+        return
+
+    if os.path.isdir(frameSource):
+        for imagePath in sorted(glob.glob(os.path.join(frameSource, "*.png")) +
+                                glob.glob(os.path.join(frameSource, "*.jpg"))):
+            yield cv2.imread(imagePath)
+        return
+
+    videoCapture = cv2.VideoCapture(frameSource)
+    while True:
+        frameRead, inputFrame = videoCapture.read()
+        if not frameRead:
+            break
+        yield inputFrame
+    videoCapture.release()
+
+
+# Set the sequence:
+sequence = createSequence(coldIterations=5, warmIterations=1)
+frameTimes = []
+
+cv2.namedWindow("Foreground", flags=cv2.WINDOW_GUI_NORMAL)
+
+for inputFrame in readFrames(frameSource):
+    # Object rectangle of the cold start frames (as main.py):
+    startTime = time.perf_counter()
+    try:
+        outputMask, frameMode = segmentFrame(sequence, inputFrame, rectFinder=findObjectRect)
+    except ValueError:
+        print("No target found in the first frame.")
+        break
+    frameTimes.append(time.perf_counter() - startTime)
+
+    # Show the segmented object and the frame mode:
+    outputImage = cv2.bitwise_and(inputFrame, inputFrame, mask=outputMask)
+    cv2.putText(outputImage, "%s %.1f ms" % (frameMode, 1e3 * frameTimes[-1]), (10, 30), cv2.FONT_HERSHEY_SIMPLEX,
+                1, modeColors[frameMode], 2)
+    cv2.imshow("Foreground", outputImage)
+
+    # Quit with Esc:
+    if cv2.waitKey(1) == 27:
+        break
+
+cv2.destroyAllWindows()
+print(sequence["Stats"])
+if frameTimes:
+    print("Latency (ms): p50 %.1f, p95 %.1f" % tuple(1e3 * np.percentile(frameTimes, [50, 95])))
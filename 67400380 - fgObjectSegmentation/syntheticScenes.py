@@ -0,0 +1,120 @@
+# File        :   syntheticScenes.py (Synthetic Object Photos)
+# Version     :   1.1.0
+# Description :   Generates photo-like test scenes for the Grab Cut segmentation:
+#                 textured objects with smooth random outlines and shading over a
+#                 cluttered, shaded background. Returns the image (BGR) and the
+#                 ground truth label image (0: background, i: object i).
+#                 Turntable sequences: one object rotating (and slowly drifting)
+#                 over a fixed background, with per-frame sensor noise and gain.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Outline of a smooth random blob (polygon, int32) around a center:
+def blobOutline(center, radius, randomGenerator, totalPoints=180):
+    angles = np.linspace(0, 2 * np.pi, totalPoints, endpoint=False)
+    harmonicAmplitudes = randomGenerator.uniform(0, 0.12, 4)
+    harmonicPhases = randomGenerator.uniform(0, 2 * np.pi, 4)
+    pointRadius = radius * (1 + sum(a * np.cos((k + 2) * angles + p) for k, (a, p) in
+                                    enumerate(zip(harmonicAmplitudes, harmonicPhases))))
+    outlinePoints = np.column_stack((center[0] + pointRadius * np.cos(angles),
+                                     center[1] + pointRadius * np.sin(angles)))
+    return np.round(outlinePoints).astype(np.int32)
+
+
+# Smooth random texture (float32, about zero mean) of a given scale:
+def smoothNoise(imageShape, noiseScale, randomGenerator):
+    noiseImage = randomGenerator.normal(0, 1, (imageShape[0] // noiseScale + 2, imageShape[1] // noiseScale + 2))
+    noiseImage = cv2.resize(noiseImage.astype(np.float32), (imageShape[1], imageShape[0]),
+                            interpolation=cv2.INTER_CUBIC)
+    return noiseImage / max(noiseImage.std(), 1e-6)
+
+
+# Renders the objects (list of (outline, color)) over a random background.
+# Returns the image and the label image:
+def renderScene(frameWidth, frameHeight, sceneObjects, randomGenerator):
+    imageShape = (frameHeight, frameWidth)
+
+    # Shaded background, blocks of clutter and grain:
+    y, x = np.mgrid[0:frameHeight, 0:frameWidth].astype(np.float32)
+    backgroundColor = randomGenerator.uniform(90, 170, 3).astype(np.float32)
+    sceneImage = backgroundColor + 25 * (x / frameWidth - 0.5)[..., None] + 15 * (y / frameHeight - 0.5)[..., None]
+    for _ in range(12):
+        bx, by = randomGenerator.integers(0, frameWidth), randomGenerator.integers(0, frameHeight)
+        bw, bh = randomGenerator.integers(20, frameWidth // 4), randomGenerator.integers(20, frameHeight // 4)
+        sceneImage[by:by + bh, bx:bx + bw] += randomGenerator.uniform(-30, 30, 3)
+    sceneImage += 8 * smoothNoise(imageShape, 24, randomGenerator)[..., None]
+
+    # Objects, drawn in order (later objects occlude earlier ones):
+    labelImage = np.zeros(imageShape, np.uint8)
+    for i, (objectOutline, objectColor) in enumerate(sceneObjects):
+        objectMask = np.zeros(imageShape, np.uint8)
+        cv2.fillPoly(objectMask, [objectOutline], 255, cv2.LINE_8)
+        objectShading = 18 * smoothNoise(imageShape, 40, randomGenerator)[..., None]
+        objectTexture = 10 * smoothNoise(imageShape, 4, randomGenerator)[..., None]
+        objectPixels = objectMask > 0
+        sceneImage[objectPixels] = (np.asarray(objectColor, np.float32) + objectShading + objectTexture)[objectPixels]
+        labelImage[objectPixels] = i + 1
+
+    sceneImage += randomGenerator.normal(0, 4, sceneImage.shape)
+    return np.clip(sceneImage, 0, 255).astype(np.uint8), labelImage
+
+
+# Random object color, away from the background gray:
+def objectColor(randomGenerator):
+    return randomGenerator.uniform([20, 60, 140], [90, 160, 240])
+
+
+# Generates one scene with totalObjects random blobs. Returns the image
+# (BGR) and the ground truth label image:
+def makeScene(frameWidth=1280, frameHeight=960, totalObjects=1, randomSeed=0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    sceneObjects = []
+    for _ in range(totalObjects):
+        radius = min(frameWidth, frameHeight) * randomGenerator.uniform(0.12, 0.3) / max(1.0, totalObjects ** 0.5)
+        center = (randomGenerator.uniform(radius * 1.3, frameWidth - radius * 1.3),
+                  randomGenerator.uniform(radius * 1.3, frameHeight - radius * 1.3))
+        sceneObjects.append((blobOutline(center, radius, randomGenerator), objectColor(randomGenerator)))
+    return renderScene(frameWidth, frameHeight, sceneObjects, randomGenerator)
+
+
+# Bounding rectangle (x, y, w, h) of an object of a label image, grown by
+# a margin (fraction of its size) and clipped to the image:
+def objectRect(labelImage, objectLabel=1, rectMargin=0.08):
+    x, y, w, h = cv2.boundingRect((labelImage == objectLabel).astype(np.uint8))
+    mx, my = int(rectMargin * w), int(rectMargin * h)
+    x1, y1 = max(0, x - mx), max(0, y - my)
+    x2, y2 = min(labelImage.shape[1], x + w + mx), min(labelImage.shape[0], y + h + my)
+    return x1, y1, x2 - x1, y2 - y1
+
+
+# Generates a turntable sequence of totalFrames: one object rotating by
+# rotationStep degrees per frame and drifting up to driftRadius pixels over
+# the same background. Yields (image, label image) per frame:
+def makeSceneSequence(totalFrames, frameWidth=640, frameHeight=480, rotationStep=2.0, driftRadius=12.0,
+                      randomSeed=0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    radius = min(frameWidth, frameHeight) * randomGenerator.uniform(0.2, 0.3)
+    baseOutline = blobOutline((0.0, 0.0), radius, randomGenerator).astype(np.float64)
+    baseColor = objectColor(randomGenerator)
+    sceneCenter = np.array([frameWidth, frameHeight], np.float64) / 2
+    frameGenerator = np.random.default_rng(randomSeed + 1)
+
+    for i in range(totalFrames):
+        # Rotated and shifted outline:
+        rotationAngle = np.deg2rad(rotationStep * i)
+        rotationMatrix = np.array([[np.cos(rotationAngle), -np.sin(rotationAngle)],
+                                   [np.sin(rotationAngle), np.cos(rotationAngle)]])
+        frameCenter = sceneCenter + driftRadius * np.array([np.sin(0.05 * i), np.sin(0.03 * i)])
+        frameOutline = np.round(baseOutline @ rotationMatrix.T + frameCenter).astype(np.int32)
+
+        # Same background and textures every frame (same seed), new noise and gain:
+        sceneImage, labelImage = renderScene(frameWidth, frameHeight, [(frameOutline, baseColor)],
+                                             np.random.default_rng(randomSeed + 2))
+        sceneImage = sceneImage * frameGenerator.uniform(0.97, 1.03) + frameGenerator.normal(0, 2, sceneImage.shape)
+        yield np.clip(sceneImage, 0, 255).astype(np.uint8), labelImage
@@ -0,0 +1,92 @@
+# File        :   benchmarkCorners.py (Corner Fitting Benchmark)
+# Version     :   1.0.0
+# Description :   Compares the hull raster + good features to track corners (main.py)
+#                 against the direct quadrilateral fit from the hull points, on
+#                 synthetic pages at two frame sizes. Also compares warpPerspective
+#                 against the cached remap tables for the page rectification.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from pageDetector import findPageContour, hullCornersRaster, hullCornersDirect, orderCorners, detectPageCorners, \
+    rectifyPage
+from syntheticVideo import generateVideo
+
+# Frame sizes (width, height) and frames per size:
+frameSizes = [(960, 720), (2880, 2160)]
+totalFrames = 40
+
+print("%-11s | %-7s | %12s | %13s | %11s | %10s | %6s" % ("frame", "method", "corners (ms)", "detection (ms)",
+                                                            "err mean px", "err max px", "failed"))
+
+for frameWidth, frameHeight in frameSizes:
+    videoFrames = [(cv2.cvtColor(inputFrame, cv2.COLOR_BGR2GRAY), trueCorners) for inputFrame, trueCorners in
+                   generateVideo(totalFrames, frameWidth, frameHeight, jumpInterval=10)]
+    # Scale the min area with the frame:
+    minArea = 100000 * (frameWidth * frameHeight) / (960 * 720)
+
+    # The page hulls (shared by both methods):
+    pageHulls = []
+    for grayFrame, _ in videoFrames:
+        pageContour = findPageContour(grayFrame, minArea)
+        pageHulls.append(None if pageContour is None else cv2.convexHull(pageContour))
+
+    for methodName in ["Raster", "Direct"]:
+        cornerTimes, detectionTimes, cornerErrors = [], [], []
+        failedFrames = 0
+
+        for (grayFrame, trueCorners), hull in zip(videoFrames, pageHulls):
+            if hull is None:
+                failedFrames += 1
+                continue
+
+            # Corner stage only:
+            startTime = time.perf_counter()
+            if methodName == "Raster":
+                corners = hullCornersRaster(hull, grayFrame.shape)
+            else:
+                corners = hullCornersDirect(hull)
+            cornerTimes.append(time.perf_counter() - startTime)
+
+            # Whole detection:
+            startTime = time.perf_counter()
+            detectPageCorners(grayFrame, minArea, cornerMethod=methodName)
+            detectionTimes.append(time.perf_counter() - startTime)
+
+            if corners is None:
+                failedFrames += 1
+                continue
+            cornerErrors.append(np.linalg.norm(orderCorners(corners) - trueCorners, axis=1).max())
+
+        print("%-11s | %-7s | %12.2f | %13.2f | %11.2f | %10.2f | %6d" % (
+            "%dx%d" % (frameWidth, frameHeight), methodName, 1e3 * np.mean(cornerTimes), 1e3 * np.mean(detectionTimes),
+            np.mean(cornerErrors), np.max(cornerErrors), failedFrames))
+
+# Rectification of a steady page: warpPerspective every frame against
+# cached remap tables (built once):
+print("\n%-11s | %-16s | %10s | %9s" % ("frame", "warp", "time (ms)", "max diff"))
+
+for frameWidth, frameHeight in frameSizes:
+    inputFrame, trueCorners = next(generateVideo(1, frameWidth, frameHeight))
+    warpCache = {}
+
+    warpTimes = {"warpPerspective": [], "cached remap": []}
+    for _ in range(20):
+        startTime = time.perf_counter()
+        warpedReference = rectifyPage(inputFrame, trueCorners)
+        warpTimes["warpPerspective"].append(time.perf_counter() - startTime)
+
+        startTime = time.perf_counter()
+        warpedCached = rectifyPage(inputFrame, trueCorners, warpCache=warpCache)
+        warpTimes["cached remap"].append(time.perf_counter() - startTime)
+
+    maxDifference = np.abs(warpedReference.astype(np.int16) - warpedCached).max()
+    for warpName, times in warpTimes.items():
+        print("%-11s | %-16s | %10.2f | %9d" % ("%dx%d" % (frameWidth, frameHeight), warpName,
+                                                1e3 * np.median(times), maxDifference))
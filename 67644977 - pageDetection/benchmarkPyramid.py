@@ -0,0 +1,60 @@
+# File        :   benchmarkPyramid.py (Pyramid Detection Benchmark)
+# Version     :   1.0.1
+# Description :   Latency and corner error of the coarse-to-fine detection for each
+#                 pyramid level (detection at 1 / 2^level), with and without the
+#                 full resolution cornerSubPix refinement, on synthetic pages.
+#                 With refinement, levels above maxRefineLevel start at it (the
+#                 start column).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from pageDetector import detectPageCornersPyramid, maxRefineLevel
+from syntheticVideo import generateVideo
+
+# Frame sizes (width, height), frames per size and pyramid levels:
+frameSizes = [(960, 720), (2880, 2160)]
+totalFrames = 30
+pyramidLevels = [0, 1, 2, 3, 4]
+
+print("%-11s | %5s | %5s | %6s | %8s | %8s | %11s | %10s | %6s" % ("frame", "level", "start", "refine", "ms mean",
+                                                                   "ms p99", "err mean px", "err max px", "failed"))
+
+for frameWidth, frameHeight in frameSizes:
+    videoFrames = [(cv2.cvtColor(inputFrame, cv2.COLOR_BGR2GRAY), trueCorners) for inputFrame, trueCorners in
+                   generateVideo(totalFrames, frameWidth, frameHeight, jumpInterval=5)]
+    # Scale the min area with the frame:
+    minArea = 100000 * (frameWidth * frameHeight) / (960 * 720)
+
+    for pyramidLevel in pyramidLevels:
+        for refineCorners in [False, True]:
+            # Level 0 is already at full resolution:
+            if pyramidLevel == 0 and refineCorners:
+                continue
+
+            frameTimes, cornerErrors = [], []
+            failedFrames = 0
+            for grayFrame, trueCorners in videoFrames:
+                startTime = time.perf_counter()
+                corners = detectPageCornersPyramid(grayFrame, pyramidLevel, minArea, refineCorners=refineCorners)
+                frameTimes.append(time.perf_counter() - startTime)
+
+                if corners is None:
+                    failedFrames += 1
+                else:
+                    cornerErrors.append(np.linalg.norm(corners - trueCorners, axis=1).max())
+
+            frameTimes = 1e3 * np.array(frameTimes)
+            cornerErrors = np.array(cornerErrors) if cornerErrors else np.array([np.nan])
+            startLevel = pyramidLevel
+            if refineCorners:
+                startLevel = min(pyramidLevel, maxRefineLevel((frameHeight, frameWidth)))
+            print("%-11s | %5d | %5d | %6s | %8.2f | %8.2f | %11.2f | %10.2f | %6d" % (
+                "%dx%d" % (frameWidth, frameHeight), pyramidLevel, startLevel, refineCorners, frameTimes.mean(),
+                np.percentile(frameTimes, 99), cornerErrors.mean(), cornerErrors.max(), failedFrames))
@@ -0,0 +1,81 @@
+# File        :   benchmarkVideo.py (Page Tracking Benchmark)
+# Version     :   1.1.0
+# Description :   Runs full detection on every frame against the tracking mode of
+#                 pageTracker.py on synthetic moving page videos of several frame
+#                 sizes. Reports fps, how often each mode was used, the corner
+#                 error against the ground truth and the jitter (frame to frame
+#                 change of that error).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from pageDetector import detectPageCorners
+from pageTracker import createTracker, trackPage
+from syntheticVideo import generateVideo
+
+# Videos: smooth motion and motion with abrupt jumps every 50 frames, per
+# frame size (width, height):
+videoSettings = [("smooth", 0), ("jumps", 50)]
+frameSizes = [(960, 720), (1920, 1080)]
+totalFrames = 300
+
+print("%-9s | %-7s | %-9s | %7s | %7s | %8s | %5s | %5s | %5s | %5s | %11s | %10s | %9s" % (
+    "frame", "video", "method", "fps", "ms p50", "ms p99", "track", "roi", "full", "lost", "err mean px",
+    "err max px", "jitter px"))
+
+for frameWidth, frameHeight in frameSizes:
+    # Scale the min area with the frame:
+    minArea = 100000 * (frameWidth * frameHeight) / (960 * 720)
+
+    for videoName, jumpInterval in videoSettings:
+        # Pre-render the frames so only the detection is timed:
+        videoFrames = list(generateVideo(totalFrames, frameWidth, frameHeight, jumpInterval=jumpInterval))
+
+        for methodName in ["detect", "track"]:
+            tracker = createTracker(minArea)
+            frameTimes = []
+            cornerErrors = []
+            cornerJitter = []
+            previousError = None
+            lostFrames = 0
+
+            for inputFrame, trueCorners in videoFrames:
+                startTime = time.perf_counter()
+                if methodName == "detect":
+                    grayFrame = cv2.cvtColor(inputFrame, cv2.COLOR_BGR2GRAY)
+                    corners = detectPageCorners(grayFrame, minArea)
+                else:
+                    corners, _ = trackPage(tracker, inputFrame)
+                frameTimes.append(time.perf_counter() - startTime)
+
+                if corners is None:
+                    lostFrames += 1
+                    previousError = None
+                    continue
+                cornerError = corners - trueCorners
+                cornerErrors.append(np.linalg.norm(cornerError, axis=1).max())
+                # Jitter: how much the error moves between consecutive frames:
+                if previousError is not None:
+                    cornerJitter.append(np.linalg.norm(cornerError - previousError, axis=1).mean())
+                previousError = cornerError
+
+            frameTimes = 1e3 * np.array(frameTimes)
+            cornerErrors = np.array(cornerErrors) if cornerErrors else np.array([np.nan])
+            cornerJitter = np.array(cornerJitter) if cornerJitter else np.array([np.nan])
+
+            if methodName == "detect":
+                modeCounts = (0, 0, len(videoFrames) - lostFrames, lostFrames)
+            else:
+                stats = tracker["Stats"]
+                modeCounts = (stats["Tracked"], stats["Roi"], stats["Full"], stats["Lost"])
+
+            print("%-9s | %-7s | %-9s | %7.1f | %7.2f | %8.2f | %5d | %5d | %5d | %5d | %11.2f | %10.2f | %9.2f" % (
+                "%dx%d" % (frameWidth, frameHeight), videoName, methodName, 1e3 / frameTimes.mean(),
+                np.percentile(frameTimes, 50), np.percentile(frameTimes, 99), *modeCounts, cornerErrors.mean(),
+                cornerErrors.max(), cornerJitter.mean()))
@@ -0,0 +1,80 @@
+# File        :   mainVideo.py (Page Corner Tracking on Video)
+# Version     :   1.1.1
+# Description :   Frame-stream version of main.py. The page corners are tracked
+#                 between frames and only detected again (first in a ROI around
+#                 the last corners, then in the full frame) when tracking fails.
+#                 Reads a camera, a video file or the synthetic moving page video.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+# imports:
+import time
+
+import cv2
+import numpy as np
+
+from pageDetector import rectifyPage
+from pageTracker import createTracker, trackPage
+from syntheticVideo import generateVideo
+
+# Video source: camera index, video file path or "Synthetic":
+videoSource = 0
+
+# Show the rectified page. warpPerspective by default; a dict reuses the
+# warp maps while the page is steady (only faster for small pages):
+showRectified = True
+warpCache = None
+
+# Colors per frame mode:
+modeColors = {"Tracked": (0, 255, 0), "Roi": (0, 255, 255), "Full": (0, 0, 255), "Lost": (128, 128, 128)}
+
+
+# Yields frames from the video source:
+def readFrames(videoSource):
+    if videoSource == "Synthetic":
+        for inputFrame, _ in generateVideo():
+            yield inputFrame
+        return
+
+    videoCapture = cv2.VideoCapture(videoSource)
+    while True:
+        frameRead, inputFrame = videoCapture.read()
+        if not frameRead:
+            break
+        yield inputFrame
+    videoCapture.release()
+
+
+# Set the tracker:
+tracker = createTracker(minArea=100000)
+
+cv2.namedWindow("corners", flags=cv2.WINDOW_GUI_NORMAL)
+
+for inputFrame in readFrames(videoSource):
+    startTime = time.perf_counter()
+    corners, frameMode = trackPage(tracker, inputFrame)
+    frameTime = time.perf_counter() - startTime
+
+    # (Optional) Show the rectified page:
+    if showRectified and corners is not None:
+        cv2.imshow("rectified", rectifyPage(inputFrame, corners, warpCache=warpCache))
+
+    # (Optional) Draw the page and its corners:
+    if corners is not None:
+        cornerPoints = np.round(corners).astype(np.int32)
+        cv2.polylines(inputFrame, [cornerPoints], True, modeColors[frameMode], 2)
+        for (x, y) in cornerPoints:
+            cv2.circle(inputFrame, (int(x), int(y)), 5, 255, 5)
+
+    cv2.putText(inputFrame, "%s %.1f ms" % (frameMode, 1e3 * frameTime), (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1,
+                modeColors[frameMode], 2)
+    cv2.imshow("corners", inputFrame)
+
+    # Quit with Esc:
+    if cv2.waitKey(1) == 27:
+        break
+
+cv2.destroyAllWindows()
+print(tracker["Stats"])
@@ -0,0 +1,283 @@
+# File        :   pageDetector.py (Page Corner Detection)
+# Version     :   1.2.3
+# Description :   The corner detection of main.py as reusable functions: Otsu,
+#                 Canny, external contours, convex hull raster and good features
+#                 to track. Detection can be restricted to a region of interest.
+#                 Corners are returned as a (4, 2) float32 array, ordered as
+#                 top-left, top-right, bottom-right, bottom-left. The corners can
+#                 also be fitted directly from the hull points, and the page can be
+#                 rectified with cached perspective maps. A coarse-to-fine mode
+#                 detects on a reduced image and refines at full resolution.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Orders 4 corners clockwise (image coordinates), starting at the
+# top-left one (smallest x + y):
+def orderCorners(cornerPoints):
+    cornerPoints = np.asarray(cornerPoints, np.float32).reshape(4, 2)
+    # Sort by angle around the centroid:
+    centroid = cornerPoints.mean(axis=0)
+    angles = np.arctan2(cornerPoints[:, 1] - centroid[1], cornerPoints[:, 0] - centroid[0])
+    cornerPoints = cornerPoints[np.argsort(angles)]
+    # Start at the top-left corner:
+    startIndex = np.argmin(cornerPoints.sum(axis=1))
+    return np.roll(cornerPoints, -startIndex, axis=0)
+
+
+# Finds the external contour with the largest bounding rectangle
+# (above minArea) in a grayscale image:
+def findPageContour(grayImage, minArea=100000):
+    # Threshold via Otsu:
+    _, binaryImage = cv2.threshold(grayImage, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    # Get edges:
+    cannyImage = cv2.Canny(binaryImage, threshold1=120, threshold2=255)
+
+    # Find the EXTERNAL contours on the binary image:
+    contours, _ = cv2.findContours(cannyImage, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    # Keep the largest bounding rect above the min area:
+    pageContour = None
+    largestArea = minArea
+    for c in contours:
+        # Approximate the contour to a polygon, get its bounding rect:
+        contoursPoly = cv2.approxPolyDP(c, 3, True)
+        _, _, rectWidth, rectHeight = cv2.boundingRect(contoursPoly)
+        rectArea = rectWidth * rectHeight
+        if rectArea > largestArea:
+            largestArea = rectArea
+            pageContour = c
+
+    return pageContour
+
+
+# Gets the 4 corners of a convex hull by drawing it and running
+# good features to track on the raster (original method):
+def hullCornersRaster(hull, imageShape):
+    # Black image same size as the input, draw the hull:
+    (height, width) = imageShape[:2]
+    hullImg = np.zeros((height, width), dtype=np.uint8)
+    cv2.drawContours(hullImg, [hull], 0, 255, 2)
+
+    # Set the corner detection:
+    maxCorners = 4
+    qualityLevel = 0.01
+    minDistance = int(max(height, width) / maxCorners)
+
+    # Get the corners:
+    corners = cv2.goodFeaturesToTrack(hullImg, maxCorners, qualityLevel, minDistance)
+    if corners is None or len(corners) < 4:
+        return None
+    return corners.reshape(4, 2)
+
+
+# Gets the 4 corners of a convex hull directly from its points: the
+# polygon is simplified with a growing tolerance until 4 vertices are
+# left. If no tolerance gives exactly 4, the min area rectangle is used.
+# Hulls that are already triangles (broken outlines) are rejected:
+def hullCornersDirect(hull, minEpsilon=0.005, maxEpsilon=0.1, maxSteps=12):
+    hullPerimeter = cv2.arcLength(hull, True)
+    if len(hull) < 4 or hullPerimeter == 0:
+        return None
+    if len(cv2.approxPolyDP(hull, minEpsilon * hullPerimeter, True)) < 4:
+        return None
+
+    # Bisection on the tolerance (fraction of the perimeter), the vertex
+    # count decreases as the tolerance grows:
+    lowEpsilon, highEpsilon = minEpsilon, maxEpsilon
+    for _ in range(maxSteps):
+        epsilon = 0.5 * (lowEpsilon + highEpsilon)
+        hullPoly = cv2.approxPolyDP(hull, epsilon * hullPerimeter, True)
+        if len(hullPoly) == 4:
+            return hullPoly.reshape(4, 2).astype(np.float32)
+        if len(hullPoly) > 4:
+            lowEpsilon = epsilon
+        else:
+            highEpsilon = epsilon
+
+    return cv2.boxPoints(cv2.minAreaRect(hull))
+
+
+# Detects the page corners in a grayscale image, optionally inside
+# roiRect = (x, y, w, h) only. The corners are taken from the hull raster
+# ("Raster", original method) or directly from the hull ("Direct").
+# Returns ordered (4, 2) corners or None:
+def detectPageCorners(grayImage, minArea=100000, roiRect=None, cornerMethod="Direct"):
+    # Crop the region of interest:
+    offset = np.zeros(2, np.float32)
+    if roiRect is not None:
+        x, y, w, h = roiRect
+        grayImage = grayImage[y:y + h, x:x + w]
+        offset[:] = (x, y)
+
+    # Get the page contour and its convex hull:
+    pageContour = findPageContour(grayImage, minArea)
+    if pageContour is None:
+        return None
+    hull = cv2.convexHull(pageContour)
+
+    # Get the corners:
+    if cornerMethod == "Raster":
+        corners = hullCornersRaster(hull, grayImage.shape)
+    else:
+        corners = hullCornersDirect(hull)
+    if corners is None:
+        return None
+
+    return orderCorners(corners + offset)
+
+
+# Max distance between the corners of two consecutive pyramid levels,
+# in pixels of the coarser one, to accept a coarse detection:
+pyramidTolerance = 2.0
+
+# Max half size of the cornerSubPix window, as a fraction of the longest
+# image side. Larger windows reach the page text and pull the corners
+# onto it, levels that would need one start at a finer level:
+refineWindowFraction = 1 / 40
+
+
+# Max distance between matching corners of two ordered quadrilaterals:
+def cornersDistance(corners, otherCorners):
+    return np.linalg.norm(corners - otherCorners, axis=1).max()
+
+
+# Detects the page on one pyramid level (computed on demand from the
+# previous one), maps the corners back to full resolution. Detections are
+# kept in levelCorners (level: corners or None):
+def pyramidCorners(pyramidImages, level, minArea, cornerMethod, levelCorners):
+    if level not in levelCorners:
+        while len(pyramidImages) <= level:
+            pyramidImages.append(cv2.pyrDown(pyramidImages[-1]))
+
+        # Detect on the reduced image, the min area scales with it:
+        pyramidScale = 2 ** level
+        corners = detectPageCorners(pyramidImages[level], minArea / pyramidScale ** 2, cornerMethod=cornerMethod)
+        # Back to full resolution (pixel centers):
+        if corners is not None and level > 0:
+            corners = (corners + 0.5) * pyramidScale - 0.5
+        levelCorners[level] = corners
+
+    return levelCorners[level]
+
+
+# Deepest pyramid level whose first refinement window (3 * 2^level half
+# size) fits refineWindowFraction of the longest image side: 3 at 960x720,
+# 4 at 2880x2160:
+def maxRefineLevel(imageShape):
+    maxHalfWindow = refineWindowFraction * max(imageShape[:2])
+    return max(0, int(np.floor(np.log2(max(maxHalfWindow / 3, 1)))))
+
+
+# Coarse-to-fine detection: the page is detected on a reduced image
+# (1 / 2^pyramidLevel), the corners are mapped back to full resolution and
+# refined with cornerSubPix in small windows. With refineCorners, a
+# pyramidLevel above maxRefineLevel(image shape) starts at that level
+# instead (deeper windows reach the page text). A coarse detection
+# is only trusted if the next (coarser) level finds the same quadrilateral
+# and the refined corners stay inside their window; otherwise the next
+# finer level is tried, down to full resolution. Returns ordered corners
+# or None:
+def detectPageCornersPyramid(grayImage, pyramidLevel=3, minArea=100000, cornerMethod="Direct", refineCorners=True):
+    pyramidImages = [grayImage]
+    levelCorners = {}
+
+    # The first refinement window is 3 * 2^level, keep it under the cap:
+    if refineCorners:
+        pyramidLevel = min(pyramidLevel, maxRefineLevel(grayImage.shape))
+
+    refineCriteria = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 30, 0.01)
+    for level in range(pyramidLevel, 0, -1):
+        # Coarse detection (a broken outline may not give a quadrilateral):
+        corners = pyramidCorners(pyramidImages, level, minArea, cornerMethod, levelCorners)
+        if corners is None:
+            continue
+
+        # Check against the coarser level, the contour of a small image can
+        # merge with the background and still give 4 (wrong) corners:
+        pyramidScale = 2 ** level
+        checkCorners = pyramidCorners(pyramidImages, level + 1, minArea, cornerMethod, levelCorners)
+        if checkCorners is None or cornersDistance(corners, checkCorners) > 2 * pyramidTolerance * pyramidScale:
+            continue
+        if not refineCorners:
+            return corners
+
+        # Sub-pixel refinement. The first window covers the coarse error (the
+        # corner must be inside it), a second small one gets the final position:
+        refinedCorners = corners.reshape(-1, 1, 2).copy()
+        refineWindows = sorted({max(5, 3 * pyramidScale), 5}, reverse=True)
+        for halfWindow in refineWindows:
+            refinedCorners = cv2.cornerSubPix(grayImage, refinedCorners, (halfWindow, halfWindow), (-1, -1),
+                                              refineCriteria)
+        refinedCorners = refinedCorners.reshape(4, 2)
+
+        # A corner that left its first window (page text, shadows) is not trusted:
+        if cornersDistance(refinedCorners, corners) <= refineWindows[0]:
+            return refinedCorners
+
+    # Full resolution detection:
+    return pyramidCorners(pyramidImages, 0, minArea, cornerMethod, levelCorners)
+
+
+# Output size (width, height) of the rectified page: the longest of each
+# pair of opposite sides:
+def rectifiedSize(corners):
+    sideLengths = np.linalg.norm(corners - np.roll(corners, -1, axis=0), axis=1)
+    outputWidth = int(round(max(sideLengths[0], sideLengths[2])))
+    outputHeight = int(round(max(sideLengths[1], sideLengths[3])))
+    return outputWidth, outputHeight
+
+
+# Builds the remap tables of the perspective warp: every output pixel is
+# mapped back to its input position via the inverse homography:
+def perspectiveMaps(corners, outputSize):
+    outputWidth, outputHeight = outputSize
+    outputRect = np.array([[0, 0], [outputWidth - 1, 0], [outputWidth - 1, outputHeight - 1],
+                           [0, outputHeight - 1]], np.float32)
+    # Output -> input homography:
+    h = cv2.getPerspectiveTransform(outputRect, corners.astype(np.float32))
+
+    # Project the output grid:
+    x = np.arange(outputWidth, dtype=np.float64)[np.newaxis, :]
+    y = np.arange(outputHeight, dtype=np.float64)[:, np.newaxis]
+    w = 1.0 / (h[2, 0] * x + h[2, 1] * y + h[2, 2])
+    mapX = ((h[0, 0] * x + h[0, 1] * y + h[0, 2]) * w).astype(np.float32)
+    mapY = ((h[1, 0] * x + h[1, 1] * y + h[1, 2]) * w).astype(np.float32)
+
+    # Fixed point maps, faster to remap:
+    return cv2.convertMaps(mapX, mapY, cv2.CV_16SC2)
+
+
+# Rectifies the page via warpPerspective. If a warpCache dict is given, the
+# remap tables are kept and reused while the corners move less than
+# cacheTolerance pixels (steady camera). The tables only pay off for small
+# pages: from ~1 MP of output, reading them costs more than warpPerspective
+# computing the coordinates (benchmarkCorners.py, 2880x2160: 19 vs 16 ms):
+def rectifyPage(inputImage, corners, outputSize=None, warpCache=None, cacheTolerance=0.5):
+    if outputSize is None:
+        outputSize = rectifiedSize(corners)
+
+    if warpCache is None:
+        outputWidth, outputHeight = outputSize
+        outputRect = np.array([[0, 0], [outputWidth - 1, 0], [outputWidth - 1, outputHeight - 1],
+                               [0, outputHeight - 1]], np.float32)
+        h = cv2.getPerspectiveTransform(corners.astype(np.float32), outputRect)
+        return cv2.warpPerspective(inputImage, h, outputSize)
+
+    # Rebuild the maps only if the corners (or the size) changed:
+    cachedCorners = warpCache.get("Corners")
+    if cachedCorners is None or warpCache["Size"] != outputSize or \
+            np.abs(cachedCorners - corners).max() > cacheTolerance:
+        warpCache["Maps"] = perspectiveMaps(corners, outputSize)
+        warpCache["Corners"] = corners.copy()
+        warpCache["Size"] = outputSize
+        warpCache["Builds"] = warpCache.get("Builds", 0) + 1
+
+    mapXY, mapInterpolation = warpCache["Maps"]
+    return cv2.remap(inputImage, mapXY, mapInterpolation, cv2.INTER_LINEAR)
@@ -0,0 +1,196 @@
+# File        :   pageTracker.py (Page Corner Tracking)
+# Version     :   1.3.0
+# Description :   Frame-stream mode for the page corner detection. The corners of
+#                 the previous frame are tracked via pyramidal Lucas-Kanade with a
+#                 forward-backward check, on small patches around the corners only
+#                 (the full frame is not converted nor pyramided while tracking).
+#                 If tracking fails, the page is detected again inside a ROI
+#                 around the previous corners and only then in the full frame.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+from pageDetector import detectPageCorners, detectPageCornersPyramid
+
+# Lucas-Kanade settings:
+lkParams = {"winSize": (21, 21), "maxLevel": 3,
+            "criteria": (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03)}
+
+# Side of the square patch tracked around each corner (odd, so the patches
+# are exact crops). It covers the LK window at the top pyramid level:
+lkPatchSize = 257
+
+
+# Creates the tracker state dictionary:
+def createTracker(minArea=100000, roiMargin=0.15, maxBackError=1.5, maxAreaChange=0.2, refreshInterval=60,
+                  cornerMethod="Direct", pyramidLevel=0):
+    trackerParams = {"MinArea": minArea,  # Min page bounding rect area (detection)
+                     "RoiMargin": roiMargin,  # ROI margin, fraction of the page size
+                     "MaxBackError": maxBackError,  # Max forward-backward tracking error (px)
+                     "MaxAreaChange": maxAreaChange,  # Max relative change of the page area per frame
+                     "RefreshInterval": refreshInterval,  # Re-detect in the ROI every N tracked frames (0: never)
+                     "CornerMethod": cornerMethod,  # Detection corners: "Direct" or "Raster"
+                     "PyramidLevel": pyramidLevel}  # Full frame detection at 1 / 2^level (0: full resolution)
+
+    stats = {"Frames": 0, "Tracked": 0, "Roi": 0, "Full": 0, "Lost": 0}
+
+    return {"Params": trackerParams, "PreviousPatches": None, "PatchCenters": None, "Corners": None,
+            "TrackedFrames": 0, "Stats": stats}
+
+
+# Area of a quadrilateral (shoelace):
+def quadArea(corners):
+    x, y = corners[:, 0], corners[:, 1]
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+# Checks that a quadrilateral is convex and its area is close to the
+# area of the reference one:
+def isSimilarQuad(corners, referenceCorners, maxAreaChange):
+    if not cv2.isContourConvex(corners.reshape(-1, 1, 2)):
+        return False
+    areaChange = abs(quadArea(corners) / max(quadArea(referenceCorners), 1.0) - 1.0)
+    return areaChange <= maxAreaChange
+
+
+# Grayscale version of a BGR or grayscale frame:
+def grayFrame(inputFrame):
+    return inputFrame if inputFrame.ndim == 2 else cv2.cvtColor(inputFrame, cv2.COLOR_BGR2GRAY)
+
+
+# Crops a patch around each of the (integer) centers, side by side in one
+# grayscale image. Parts outside the frame replicate its border:
+def cornerPatches(inputFrame, patchCenters):
+    frameHeight, frameWidth = inputFrame.shape[:2]
+    halfSize = lkPatchSize // 2
+    patchImages = []
+    for x, y in patchCenters.astype(np.int64):
+        x1, y1, x2, y2 = x - halfSize, y - halfSize, x + halfSize + 1, y + halfSize + 1
+        patchImage = inputFrame[max(0, y1):max(0, min(frameHeight, y2)), max(0, x1):max(0, min(frameWidth, x2))]
+        if patchImage.shape[0] < lkPatchSize or patchImage.shape[1] < lkPatchSize:
+            if patchImage.size == 0:
+                # Corner far outside the frame, nothing to track:
+                patchImage = np.zeros((lkPatchSize, lkPatchSize) + inputFrame.shape[2:], inputFrame.dtype)
+            else:
+                patchImage = cv2.copyMakeBorder(patchImage, max(0, -y1), max(0, y2 - frameHeight), max(0, -x1),
+                                                max(0, x2 - frameWidth), cv2.BORDER_REPLICATE)
+        patchImages.append(patchImage)
+    return grayFrame(np.hstack(patchImages))
+
+
+# Position of each patch center in the side by side patches:
+patchOffsets = np.stack([lkPatchSize * np.arange(4) + lkPatchSize // 2, np.full(4, lkPatchSize // 2)],
+                        axis=1).astype(np.float32)
+
+
+# Tracks the corners from the previous frame (its patches around
+# patchCenters) into the current one, returns the new corners or None if
+# the track is not reliable:
+def trackCorners(previousPatches, patchCenters, currentFrame, previousCorners, trackerParams):
+    currentPatches = cornerPatches(currentFrame, patchCenters)
+    previousPoints = (previousCorners - patchCenters + patchOffsets).reshape(-1, 1, 2).astype(np.float32)
+
+    # Forward and backward tracking:
+    currentPoints, forwardStatus, _ = cv2.calcOpticalFlowPyrLK(previousPatches, currentPatches, previousPoints, None,
+                                                               **lkParams)
+    backPoints, backStatus, _ = cv2.calcOpticalFlowPyrLK(currentPatches, previousPatches, currentPoints, None,
+                                                         **lkParams)
+
+    # Every corner must be found both ways, and come back to where it started:
+    if not (forwardStatus.all() and backStatus.all()):
+        return None
+    backError = np.linalg.norm((backPoints - previousPoints).reshape(-1, 2), axis=1)
+    if backError.max() > trackerParams["MaxBackError"]:
+        return None
+
+    # Each corner must stay inside its own patch:
+    patchMotion = currentPoints.reshape(4, 2) - patchOffsets
+    if np.abs(patchMotion).max() >= lkPatchSize // 2:
+        return None
+
+    # The result must still look like the page:
+    currentCorners = patchMotion + patchCenters
+    if not isSimilarQuad(currentCorners, previousCorners, trackerParams["MaxAreaChange"]):
+        return None
+
+    return currentCorners
+
+
+# Bounding rect of the corners, grown by a margin and clipped to the image:
+def cornersRoi(corners, imageShape, roiMargin):
+    imageHeight, imageWidth = imageShape[:2]
+    x, y, w, h = cv2.boundingRect(corners.reshape(-1, 1, 2).astype(np.float32))
+    marginX, marginY = int(roiMargin * w), int(roiMargin * h)
+    x1, y1 = max(0, x - marginX), max(0, y - marginY)
+    x2, y2 = min(imageWidth, x + w + marginX), min(imageHeight, y + h + marginY)
+    return x1, y1, x2 - x1, y2 - y1
+
+
+# Checks if any corner lies on an edge of the ROI inside the image (the
+# page was cut by the ROI, the real corner is outside it):
+def touchesRoiEdge(corners, roiRect, imageShape, edgeMargin=2.0):
+    imageHeight, imageWidth = imageShape[:2]
+    roiX, roiY, roiWidth, roiHeight = roiRect
+    x, y = corners[:, 0], corners[:, 1]
+    roiX1, roiY1, roiX2, roiY2 = roiX, roiY, roiX + roiWidth - 1, roiY + roiHeight - 1
+    cutLeft = (roiX1 > 0) & (x - roiX1 < edgeMargin)
+    cutTop = (roiY1 > 0) & (y - roiY1 < edgeMargin)
+    cutRight = (roiX2 < imageWidth - 1) & (roiX2 - x < edgeMargin)
+    cutBottom = (roiY2 < imageHeight - 1) & (roiY2 - y < edgeMargin)
+    return bool((cutLeft | cutTop | cutRight | cutBottom).any())
+
+
+# Processes one frame (BGR or grayscale). Returns the page corners (or None)
+# and how they were obtained: "Tracked", "Roi", "Full" or "Lost":
+def trackPage(tracker, inputFrame):
+    trackerParams = tracker["Params"]
+    previousCorners = tracker["Corners"]
+
+    # Only the detection needs the full grayscale frame:
+    currentGray = None
+    corners = None
+    frameMode = "Lost"
+
+    if previousCorners is not None:
+        # Track the corners, unless it's time for a refresh:
+        refreshInterval = trackerParams["RefreshInterval"]
+        if refreshInterval <= 0 or tracker["TrackedFrames"] < refreshInterval:
+            corners = trackCorners(tracker["PreviousPatches"], tracker["PatchCenters"], inputFrame, previousCorners,
+                                   trackerParams)
+            frameMode = "Tracked"
+
+        # Detect inside the previous page region:
+        if corners is None:
+            currentGray = grayFrame(inputFrame)
+            roiRect = cornersRoi(previousCorners, currentGray.shape, trackerParams["RoiMargin"])
+            corners = detectPageCorners(currentGray, trackerParams["MinArea"], roiRect,
+                                        trackerParams["CornerMethod"])
+            frameMode = "Roi"
+            # A partial page (cut by the ROI) is discarded:
+            if corners is not None and (touchesRoiEdge(corners, roiRect, currentGray.shape) or
+                                        not isSimilarQuad(corners, previousCorners, trackerParams["MaxAreaChange"])):
+                corners = None
+
+    # Last resort, full frame detection:
+    if corners is None:
+        if currentGray is None:
+            currentGray = grayFrame(inputFrame)
+        corners = detectPageCornersPyramid(currentGray, trackerParams["PyramidLevel"], trackerParams["MinArea"],
+                                           trackerParams["CornerMethod"])
+        frameMode = "Full" if corners is not None else "Lost"
+
+    # Update the state:
+    tracker["TrackedFrames"] = tracker["TrackedFrames"] + 1 if frameMode == "Tracked" else 0
+    tracker["Corners"] = corners
+    # Patches around the new corners, tracked in the next frame:
+    if corners is not None:
+        tracker["PatchCenters"] = np.round(corners).astype(np.float32)
+        tracker["PreviousPatches"] = cornerPatches(inputFrame, tracker["PatchCenters"])
+    tracker["Stats"]["Frames"] += 1
+    tracker["Stats"][frameMode] += 1
+
+    return corners, frameMode
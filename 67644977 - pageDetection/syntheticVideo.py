@@ -0,0 +1,89 @@
+# File        :   syntheticVideo.py (Synthetic Moving Page Video)
+# Version     :   1.0.0
+# Description :   Generates frames of a textured page moving over a darker,
+#                 unevenly lit background, together with the ground truth page
+#                 corners (top-left, top-right, bottom-right, bottom-left).
+#                 Optional abrupt jumps simulate fast camera motion.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Creates a white page with gray "text" lines:
+def makePage(pageWidth, pageHeight, randomGenerator):
+    pageImage = np.full((pageHeight, pageWidth), 235, np.uint8)
+    margin = pageWidth // 10
+    lineHeight = max(4, pageHeight // 60)
+    for y in range(margin, pageHeight - margin, 2 * lineHeight):
+        lineEnd = int(randomGenerator.uniform(0.5, 1.0) * (pageWidth - 2 * margin)) + margin
+        cv2.rectangle(pageImage, (margin, y), (lineEnd, y + lineHeight), 90, -1)
+    return pageImage
+
+
+# Creates the unevenly lit background:
+def makeBackground(frameWidth, frameHeight, randomGenerator):
+    gradientX = np.linspace(0.6, 1.0, frameWidth, dtype=np.float32)
+    gradientY = np.linspace(1.0, 0.7, frameHeight, dtype=np.float32)
+    backgroundImage = 70 * np.outer(gradientY, gradientX)
+    backgroundImage += randomGenerator.normal(0, 4, backgroundImage.shape).astype(np.float32)
+    return np.clip(backgroundImage, 0, 255).astype(np.uint8)
+
+
+# Page corners at time t: smooth translation, rotation, scale and a
+# little perspective tilt around the frame center:
+def pageCorners(t, frameWidth, frameHeight, pageWidth, pageHeight, jumpOffset):
+    centerX = 0.5 * frameWidth + 0.12 * frameWidth * np.sin(0.031 * t) + jumpOffset[0]
+    centerY = 0.5 * frameHeight + 0.03 * frameHeight * np.sin(0.023 * t + 1.0) + jumpOffset[1]
+    angle = 0.1 * np.sin(0.017 * t)
+    scale = 1.0 + 0.05 * np.sin(0.011 * t)
+    tilt = 0.06 * np.sin(0.013 * t)
+
+    # Centered page rectangle, with the tilt pulling the top edge in:
+    halfWidth, halfHeight = 0.5 * scale * pageWidth, 0.5 * scale * pageHeight
+    corners = np.array([[-halfWidth * (1 - tilt), -halfHeight], [halfWidth * (1 - tilt), -halfHeight],
+                        [halfWidth * (1 + tilt), halfHeight], [-halfWidth * (1 + tilt), halfHeight]])
+
+    rotationMatrix = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    return (corners @ rotationMatrix.T + (centerX, centerY)).astype(np.float32)
+
+
+# Generator of (frame, groundTruthCorners). Frames are 3-channel BGR.
+# Every jumpInterval frames (0: never) the page jumps to a new offset.
+# The page always stays inside the frame:
+def generateVideo(totalFrames=300, frameWidth=960, frameHeight=720, jumpInterval=0, noiseSigma=3.0, randomSeed=7):
+    randomGenerator = np.random.default_rng(randomSeed)
+
+    pageHeight = int(0.7 * frameHeight)
+    pageWidth = int(pageHeight / 1.41)
+    pageImage = makePage(pageWidth, pageHeight, randomGenerator)
+    backgroundImage = makeBackground(frameWidth, frameHeight, randomGenerator)
+
+    pageRect = np.array([[0, 0], [pageWidth - 1, 0], [pageWidth - 1, pageHeight - 1], [0, pageHeight - 1]],
+                        np.float32)
+    pageMask = np.full((pageHeight, pageWidth), 255, np.uint8)
+
+    jumpOffset = np.zeros(2)
+    frameImage = np.empty((frameHeight, frameWidth), np.uint8)
+
+    for t in range(totalFrames):
+        if jumpInterval > 0 and t > 0 and t % jumpInterval == 0:
+            jumpOffset = randomGenerator.uniform(-1, 1, 2) * (0.1 * frameWidth, 0.04 * frameHeight)
+
+        corners = pageCorners(t, frameWidth, frameHeight, pageWidth, pageHeight, jumpOffset)
+        homography = cv2.getPerspectiveTransform(pageRect, corners)
+
+        # Warp the page and its mask, paste over the background:
+        warpedPage = cv2.warpPerspective(pageImage, homography, (frameWidth, frameHeight))
+        warpedMask = cv2.warpPerspective(pageMask, homography, (frameWidth, frameHeight))
+        np.copyto(frameImage, backgroundImage)
+        cv2.copyTo(warpedPage, warpedMask, frameImage)
+
+        # Sensor noise:
+        noise = randomGenerator.normal(0, noiseSigma, frameImage.shape).astype(np.int16)
+        noisyFrame = np.clip(frameImage + noise, 0, 255).astype(np.uint8)
+
+        yield cv2.cvtColor(noisyFrame, cv2.COLOR_GRAY2BGR), corners
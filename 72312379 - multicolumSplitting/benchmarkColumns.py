@@ -0,0 +1,96 @@
+# File        :   benchmarkColumns.py (Column Detector Benchmark)
+# Version     :   1.0.0
+# Description :   Throughput and accuracy of the banded projection profile column
+#                 detector against the middle ROI method of main.py, on synthetic
+#                 2 to 6 column pages (with figures crossing a gutter) at 300 and
+#                 600 dpi.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from columnDetector import detectColumns, inkIntegral
+from syntheticPages import makePage
+
+
+# The column detection of main.py (middle ROI, 10% high), without the
+# windows. After the flood fill, the transitions are the gutter edges;
+# the outer column edges are the first and last ink columns of the ROI:
+def legacyColumns(binaryImage):
+    (imageHeight, imageWidth) = binaryImage.shape[:2]
+    roiHeight = int(0.1 * imageHeight)
+    roiY = int(0.5 * imageHeight - 0.5 * roiHeight)
+    middleRoi = binaryImage[roiY:roiY + roiHeight, 0:imageWidth].copy()
+
+    rectangleThickness = int(0.01 * imageHeight)
+    cv2.rectangle(middleRoi, (0, 0), (imageWidth, roiHeight), 255, rectangleThickness)
+    reducedImage = cv2.reduce(middleRoi, 0, cv2.REDUCE_MIN)
+    inkColumns = np.flatnonzero(reducedImage[0] == 0)
+    if len(inkColumns) == 0:
+        return np.zeros((0, 2), np.int64)
+
+    for x in [0, imageWidth - 1]:
+        cv2.floodFill(reducedImage, None, (x, 0), 0)
+
+    kernel = np.ones((3, 3), np.uint8)
+    reducedImage = cv2.morphologyEx(reducedImage, cv2.MORPH_CLOSE, kernel, iterations=2)
+    whiteSpaces = np.where(np.diff(reducedImage, prepend=np.nan))[1]
+
+    # The first transition is always x = 0 (prepended nan):
+    whiteSpaces = whiteSpaces[1:]
+    if len(whiteSpaces) % 2 == 1:
+        return np.zeros((0, 2), np.int64)
+    columnEdges = np.concatenate(([inkColumns[0]], whiteSpaces, [inkColumns[-1] + 1]))
+    return columnEdges.reshape(-1, 2)
+
+
+# Pages per setting, clean pages (no figures, no noise) and pages with a
+# figure crossing a gutter plus scanner noise:
+pagesPerSetting = 4
+columnCounts = [2, 3, 4, 5, 6]
+pageDpis = [300, 600]
+pageKinds = [("clean", 0, 0), ("figure+noise", 1, 500)]
+
+print("%4s | %-12s | %7s | %-9s | %8s | %8s | %9s | %10s" % ("dpi", "page", "columns", "method", "ms/page",
+                                                              "pages/s", "correct", "max err px"))
+
+profilesMatch = True
+for dpi in pageDpis:
+    for kindName, totalFigures, noiseDots in pageKinds:
+        for totalColumns in columnCounts:
+            testPages = [makePage(totalColumns, dpi, totalFigures, noiseDots, randomSeed=100 * totalColumns + i)
+                         for i in range(pagesPerSetting)]
+
+            for methodName in ["main.py", "profiles"]:
+                pageTimes, boundaryErrors = [], []
+                correctPages = 0
+                for pageImage, trueColumns in testPages:
+                    startTime = time.perf_counter()
+                    if methodName == "main.py":
+                        columnIntervals = legacyColumns(pageImage)
+                    else:
+                        columnIntervals = detectColumns(pageImage, splitGutters=False)
+                    pageTimes.append(time.perf_counter() - startTime)
+
+                    if len(columnIntervals) == len(trueColumns):
+                        correctPages += 1
+                        boundaryErrors.append(np.abs(columnIntervals - trueColumns).max())
+
+                    # Same result from the integral image:
+                    if methodName == "profiles":
+                        integralColumns = detectColumns(pageImage, splitGutters=False,
+                                                        integralImage=inkIntegral(pageImage))
+                        profilesMatch &= np.array_equal(columnIntervals, integralColumns)
+
+                pageTime = np.mean(pageTimes)
+                maxError = "%10d" % max(boundaryErrors) if boundaryErrors else "%10s" % "-"
+                print("%4d | %-12s | %7d | %-9s | %8.1f | %8.1f | %5d / %d | %s" % (
+                    dpi, kindName, totalColumns, methodName, 1e3 * pageTime, 1 / pageTime, correctPages,
+                    pagesPerSetting, maxError))
+
+print("Integral image path gives the same columns: %s" % profilesMatch)
@@ -0,0 +1,80 @@
+# File        :   benchmarkWriter.py (Crop Writer Benchmark)
+# Version     :   1.0.0
+# Description :   Writes the column crops of a batch of pages with the original
+#                 synchronous writeImage (PNG, compression 0) and with the
+#                 threaded writer of cropWriter.py for each format. Reports the
+#                 wall time, the time the caller is blocked, and the bytes written
+#                 and encode (CPU) time per page.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import cv2
+
+from cropWriter import createWriter, writePageCrops, closeWriter
+
+# Input page (from this folder) and batch size:
+fileName = "pmALU2.jpg"
+totalPages = 12
+totalColumns = 3
+
+# Formats to compare (format, compression level):
+writerSettings = [("PNG", 0), ("PNG", 3), ("JPEG", 95), ("WebP", 90), ("TIFF", "Deflate")]
+
+inputImage = cv2.imread(os.path.join(os.path.dirname(os.path.abspath(__file__)), fileName))
+if inputImage is None:
+    raise IOError("Could not load: " + fileName)
+(imageHeight, imageWidth) = inputImage.shape[:2]
+
+# Fixed column ranges:
+columnEdges = np.linspace(0, imageWidth, totalColumns + 1).astype(int)
+cropRects = list(zip(columnEdges[:-1], columnEdges[1:]))
+
+print("Page: %d x %d, %d pages x %d columns" % (imageWidth, imageHeight, totalPages, totalColumns))
+print("%-22s | %10s | %14s | %10s | %14s" % ("writer", "wall (ms)", "caller ms/page", "KB / page",
+                                               "encode ms/page"))
+
+with tempfile.TemporaryDirectory() as outputPath:
+    # Original, synchronous PNG without compression:
+    startTime = time.perf_counter()
+    writtenBytes = 0
+    for p in range(totalPages):
+        for i, (x1, x2) in enumerate(cropRects):
+            cropPath = os.path.join(outputPath, "sync-%d-col%d.png" % (p, i))
+            cv2.imwrite(cropPath, inputImage[:, x1:x2], [cv2.IMWRITE_PNG_COMPRESSION, 0])
+            writtenBytes += os.path.getsize(cropPath)
+    wallTime = time.perf_counter() - startTime
+    print("%-22s | %10.1f | %14.1f | %10.1f | %14s" % ("sync PNG 0 (main.py)", 1e3 * wallTime,
+                                                       1e3 * wallTime / totalPages,
+                                                       writtenBytes / totalPages / 1024, "-"))
+
+    # Threaded writer:
+    for imageFormat, compressionLevel in writerSettings:
+        writer = createWriter(outputPath, imageFormat, compressionLevel, maxWorkers=4, maxPending=8)
+
+        startTime = time.perf_counter()
+        callerTime = 0.0
+        for p in range(totalPages):
+            submitTime = time.perf_counter()
+            writePageCrops(writer, "%s-%s-%d" % (imageFormat, compressionLevel, p), inputImage, cropRects)
+            callerTime += time.perf_counter() - submitTime
+        pageStats = closeWriter(writer)
+        wallTime = time.perf_counter() - startTime
+
+        pageBytes = np.mean([s["Bytes"] for s in pageStats.values()])
+        pageEncodeTime = np.mean([s["EncodeTime"] for s in pageStats.values()])
+        print("%-22s | %10.1f | %14.1f | %10.1f | %14.1f" % ("threads %s %s" % (imageFormat, compressionLevel),
+                                                             1e3 * wallTime, 1e3 * callerTime / totalPages,
+                                                             pageBytes / 1024, 1e3 * pageEncodeTime))
+
+    # Check: the multi-page TIFF holds the exact crops:
+    _, tiffPages = cv2.imreadmulti(os.path.join(outputPath, "TIFF-Deflate-0.tiff"))
+    exactCrops = all(np.array_equal(tiffPage, inputImage[:, x1:x2]) for tiffPage, (x1, x2) in
+                     zip(tiffPages, cropRects))
+    print("TIFF pages: %d, lossless: %s" % (len(tiffPages), exactCrops))
@@ -0,0 +1,85 @@
+# File        :   benchmarkXyCut.py (XY-cut Benchmark)
+# Version     :   2.0.0
+# Description :   Regions per second of the recursive XY-cut of xyCut.py (one
+#                 integral image shared by all the regions) against a reference
+#                 that thresholds and reduces every crop again, on synthetic 2-6
+#                 column pages with paragraphs at 300 and 600 dpi. Both trees must
+#                 be identical.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from syntheticPages import makePage
+from xyCut import xyCutTree, cutRegions
+
+
+# Ink profiles of a crop, thresholding and reducing it again (the
+# per-crop approach). axis = 1: per row, axis = 0: per column:
+def cropProfile(binaryImage, x1, y1, x2, y2, axis):
+    _, cropImage = cv2.threshold(binaryImage[y1:y2, x1:x2], 0, 255, cv2.THRESH_OTSU)
+    paperSum = cv2.reduce(cropImage, axis, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
+    return cropImage.shape[axis] - paperSum // 255
+
+
+# Trims a region to its ink bounding box, from crop profiles:
+def cropTrim(binaryImage, x1, y1, x2, y2):
+    inkColumns = np.flatnonzero(cropProfile(binaryImage, x1, y1, x2, y2, 0))
+    if len(inkColumns) == 0:
+        return None
+    x1, x2 = x1 + inkColumns[0], x1 + inkColumns[-1] + 1
+    inkRows = np.flatnonzero(cropProfile(binaryImage, x1, y1, x2, y2, 1))
+    return x1, y1 + inkRows[0], x2, y1 + inkRows[-1] + 1
+
+
+# Same tree as xyCutTree, every profile computed from its crop:
+def xyCutReference(binaryImage, minGapX=0.01, minGapY=1, gapRatio=0.5, maxGapInk=0.005):
+    (imageHeight, imageWidth) = binaryImage.shape[:2]
+
+    def regionProfile(regionBox, axis):
+        return cropProfile(binaryImage, *regionBox, axis)
+
+    def regionTrim(regionBox):
+        return cropTrim(binaryImage, *regionBox)
+
+    pageBox = regionTrim((0, 0, imageWidth, imageHeight))
+    minGaps = (max(1, int(minGapX * imageWidth)), max(1, int(minGapY)))
+    return cutRegions(pageBox, regionProfile, regionTrim, minGaps, gapRatio, maxGapInk)
+
+
+# Pages per setting:
+pagesPerSetting = 3
+columnCounts = [2, 4, 6]
+pageDpis = [300, 600]
+
+print("%4s | %7s | %-10s | %8s | %9s | %10s | %9s | %9s | %9s" % ("dpi", "columns", "method", "ms/page", "regions",
+                                                                  "regions/s", "leaves", "max depth", "identical"))
+
+for dpi in pageDpis:
+    for totalColumns in columnCounts:
+        testPages = [makePage(totalColumns, dpi, randomSeed=10 * totalColumns + i, paragraphRatio=0.12)[0]
+                     for i in range(pagesPerSetting)]
+
+        methodTrees = {}
+        for methodName, xyCutFunction in [("per crop", xyCutReference), ("integral", xyCutTree)]:
+            pageTimes, pageTrees = [], []
+            for pageImage in testPages:
+                startTime = time.perf_counter()
+                pageTrees.append(xyCutFunction(pageImage))
+                pageTimes.append(time.perf_counter() - startTime)
+            methodTrees[methodName] = pageTrees
+
+            totalRegions = sum(len(t["Levels"]) for t in pageTrees)
+            # Leaves: regions that are nobody's parent:
+            totalLeaves = sum(len(t["Levels"]) - len(np.unique(t["Parents"][1:])) for t in pageTrees)
+            maxDepth = max(t["Levels"].max() for t in pageTrees)
+            identicalTrees = all(all(np.array_equal(a[k], b[k]) for k in a) for a, b in
+                                 zip(pageTrees, methodTrees["per crop"]))
+            print("%4d | %7d | %-10s | %8.1f | %9d | %10.0f | %9d | %9d | %9s" % (
+                dpi, totalColumns, methodName, 1e3 * np.mean(pageTimes), totalRegions / pagesPerSetting,
+                totalRegions / np.sum(pageTimes), totalLeaves / pagesPerSetting, maxDepth, identicalTrees))
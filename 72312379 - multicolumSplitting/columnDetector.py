@@ -0,0 +1,97 @@
+# File        :   columnDetector.py (Projection Profile Column Detector)
+# Version     :   1.0.0
+# Description :   Finds the text columns of a binary page (ink = 0, paper = 255)
+#                 over the full page. One pass of column sums gives the ink profile
+#                 of several horizontal bands, each band votes for its blank columns
+#                 and the gutters are the columns most bands agree on. Figures
+#                 crossing the gutters in a few bands are outvoted. Returns the
+#                 column intervals as an (N, 2) array of [x1, x2).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Integral image of the ink pixels (ink = 0 in the binary page). Row y of
+# the result holds the ink counts of the rows above y, per column prefix:
+def inkIntegral(binaryImage):
+    _, inkImage = cv2.threshold(binaryImage, 0, 1, cv2.THRESH_BINARY_INV)
+    return cv2.integral(inkImage, sdepth=cv2.CV_32S)
+
+
+# Column-wise ink count of the horizontal bands [y1, y2), as a
+# (bands, width) array. From the integral image if there is one (e.g.
+# shared with the XY-cut), else with one column sum per band, a single
+# pass over the page without building the full prefix table:
+def bandProfiles(binaryImage, bandStarts, bandEnds, integralImage=None):
+    if integralImage is not None:
+        bandPrefix = integralImage[bandEnds] - integralImage[bandStarts]
+        return np.diff(bandPrefix, axis=1)
+
+    (_, imageWidth) = binaryImage.shape[:2]
+    inkProfiles = np.empty((len(bandStarts), imageWidth), np.int64)
+    for i, (y1, y2) in enumerate(zip(bandStarts, bandEnds)):
+        # The page is 0/255, the sum counts the paper pixels:
+        paperSum = cv2.reduce(binaryImage[y1:y2], 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S)
+        inkProfiles[i] = (y2 - y1) - paperSum[0] // 255
+    return inkProfiles
+
+
+# Runs of True values in a 1D boolean array, as (N, 2) [start, end):
+def boolRuns(boolArray):
+    paddedArray = np.concatenate(([0], boolArray.astype(np.int8), [0]))
+    runEdges = np.flatnonzero(np.diff(paddedArray))
+    return runEdges.reshape(-1, 2)
+
+
+# Detects the text columns of a binary page. Each band votes for columns with
+# at most maxGutterInk (fraction of the band height) ink; a column is a gutter
+# if at least minVoteRatio of the bands with ink agree. Gutters narrower than
+# minGutterWidth and columns narrower than minColumnWidth (fractions of the
+# page width) are dropped. With splitGutters, the columns extend to the middle
+# of the gutters (and to the page borders), as the crops of main.py:
+def detectColumns(binaryImage, totalBands=8, maxGutterInk=0.01, minVoteRatio=0.6, minGutterWidth=0.01,
+                  minColumnWidth=0.02, splitGutters=True, integralImage=None):
+    (imageHeight, imageWidth) = binaryImage.shape[:2]
+
+    # Band profiles:
+    bandEdges = np.linspace(0, imageHeight, totalBands + 1).astype(np.int64)
+    bandStarts, bandEnds = bandEdges[:-1], bandEdges[1:]
+    inkProfiles = bandProfiles(binaryImage, bandStarts, bandEnds, integralImage)
+
+    # Blank columns per band (bands without ink don't vote):
+    maxInk = (maxGutterInk * (bandEnds - bandStarts))[:, np.newaxis]
+    blankColumns = inkProfiles <= maxInk
+    votingBands = inkProfiles.sum(axis=1) > 0
+    if not votingBands.any():
+        return np.zeros((0, 2), np.int64)
+
+    # Vote:
+    gutterVotes = blankColumns[votingBands].mean(axis=0)
+    gutterMask = gutterVotes >= minVoteRatio
+
+    # Drop the gutters that are too narrow (they become text):
+    gutterRuns = boolRuns(gutterMask)
+    narrowRuns = (gutterRuns[:, 1] - gutterRuns[:, 0]) < minGutterWidth * imageWidth
+    # The page margins are kept whatever their width:
+    narrowRuns &= (gutterRuns[:, 0] > 0) & (gutterRuns[:, 1] < imageWidth)
+    for (x1, x2) in gutterRuns[narrowRuns]:
+        gutterMask[x1:x2] = False
+
+    # The columns are the runs between gutters:
+    columnRuns = boolRuns(~gutterMask)
+    columnRuns = columnRuns[(columnRuns[:, 1] - columnRuns[:, 0]) >= minColumnWidth * imageWidth]
+    if len(columnRuns) == 0 or not splitGutters:
+        return columnRuns
+
+    # Split the gutters in halves, first and last columns reach the borders:
+    columnIntervals = columnRuns.copy()
+    gutterCenters = (columnRuns[:-1, 1] + columnRuns[1:, 0]) // 2
+    columnIntervals[1:, 0] = gutterCenters
+    columnIntervals[:-1, 1] = gutterCenters
+    columnIntervals[0, 0] = 0
+    columnIntervals[-1, 1] = imageWidth
+    return columnIntervals
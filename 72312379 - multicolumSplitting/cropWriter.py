@@ -0,0 +1,151 @@
+# File        :   cropWriter.py (Threaded Crop Writer)
+# Version     :   1.0.0
+# Description :   Writes the column crops of a page through a bounded pool of
+#                 encoder threads (OpenCV releases the GIL while encoding). Crops
+#                 are slices of the decoded page, no copies are made: the page must
+#                 not be modified until its crops are written. Supports PNG, JPEG,
+#                 WebP (one file per crop) and TIFF (one multi-page file per source
+#                 page), and reports the bytes written and encode time per page.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+# File extension and default compression level per format. PNG: 0-9,
+# JPEG: 0-100 (quality), WebP: 1-100 (quality), TIFF: scheme name:
+formatSettings = {"PNG": {"Extension": ".png", "Level": 3},
+                  "JPEG": {"Extension": ".jpg", "Level": 95},
+                  "WebP": {"Extension": ".webp", "Level": 90},
+                  "TIFF": {"Extension": ".tiff", "Level": "Deflate"}}
+
+# TIFF compression schemes (libtiff codes):
+tiffSchemes = {"None": 1, "LZW": 5, "Deflate": 8}
+
+
+# Gets the imwrite/imencode parameters of a format:
+def encodeParams(imageFormat, compressionLevel=None):
+    if imageFormat not in formatSettings:
+        raise ValueError("encodeParams>> Error: Unknown image format: " + str(imageFormat))
+    if compressionLevel is None:
+        compressionLevel = formatSettings[imageFormat]["Level"]
+
+    if imageFormat == "PNG":
+        return [cv2.IMWRITE_PNG_COMPRESSION, int(compressionLevel)]
+    if imageFormat == "JPEG":
+        return [cv2.IMWRITE_JPEG_QUALITY, int(compressionLevel)]
+    if imageFormat == "WebP":
+        return [cv2.IMWRITE_WEBP_QUALITY, int(compressionLevel)]
+    return [cv2.IMWRITE_TIFF_COMPRESSION, tiffSchemes[compressionLevel]]
+
+
+# Creates the writer state dictionary. At most maxPending tasks are queued,
+# submitting more blocks the caller (bounds the pages kept in memory):
+def createWriter(outputPath, imageFormat="PNG", compressionLevel=None, maxWorkers=4, maxPending=8):
+    writerParams = {"OutputPath": outputPath,
+                    "Format": imageFormat,
+                    "Extension": formatSettings[imageFormat]["Extension"],
+                    "EncodeParams": encodeParams(imageFormat, compressionLevel)}
+
+    return {"Params": writerParams,
+            "Executor": ThreadPoolExecutor(max_workers=maxWorkers),
+            "Slots": threading.BoundedSemaphore(maxPending),
+            "Lock": threading.Lock(),
+            "Futures": [],
+            "PageStats": {}}
+
+
+# Gets (or creates) the statistics of a page, call with the lock held:
+def getPageStats(writer, pageName):
+    return writer["PageStats"].setdefault(pageName, {"Files": 0, "Crops": 0, "Bytes": 0, "EncodeTime": 0.0})
+
+
+# Adds the result of one task to the page statistics:
+def updatePageStats(writer, pageName, writtenFiles, writtenBytes, encodeTime):
+    with writer["Lock"]:
+        pageStats = getPageStats(writer, pageName)
+        pageStats["Files"] += writtenFiles
+        pageStats["Bytes"] += writtenBytes
+        pageStats["EncodeTime"] += encodeTime
+
+
+# Encodes one crop and writes it to disk (worker thread):
+def writeCropTask(writer, pageName, cropPath, cropImage):
+    writerParams = writer["Params"]
+    # Encode time is the CPU time of this thread (other threads excluded):
+    startTime = time.thread_time()
+    success, encodedImage = cv2.imencode(writerParams["Extension"], cropImage, writerParams["EncodeParams"])
+    encodeTime = time.thread_time() - startTime
+    if not success:
+        raise IOError("writeCropTask>> Error: Could not encode: " + cropPath)
+
+    encodedImage.tofile(cropPath)
+    updatePageStats(writer, pageName, 1, encodedImage.size, encodeTime)
+    return cropPath
+
+
+# Encodes all the crops of a page into one multi-page TIFF (worker thread):
+def writeTiffTask(writer, pageName, tiffPath, cropImages):
+    startTime = time.thread_time()
+    success = cv2.imwritemulti(tiffPath, cropImages, writer["Params"]["EncodeParams"])
+    encodeTime = time.thread_time() - startTime
+    if not success:
+        raise IOError("writeTiffTask>> Error: Could not write: " + tiffPath)
+
+    updatePageStats(writer, pageName, 1, os.path.getsize(tiffPath), encodeTime)
+    return tiffPath
+
+
+# Queues a task, blocking while maxPending tasks are waiting:
+def submitTask(writer, taskFunction, *taskArgs):
+    writer["Slots"].acquire()
+    try:
+        taskFuture = writer["Executor"].submit(taskFunction, writer, *taskArgs)
+    except Exception:
+        writer["Slots"].release()
+        raise
+    taskFuture.add_done_callback(lambda _: writer["Slots"].release())
+
+    # Keep the pending tasks and the failed ones (raised on close):
+    writer["Futures"] = [f for f in writer["Futures"] if not f.done() or f.exception() is not None]
+    writer["Futures"].append(taskFuture)
+    return taskFuture
+
+
+# Queues the crops of a page. cropRects is a list of (x1, x2) column
+# ranges over the full page height. Returns the task futures:
+def writePageCrops(writer, pageName, pageImage, cropRects):
+    writerParams = writer["Params"]
+    basePath = os.path.join(writerParams["OutputPath"], pageName)
+
+    # Zero-copy column slices:
+    cropImages = [pageImage[:, x1:x2] for (x1, x2) in cropRects]
+    with writer["Lock"]:
+        getPageStats(writer, pageName)["Crops"] += len(cropImages)
+
+    # One multi-page file per source page:
+    if writerParams["Format"] == "TIFF":
+        return [submitTask(writer, writeTiffTask, pageName, basePath + writerParams["Extension"], cropImages)]
+
+    # One file per crop:
+    taskFutures = []
+    for i, cropImage in enumerate(cropImages):
+        cropPath = basePath + "-col" + str(i) + writerParams["Extension"]
+        taskFutures.append(submitTask(writer, writeCropTask, pageName, cropPath, cropImage))
+    return taskFutures
+
+
+# Waits for all the queued crops, stops the threads and returns the
+# per page statistics (errors of the tasks are raised here):
+def closeWriter(writer):
+    for taskFuture in writer["Futures"]:
+        taskFuture.result()
+    writer["Futures"].clear()
+    writer["Executor"].shutdown(wait=True)
+    return writer["PageStats"]
@@ -1,5 +1,5 @@
 # File        :   main.py (Page splitting by columns)
-# Version     :   1.0.0
+# Version     :   1.4.2
 # Description :   Script that splits a scanned page into its columns
 #                 Answer for: https://stackoverflow.com/q/72309686/12728244
 # Date:       :   May 19, 2022
@@ -9,6 +9,11 @@
 import numpy as np
 import cv2
 
+from cropWriter import createWriter, writePageCrops, closeWriter
+from morphology import morphology
+from columnDetector import detectColumns
+from xyCut import xyCutTree
+
 
 # Reads image via OpenCV:
 def readImage(imagePath):
@@ -45,6 +50,23 @@ def clamp(val, minval, maxval):
 path = "D://opencvImages//"
 fileName = "pmALU.jpg"
 
+# Output of the column crops: "PNG" (level 0-9), "JPEG" (quality 0-100),
+# "WebP" (quality 1-100) or "TIFF" (one multi-page file, "None", "LZW" or "Deflate"):
+outputFormat = "PNG"
+compressionLevel = 3
+
+# Find the columns with the original middle ROI method (False) or, opt-in,
+# with the banded projection profiles over the full page (True). The profile
+# detector gives different crop boundaries (the gutters are measured over
+# the full page), so the written crops change:
+useProfileDetector = False
+
+# (Optional) Segment the page with a recursive XY-cut (columns, text blocks, lines):
+runLayoutSegmentation = False
+
+# Crops are encoded and written by a pool of threads:
+cropWriter = createWriter(path, outputFormat, compressionLevel, maxWorkers=4)
+
 # Reading an image in default mode:
 inputImage = cv2.imread(path + fileName)
 
@@ -60,90 +82,124 @@ showImage("binaryImage", binaryImage)
 # Get image dimensions:
 (imageHeight, imageWidth) = binaryImage.shape[:2]
 
-# Set middle ROI dimensions:
-middleVertical = 0.5 * imageHeight
-roiWidth = imageWidth
-roiHeight = int(0.1 * imageHeight)
-middleRoiVertical = 0.5 * roiHeight
-roiY = int(0.5 * imageHeight - middleRoiVertical)
-
-# Draw ROI on original image:
-binaryColor = cv2.cvtColor(binaryImage, cv2.COLOR_GRAY2BGR)
-cv2.rectangle(binaryColor, (0, roiY), (imageWidth, roiY + roiHeight), (0, 0, 255), 10)
-# Show the image:
-showImage("binaryColor", binaryColor)
-
-# Slice the ROI:
-middleRoi = binaryImage[roiY:roiY + roiHeight, 0:imageWidth]
-# Show the image:
-showImage("middleRoi", middleRoi)
-
-# White rectangle around ROI:
-rectangleThickness = int(0.01 * imageHeight)
-cv2.rectangle(middleRoi, (0, 0), (roiWidth, roiHeight), 255, rectangleThickness)
-# Show the image:
-showImage("middleRoi2", middleRoi)
-
-# Image reduction to a row:
-reducedImage = cv2.reduce(middleRoi, 0, cv2.REDUCE_MIN)
-# Show the image:
-showImage("reducedImage", reducedImage)
-
-# Flood fill at the extreme corners:
-fillPositions = [0, imageWidth - 1]
-
-for i in range(len(fillPositions)):
-    # Get flood-fill coordinate:
-    x = fillPositions[i]
-    currentCorner = (x, 0)
-    fillColor = 0
-    cv2.floodFill(reducedImage, None, currentCorner, fillColor)
-    showImage("reducedImage", reducedImage)
-
-writeImage(path+"reducedImageFilled", reducedImage)
-
-# Apply Opening:
-kernel = np.ones((3, 3), np.uint8)
-reducedImage = cv2.morphologyEx(reducedImage, cv2.MORPH_CLOSE, kernel, iterations=2)
-# Show the image:
-showImage("reducedImage [Morpho]", reducedImage)
-
-# Get horizontal transitions:
-whiteSpaces = np.where(np.diff(reducedImage, prepend=np.nan))[1]
-
-# Color image:
-reducedImageColor = cv2.cvtColor(reducedImage, cv2.COLOR_GRAY2BGR)
-# Display the transition lines:
-for y in range(len(whiteSpaces)):
-    x = whiteSpaces[y]
-    reducedImageColor[0, x] = (0, 255, 0)
+# (Optional) Layout segmentation on the same binary image:
+if runLayoutSegmentation:
+    regionTree = xyCutTree(binaryImage)
+    # One color per tree level (depth), cycled:
+    levelColors = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    layoutImage = inputImage.copy()
+    for (x1, y1, x2, y2), level in zip(regionTree["Boxes"], regionTree["Levels"]):
+        levelColor = levelColors[level % len(levelColors)]
+        cv2.rectangle(layoutImage, (int(x1), int(y1)), (int(x2) - 1, int(y2) - 1), levelColor, 2)
+    for level, levelCount in enumerate(np.bincount(regionTree["Levels"])):
+        print("Level " + str(level) + " regions: " + str(levelCount))
+    # Show the image:
+    showImage("layoutImage", layoutImage)
+
+# Column detection:
+if useProfileDetector:
+    # (N, 2) column intervals, the gutters are split in halves:
+    cropRects = detectColumns(binaryImage, totalBands=8).tolist()
+    for (x1, x2) in cropRects:
+        currentCrop = inputImage[0:imageHeight, x1:x2]
+        # Show the image:
+        showImage("currentCrop", currentCrop)
+
+else:
+    # Set middle ROI dimensions:
+    middleVertical = 0.5 * imageHeight
+    roiWidth = imageWidth
+    roiHeight = int(0.1 * imageHeight)
+    middleRoiVertical = 0.5 * roiHeight
+    roiY = int(0.5 * imageHeight - middleRoiVertical)
+
+    # Draw ROI on original image:
+    binaryColor = cv2.cvtColor(binaryImage, cv2.COLOR_GRAY2BGR)
+    cv2.rectangle(binaryColor, (0, roiY), (imageWidth, roiY + roiHeight), (0, 0, 255), 10)
     # Show the image:
-    showImage("reducedImageColor", reducedImageColor)
+    showImage("binaryColor", binaryColor)
 
-# Crop the image:
-colWidth = len(whiteSpaces)
-spaceMargin = 0
-for x in range(0, colWidth, 2):
+    # Slice the ROI:
+    middleRoi = binaryImage[roiY:roiY + roiHeight, 0:imageWidth]
+    # Show the image:
+    showImage("middleRoi", middleRoi)
 
-    # Get horizontal cropping coordinates:
-    if x != colWidth - 1:
-        x2 = whiteSpaces[x + 1]
-        spaceMargin = (whiteSpaces[x + 2] - whiteSpaces[x + 1]) // 2
-    else:
-        x2 = imageWidth
+    # White rectangle around ROI:
+    rectangleThickness = int(0.01 * imageHeight)
+    cv2.rectangle(middleRoi, (0, 0), (roiWidth, roiHeight), 255, rectangleThickness)
+    # Show the image:
+    showImage("middleRoi2", middleRoi)
 
-    # Set horizontal cropping coordinates:
-    x1 = whiteSpaces[x] - spaceMargin
-    x2 = x2 + spaceMargin
+    # Image reduction to a row:
+    reducedImage = cv2.reduce(middleRoi, 0, cv2.REDUCE_MIN)
+    # Show the image:
+    showImage("reducedImage", reducedImage)
 
-    print((x1, x2, spaceMargin))
+    # Flood fill at the extreme corners:
+    fillPositions = [0, imageWidth - 1]
 
-    # Clamp and Crop original input:
-    x1 = clamp(x1, 0, imageWidth)
-    x2 = clamp(x2, 0, imageWidth)
+    for i in range(len(fillPositions)):
+        # Get flood-fill coordinate:
+        x = fillPositions[i]
+        currentCorner = (x, 0)
+        fillColor = 0
+        cv2.floodFill(reducedImage, None, currentCorner, fillColor)
+        showImage("reducedImage", reducedImage)
 
-    print((x1, x2, spaceMargin))
+    writeImage(path+"reducedImageFilled", reducedImage)
 
-    currentCrop = inputImage[0:imageHeight, x1:x2]
+    # Apply Closing (3 x 3 rectangle, 2 iterations):
+    reducedImage = morphology(reducedImage, "Closing", 3, 2, binaryInput=True)
     # Show the image:
-    showImage("currentCrop", currentCrop)
\ No newline at end of file
+    showImage("reducedImage [Morpho]", reducedImage)
+
+    # Get horizontal transitions:
+    whiteSpaces = np.where(np.diff(reducedImage, prepend=np.nan))[1]
+
+    # Color image:
+    reducedImageColor = cv2.cvtColor(reducedImage, cv2.COLOR_GRAY2BGR)
+    # Display the transition lines:
+    for y in range(len(whiteSpaces)):
+        x = whiteSpaces[y]
+        reducedImageColor[0, x] = (0, 255, 0)
+        # Show the image:
+        showImage("reducedImageColor", reducedImageColor)
+
+    # Crop the image:
+    colWidth = len(whiteSpaces)
+    spaceMargin = 0
+    cropRects = []
+    for x in range(0, colWidth, 2):
+
+        # Get horizontal cropping coordinates:
+        if x != colWidth - 1:
+            x2 = whiteSpaces[x + 1]
+            spaceMargin = (whiteSpaces[x + 2] - whiteSpaces[x + 1]) // 2
+        else:
+            x2 = imageWidth
+
+        # Set horizontal cropping coordinates:
+        x1 = whiteSpaces[x] - spaceMargin
+        x2 = x2 + spaceMargin
+
+        print((x1, x2, spaceMargin))
+
+        # Clamp and Crop original input:
+        x1 = clamp(x1, 0, imageWidth)
+        x2 = clamp(x2, 0, imageWidth)
+
+        print((x1, x2, spaceMargin))
+
+        currentCrop = inputImage[0:imageHeight, x1:x2]
+        cropRects.append((x1, x2))
+        # Show the image:
+        showImage("currentCrop", currentCrop)
+
+# Write the crops (slices of the input, written in the background):
+writePageCrops(cropWriter, fileName.split(".")[0], inputImage, cropRects)
+
+# Wait for the writer, print bytes and encode time per page:
+pageStats = closeWriter(cropWriter)
+for pageName, currentStats in pageStats.items():
+    print("Wrote " + pageName + ": " + str(currentStats["Files"]) + " file(s), " + str(currentStats["Bytes"]) +
+          " bytes, encode: " + str(round(1e3 * currentStats["EncodeTime"], 1)) + " ms")
@@ -0,0 +1,67 @@
+# File        :   syntheticPages.py (Synthetic Multi-column Pages)
+# Version     :   1.1.0
+# Description :   Generates binary letter size pages (ink = 0) with N text
+#                 columns of word lines, paragraphs and optional figures that cross
+#                 the gutters, at a given dpi. Returns the page and the ground
+#                 truth column intervals [x1, x2) of the text.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Draws lines of "words" (black rectangles) in a box. A blank line ends a
+# paragraph with probability paragraphRatio:
+def drawTextBlock(pageImage, x1, y1, x2, y2, dpi, randomGenerator, paragraphRatio=0.0):
+    lineHeight = int(0.11 * dpi)
+    textHeight = int(0.07 * dpi)
+    for y in range(y1, y2 - textHeight, lineHeight):
+        if paragraphRatio > 0 and randomGenerator.random() < paragraphRatio:
+            continue
+        x = x1
+        # Ragged line endings:
+        lineEnd = x2 - int(randomGenerator.uniform(0, 0.3) * (x2 - x1)) if randomGenerator.random() < 0.2 else x2
+        while x < lineEnd:
+            wordWidth = int(randomGenerator.uniform(0.15, 0.6) * dpi)
+            cv2.rectangle(pageImage, (x, y), (min(x + wordWidth, lineEnd) - 1, y + textHeight - 1), 0, -1)
+            x += wordWidth + int(0.05 * dpi)
+
+
+# Generates one page. Figures span two neighbor columns (crossing their
+# gutter) in a limited vertical band:
+def makePage(totalColumns, dpi=300, totalFigures=1, noiseDots=500, randomSeed=0, paragraphRatio=0.0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    pageWidth, pageHeight = int(8.5 * dpi), int(11 * dpi)
+    pageImage = np.full((pageHeight, pageWidth), 255, np.uint8)
+
+    # Layout: 0.75" margins, 0.25" gutters:
+    margin, gutter = int(0.75 * dpi), int(0.25 * dpi)
+    columnWidth = (pageWidth - 2 * margin - (totalColumns - 1) * gutter) // totalColumns
+    columnStarts = margin + np.arange(totalColumns) * (columnWidth + gutter)
+    columnIntervals = np.stack([columnStarts, columnStarts + columnWidth], axis=1)
+
+    topText, bottomText = margin, pageHeight - margin
+    for (x1, x2) in columnIntervals:
+        drawTextBlock(pageImage, x1, topText, x2, bottomText, dpi, randomGenerator, paragraphRatio)
+
+    # Figures over two columns (blank box with a thick frame and a plot):
+    for _ in range(totalFigures if totalColumns > 1 else 0):
+        c = randomGenerator.integers(0, totalColumns - 1)
+        figureHeight = int(randomGenerator.uniform(0.08, 0.15) * pageHeight)
+        y1 = int(randomGenerator.uniform(0.2, 0.7) * pageHeight)
+        x1, x2 = columnIntervals[c, 0], columnIntervals[c + 1, 1]
+        cv2.rectangle(pageImage, (x1, y1), (x2 - 1, y1 + figureHeight), 255, -1)
+        cv2.rectangle(pageImage, (x1, y1), (x2 - 1, y1 + figureHeight), 0, max(2, dpi // 100))
+        plotX = np.linspace(x1, x2 - 1, 50).astype(np.int32)
+        plotY = (y1 + figureHeight * (0.5 + 0.3 * np.sin(np.linspace(0, 6, 50)))).astype(np.int32)
+        cv2.polylines(pageImage, [np.stack([plotX, plotY], axis=1)], False, 0, max(2, dpi // 150))
+
+    # Scanner noise (isolated dots):
+    noiseX = randomGenerator.integers(0, pageWidth, noiseDots)
+    noiseY = randomGenerator.integers(0, pageHeight, noiseDots)
+    pageImage[noiseY, noiseX] = 0
+
+    return pageImage, columnIntervals
@@ -0,0 +1,142 @@
+# File        :   xyCut.py (Recursive XY-cut Layout Segmentation)
+# Version     :   2.0.0
+# Description :   Segments a binary page (ink = 0, paper = 255) with a recursive
+#                 XY-cut: regions are cut at the valleys of their ink profiles,
+#                 alternating vertical and horizontal cuts, until no valley is left
+#                 (typically columns, text blocks, lines). The page is binarized once
+#                 and its ink integral image is shared by every region: the profile
+#                 of a region is read from the prefix sums in O(height + width), no
+#                 crop is thresholded or reduced again. The region tree is returned
+#                 as flat arrays (boxes, parents, levels, cut axes).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+from collections import deque
+
+import numpy as np
+
+from columnDetector import inkIntegral, boolRuns
+
+
+# Ink per row of the region [x1, x2) x [y1, y2), from the integral image:
+def rowProfile(integralImage, x1, y1, x2, y2):
+    rowPrefix = integralImage[y1:y2 + 1, x2] - integralImage[y1:y2 + 1, x1]
+    return np.diff(rowPrefix)
+
+
+# Ink per column of the region [x1, x2) x [y1, y2), from the integral image:
+def columnProfile(integralImage, x1, y1, x2, y2):
+    columnPrefix = integralImage[y2, x1:x2 + 1] - integralImage[y1, x1:x2 + 1]
+    return np.diff(columnPrefix)
+
+
+# Cuts a profile at its gaps (values <= maxInk) of at least minGap samples.
+# Returns the (N, 2) [start, end) content runs, trimmed of blank ends:
+def cutProfile(inkProfile, minGap, maxInk):
+    contentRuns = boolRuns(inkProfile > maxInk)
+    if len(contentRuns) < 2:
+        return contentRuns
+
+    # Merge the content runs separated by gaps narrower than minGap:
+    wideGaps = (contentRuns[1:, 0] - contentRuns[:-1, 1]) >= minGap
+    runStarts = contentRuns[np.concatenate(([True], wideGaps)), 0]
+    runEnds = contentRuns[np.concatenate((wideGaps, [True])), 1]
+    return np.stack([runStarts, runEnds], axis=1)
+
+
+# Trims a region to its ink bounding box, returns None if it has no ink:
+def trimRegion(integralImage, x1, y1, x2, y2):
+    inkColumns = np.flatnonzero(columnProfile(integralImage, x1, y1, x2, y2))
+    if len(inkColumns) == 0:
+        return None
+    x1, x2 = x1 + inkColumns[0], x1 + inkColumns[-1] + 1
+    inkRows = np.flatnonzero(rowProfile(integralImage, x1, y1, x2, y2))
+    return x1, y1 + inkRows[0], x2, y1 + inkRows[-1] + 1
+
+
+# Cuts a profile at its valleys (values <= maxInk) of at least minGap
+# samples and gapRatio of the widest valley, so the widest gaps (e.g.
+# paragraphs before lines) are cut first. Returns the (N, 2) [start, end)
+# content runs:
+def cutValleys(inkProfile, minGap, maxInk, gapRatio):
+    contentRuns = boolRuns(inkProfile > maxInk)
+    if len(contentRuns) < 2:
+        return contentRuns
+    gapWidths = contentRuns[1:, 0] - contentRuns[:-1, 1]
+    return cutProfile(inkProfile, max(minGap, gapRatio * gapWidths.max()), maxInk)
+
+
+# Recursive XY-cut of the region rootBox. Each region is cut along its
+# preferred axis (0: vertical cuts, at column valleys; 1: horizontal cuts,
+# at row valleys), or along the other one if the preferred axis has no
+# valley; its children prefer the opposite axis. A region without valleys
+# on either axis is a leaf. regionProfile(box, axis) returns the ink
+# profile along the axis and regionTrim(box) the ink bounding box (or
+# None). minGaps are the minimum valley widths (samples) per axis and
+# maxGapInk the ink (fraction of the region extent) a valley may hold:
+def cutRegions(rootBox, regionProfile, regionTrim, minGaps, gapRatio=0.5, maxGapInk=0.005, firstAxis=0):
+    regionBoxes, regionParents, regionLevels, regionAxes = [rootBox], [-1], [0], [-1]
+
+    # Breadth first, so the regions are ordered level by level:
+    regionQueue = deque([(0, firstAxis)])
+    while regionQueue:
+        parentIndex, preferredAxis = regionQueue.popleft()
+        x1, y1, x2, y2 = regionBoxes[parentIndex]
+
+        for cutAxis in [preferredAxis, 1 - preferredAxis]:
+            # The valley ink tolerance scales with the extent across the cut:
+            crossExtent = (y2 - y1) if cutAxis == 0 else (x2 - x1)
+            inkProfile = regionProfile((x1, y1, x2, y2), cutAxis)
+            contentRuns = cutValleys(inkProfile, minGaps[cutAxis], maxGapInk * crossExtent, gapRatio)
+            if len(contentRuns) > 1:
+                break
+        else:
+            continue
+
+        for (r1, r2) in contentRuns:
+            childBox = (x1 + r1, y1, x1 + r2, y2) if cutAxis == 0 else (x1, y1 + r1, x2, y1 + r2)
+            childBox = regionTrim(childBox)
+            if childBox is None:
+                continue
+            regionQueue.append((len(regionBoxes), 1 - cutAxis))
+            regionBoxes.append(childBox)
+            regionParents.append(parentIndex)
+            regionLevels.append(regionLevels[parentIndex] + 1)
+            regionAxes.append(cutAxis)
+
+    return {"Boxes": np.array(regionBoxes, np.int32).reshape(-1, 4),
+            "Parents": np.array(regionParents, np.int32),
+            "Levels": np.array(regionLevels, np.int16),
+            "Axes": np.array(regionAxes, np.int8)}
+
+
+# Segments a binary page with a recursive XY-cut, starting with vertical
+# cuts (columns). Vertical valleys must be at least minGapX (fraction of the
+# page width) wide, horizontal ones minGapY rows. Every region is trimmed to
+# its ink bounding box and all profiles come from one integral image.
+# Returns the region tree dictionary: "Boxes" (N, 4) [x1, y1, x2, y2),
+# "Parents" (N,) (-1 for the page), "Levels" (N,) (depth) and "Axes" (N,)
+# (cut that made the region: 0 vertical, 1 horizontal, -1 for the page),
+# ordered level by level:
+def xyCutTree(binaryImage, minGapX=0.01, minGapY=1, gapRatio=0.5, maxGapInk=0.005, integralImage=None):
+    (imageHeight, imageWidth) = binaryImage.shape[:2]
+    if integralImage is None:
+        integralImage = inkIntegral(binaryImage)
+
+    def regionProfile(regionBox, axis):
+        if axis == 0:
+            return columnProfile(integralImage, *regionBox)
+        return rowProfile(integralImage, *regionBox)
+
+    def regionTrim(regionBox):
+        return trimRegion(integralImage, *regionBox)
+
+    pageBox = regionTrim((0, 0, imageWidth, imageHeight))
+    if pageBox is None:
+        return {"Boxes": np.zeros((0, 4), np.int32), "Parents": np.zeros(0, np.int32),
+                "Levels": np.zeros(0, np.int16), "Axes": np.zeros(0, np.int8)}
+
+    minGaps = (max(1, int(minGapX * imageWidth)), max(1, int(minGapY)))
+    return cutRegions(pageBox, regionProfile, regionTrim, minGaps, gapRatio, maxGapInk)
@@ -0,0 +1,130 @@
+# File        :   benchmarkBlobs.py (Biggest Blobs Benchmark)
+# Version     :   1.1.0
+# Description :   Milliseconds to get the K biggest blobs of an 8K binary image
+#                 with 10^5 blobs (discs and rings): the contours of main.py
+#                 (contourArea loop, drawing and subtraction) against the single
+#                 labeling of blobFinder.py. The labeling result is checked
+#                 against a full label lookup; the contours pick a big ring as the
+#                 biggest blob (its hole counts as area). Small cases with
+#                 single pixel blobs (1 x 1 boxes) and tied areas are checked
+#                 first.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from blobFinder import largestBlobs
+
+# 8K frame, blob grid (400 x 250 = 10^5 cells) and K values:
+imageWidth, imageHeight = 7680, 4320
+gridColumns, gridRows = 400, 250
+blobCounts = [1, 10, 100, 1000]
+timingRepeats = 3
+
+# The contours (one drawing per blob) are only timed up to this K:
+maxContoursBlobs = 10
+
+
+# Draws one disc or ring per grid cell, plus a big ring (biggest by contour
+# area) and a big disc (biggest by pixel area) in the middle:
+def makeBlobImage(randomSeed=0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    blobImage = np.zeros((imageHeight, imageWidth), np.uint8)
+    cellWidth, cellHeight = imageWidth / gridColumns, imageHeight / gridRows
+
+    totalCells = gridColumns * gridRows
+    cellX = (np.arange(totalCells) % gridColumns + 0.5) * cellWidth + randomGenerator.uniform(-2, 2, totalCells)
+    cellY = (np.arange(totalCells) // gridColumns + 0.5) * cellHeight + randomGenerator.uniform(-2, 2, totalCells)
+    blobRadius = randomGenerator.integers(2, 6, totalCells)
+    # Rings (thickness 2) or discs (-1):
+    blobThickness = np.where(randomGenerator.random(totalCells) < 0.2, 2, -1)
+    for x, y, r, t in zip(cellX.astype(int), cellY.astype(int), blobRadius, blobThickness):
+        cv2.circle(blobImage, (int(x), int(y)), int(r), 255, int(t))
+
+    # Big ring and big disc, each on a cleared square:
+    blobImage[1835:2465, 2885:3515] = 0
+    cv2.circle(blobImage, (3200, 2150), 300, 255, 10)
+    blobImage[2020:2280, 4470:4730] = 0
+    cv2.circle(blobImage, (4600, 2150), 120, 255, -1)
+    return blobImage
+
+
+# The K biggest blobs as in main.py: contours, contourArea loop, the blobs
+# drawn black on a copy and the copy subtracted from the input:
+def largestBlobsContours(binaryImage, totalBlobs=1):
+    contours, hierarchy = cv2.findContours(binaryImage, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+    contourAreas = []
+    for i, cc in enumerate(contours):
+        contourAreas.append(cv2.contourArea(cc))
+    biggestContours = np.argsort(contourAreas)[::-1][:totalBlobs]
+
+    tempMat = binaryImage.copy()
+    for contourIndex in biggestContours:
+        cv2.drawContours(tempMat, contours, int(contourIndex), (0, 0, 0), -1, 8, hierarchy)
+    return binaryImage - tempMat
+
+
+# Small cases: (name, image, K, expected areas). A 15 x 15 blob with single
+# pixels (one blob with a 1 x 1 box, ties of area 1 cut by label):
+def smallCases():
+    singleImage = np.zeros((40, 40), np.uint8)
+    singleImage[2:17, 2:17] = 255
+    singleImage[30, 30] = 255
+    pixelsImage = singleImage.copy()
+    pixelsImage[30, 34] = pixelsImage[34, 30] = 255
+    onlyPixels = pixelsImage.copy()
+    onlyPixels[2:17, 2:17] = 0
+    return [("15x15 + 1 pixel", singleImage, 2, [225, 1]),
+            ("15x15 + 3 pixels", pixelsImage, 2, [225, 1]),
+            ("3 pixels only", onlyPixels, 3, [1, 1, 1])]
+
+
+# Mask of the selected labels via a full label -> value lookup:
+def lookupMask(binaryImage, blobLabels):
+    _, labelImage = cv2.connectedComponentsWithAlgorithm(binaryImage, 8, cv2.CV_32S, cv2.CCL_GRANA)
+    labelValues = np.zeros(labelImage.max() + 1, np.uint8)
+    labelValues[blobLabels] = 255
+    return np.take(labelValues, labelImage)
+
+
+for caseName, caseImage, totalBlobs, caseAreas in smallCases():
+    blobs = largestBlobs(caseImage, totalBlobs)
+    caseMatch = blobs["Areas"].tolist() == caseAreas and np.array_equal(lookupMask(caseImage, blobs["Labels"]),
+                                                                      blobs["Mask"])
+    print("Small case %-16s K=%d: areas %s, matches lookup: %s" % (caseName, totalBlobs, blobs["Areas"].tolist(),
+                                                                  caseMatch))
+
+binaryImage = makeBlobImage()
+print("Image: %d x %d, %d blobs" % (imageWidth, imageHeight, cv2.connectedComponents(binaryImage)[0] - 1))
+
+print("%5s | %-9s | %9s | %-14s | %-16s" % ("K", "method", "ms", "biggest area", "matches lookup"))
+outputMask = np.empty_like(binaryImage)
+for totalBlobs in blobCounts:
+    for methodName in ["contours", "labels"]:
+        if methodName == "contours" and totalBlobs > maxContoursBlobs:
+            continue
+        startTime = time.perf_counter()
+        for _ in range(timingRepeats):
+            if methodName == "contours":
+                blobMask = largestBlobsContours(binaryImage, totalBlobs)
+            else:
+                blobs = largestBlobs(binaryImage, totalBlobs, outputMask=outputMask)
+                blobMask = blobs["Mask"]
+        methodTime = (time.perf_counter() - startTime) / timingRepeats
+
+        # Pixel area of the biggest selected blob:
+        _, _, maskStats, _ = cv2.connectedComponentsWithStats(blobMask)
+        biggestArea = maskStats[1:, cv2.CC_STAT_AREA].max()
+
+        # Check: the selected labels via a full label -> value lookup:
+        matchesLookup = "-"
+        if methodName == "labels":
+            matchesLookup = str(np.array_equal(lookupMask(binaryImage, blobs["Labels"]), blobMask))
+
+        print("%5d | %-9s | %9.1f | %-14d | %-16s" % (totalBlobs, methodName, 1e3 * methodTime, biggestArea,
+                                                       matchesLookup))
@@ -0,0 +1,97 @@
+# File        :   benchmarkTiled.py (Out-of-core Biggest Blob Benchmark)
+# Version     :   1.0.0
+# Description :   Megapixels per second and peak resident memory of the tiled
+#                 biggest blob search of tiledBlobs.py (memory-mapped .npy input
+#                 and output) for different tile sizes, against largestBlobs of
+#                 blobFinder.py on the image loaded in memory. The area, box and
+#                 mask must be identical. The test image (smooth random blobs and
+#                 one pixel diagonal segments through the tile corners) is written
+#                 by a child process.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import Process
+
+import numpy as np
+import cv2
+
+from blobFinder import largestBlobs
+from tiledBlobs import largestBlobTiled, openImage
+
+# Image size (144 MP) and tile sizes:
+imageWidth, imageHeight = 12000, 12000
+tileSizes = [1024, 2048, 4096]
+
+
+# Peak resident set size of this process in MB (None if not available):
+def peakRssMb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxRss / 2 ** 20 if sys.platform == "darwin" else maxRss / 2 ** 10
+
+
+# Writes the test image: thresholded smooth noise (blobs of every size,
+# many crossing the tiles) and one pixel diagonal segments (8-connected)
+# through the corners of a 1024 grid:
+def writeTestImage(imagePath, randomSeed=0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    noiseImage = (randomGenerator.random((imageHeight // 10, imageWidth // 10)) * 255).astype(np.uint8)
+    noiseImage = cv2.GaussianBlur(noiseImage, (0, 0), 2.0)
+    testImage = cv2.resize(noiseImage, (imageWidth, imageHeight), interpolation=cv2.INTER_LINEAR)
+    cv2.threshold(testImage, 136, 255, cv2.THRESH_BINARY, dst=testImage)
+    for y in range(1024, imageHeight, 1024):
+        for x in range(1024, imageWidth, 1024):
+            cv2.line(testImage, (x - 150, y - 150), (x + 150, y + 150), 255, 1, cv2.LINE_8)
+            cv2.line(testImage, (x + 150, y - 150), (x - 150, y + 150), 255, 1, cv2.LINE_8)
+    np.save(imagePath, testImage)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as imageFolder:
+        imagePath = os.path.join(imageFolder, "mask.npy")
+        imageWriter = Process(target=writeTestImage, args=(imagePath,))
+        imageWriter.start()
+        imageWriter.join()
+
+        megaPixels = imageWidth * imageHeight / 1e6
+        print("Image: %d x %d (%.0f MP), main process RSS before: %.0f MB" % (imageWidth, imageHeight, megaPixels,
+                                                                            peakRssMb()))
+        print("%-10s | %5s | %6s | %9s | %8s | %9s | %-34s" % ("method", "tile", "scan s", "seconds", "MP/s",
+                                                               "peak RSS", "area / box"))
+
+        # Tiled, memory-mapped input and output:
+        tiledResults = []
+        for tileSize in tileSizes:
+            outputPath = os.path.join(imageFolder, "blob-%d.npy" % tileSize)
+            blobResult = largestBlobTiled(imagePath, tileSize=tileSize, outputPath=outputPath)
+            tiledResults.append((tileSize, blobResult, outputPath))
+            print("%-10s | %5d | %6.2f | %9.2f | %8.1f | %6.0f MB | %-34s" % (
+                "tiled", tileSize, blobResult["ScanSeconds"], blobResult["Seconds"],
+                megaPixels / blobResult["Seconds"], peakRssMb(), "%d %s" % (blobResult["Area"], blobResult["Box"])))
+
+        # In memory:
+        inputImage = np.load(imagePath)
+        startTime = time.perf_counter()
+        blobs = largestBlobs(inputImage, totalBlobs=1)
+        memoryTime = time.perf_counter() - startTime
+        print("%-10s | %5s | %6s | %9.2f | %8.1f | %6.0f MB | %-34s" % (
+            "in memory", "-", "-", memoryTime, megaPixels / memoryTime, peakRssMb(),
+            "%d %s" % (blobs["Areas"][0], tuple(int(v) for v in blobs["Boxes"][0]))))
+
+        # Same area, box and mask:
+        for tileSize, blobResult, outputPath in tiledResults:
+            tiledMask = openImage(outputPath)
+            identicalResult = blobResult["Area"] == blobs["Areas"][0] and \
+                blobResult["Box"] == tuple(int(v) for v in blobs["Boxes"][0]) and \
+                np.array_equal(tiledMask, blobs["Mask"])
+            del tiledMask
+            print("Tile %d identical to the in-memory result: %s" % (tileSize, identicalResult))
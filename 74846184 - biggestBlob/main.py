@@ -1,7 +1,9 @@
 # File        :   main.py (Biggest Blob finder)
-# Version     :   1.0.0
+# Version     :   1.1.0
 # Description :   Script that finds and extracts the biggest binary blob
 #                 Answer for: https://stackoverflow.com/q/74846184/12728244
+#                 The blob is found by pixel area with one labeling pass
+#                 (blobFinder.py) or, as before, via contours.
 # Date:       :   Dec 21, 2022
 # Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
 # License     :   Creative Commons CC0
@@ -9,6 +11,8 @@
 import numpy as np
 import cv2
 
+from blobFinder import largestBlobs
+
 
 # Reads image via OpenCV:
 def readImage(imagePath):
@@ -29,6 +33,9 @@ def showImage(imageName, inputImage):
 # image path
 path = "D://opencvImages//"
 
+# Find the blob by pixel area via labeling (True) or by contour area (False):
+useLabelling = True
+
 # Reading an image in default mode:
 inputImage = readImage(path + "testBlob.png")
 
@@ -39,31 +46,38 @@ grayscaleImage = cv2.cvtColor(inputImage, cv2.COLOR_BGR2GRAY)
 # Note the image inversion:
 _, binaryImage = cv2.threshold(grayscaleImage, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
 
-# Store a copy of the input image:
-biggestBlob = binaryImage.copy()
-# Set initial values for the
-# largest contour:
-largestArea = 0
-largestContourIndex = 0
-
-# Find the contours on the binary image:
-contours, hierarchy = cv2.findContours(binaryImage, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
-
-# Get the largest contour in the contours list:
-for i, cc in enumerate(contours):
-    # Find the area of the contour:
-    area = cv2.contourArea(cc)
-    # Store the index of the largest contour:
-    if area > largestArea:
-        largestArea = area
-        largestContourIndex = i
-
-# Once we get the biggest blob, paint it black:
-tempMat = binaryImage.copy()
-cv2.drawContours(tempMat, contours, largestContourIndex, (0, 0, 0), -1, 8, hierarchy)
-
-# Erase smaller blobs:
-biggestBlob = biggestBlob - tempMat
+if useLabelling:
+    # Label once, keep the biggest blob (pixel area, holes not counted):
+    blobs = largestBlobs(binaryImage, totalBlobs=1)
+    biggestBlob = blobs["Mask"]
+    print("Biggest blob area: " + str(blobs["Areas"][0]) + ", box: " + str(blobs["Boxes"][0]))
+
+else:
+    # Store a copy of the input image:
+    biggestBlob = binaryImage.copy()
+    # Set initial values for the
+    # largest contour:
+    largestArea = 0
+    largestContourIndex = 0
+
+    # Find the contours on the binary image:
+    contours, hierarchy = cv2.findContours(binaryImage, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+
+    # Get the largest contour in the contours list:
+    for i, cc in enumerate(contours):
+        # Find the area of the contour:
+        area = cv2.contourArea(cc)
+        # Store the index of the largest contour:
+        if area > largestArea:
+            largestArea = area
+            largestContourIndex = i
+
+    # Once we get the biggest blob, paint it black:
+    tempMat = binaryImage.copy()
+    cv2.drawContours(tempMat, contours, largestContourIndex, (0, 0, 0), -1, 8, hierarchy)
+
+    # Erase smaller blobs:
+    biggestBlob = biggestBlob - tempMat
 
 # Show the result:
 showImage("biggestBlob", biggestBlob)
\ No newline at end of file
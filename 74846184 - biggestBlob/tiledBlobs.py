@@ -0,0 +1,276 @@
+# File        :   tiledBlobs.py (Out-of-core Biggest Blob finder)
+# Version     :   1.1.1
+# Description :   Biggest blob of binary images that do not fit in memory. The
+#                 image is read from a memory-mapped file (.npy or raw uint8)
+#                 tile by tile. Every tile is labeled on its own; after each row
+#                 of tiles the labels are merged across the seams (union-find)
+#                 and compacted, keeping only the components that touch the
+#                 bottom seam and the running biggest one. A second pass labels
+#                 again only the tiles of the winner and writes its mask into an
+#                 output map. Same result as largestBlobs of blobFinder.py.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import mmap
+import time
+
+import numpy as np
+import cv2
+
+
+# Maps an image without reading it. ".npy" files carry their own shape,
+# raw files need imageShape = (height, width):
+def openImage(imagePath, imageShape=None, mode="r"):
+    if imagePath.endswith(".npy"):
+        return np.load(imagePath, mmap_mode=mode)
+    if imageShape is None:
+        raise ValueError("openImage>> Error: Raw images need the image shape.")
+    return np.memmap(imagePath, dtype=np.uint8, mode=mode, shape=tuple(imageShape))
+
+
+# Creates a zero (sparse) image on disk (".npy" or raw):
+def createImage(imagePath, imageShape):
+    if imagePath.endswith(".npy"):
+        return np.lib.format.open_memmap(imagePath, mode="w+", dtype=np.uint8, shape=tuple(imageShape))
+    return np.memmap(imagePath, dtype=np.uint8, mode="w+", shape=tuple(imageShape))
+
+
+# Drops the rows [start, stop) of a mapped image from the resident memory
+# of this process (no-op where madvise is not available or the image is not
+# mapped). The map is the first mmap in the chain of array bases:
+def releaseRows(mappedImage, start, stop):
+    mapBuffer = mappedImage.base
+    while isinstance(mapBuffer, np.ndarray):
+        mapBuffer = mapBuffer.base
+    if not hasattr(mmap, "MADV_DONTNEED") or not isinstance(mapBuffer, mmap.mmap):
+        return
+    mapAddress = np.frombuffer(mapBuffer, np.uint8).ctypes.data
+    rangeStart = mappedImage[start].ctypes.data - mapAddress
+    rangeEnd = mappedImage[stop - 1].ctypes.data - mapAddress + mappedImage[stop - 1].nbytes
+    rangeStart -= rangeStart % mmap.PAGESIZE
+    mapBuffer.madvise(mmap.MADV_DONTNEED, rangeStart, rangeEnd - rangeStart)
+
+
+# Labels one tile (same algorithm as largestBlobs):
+def labelTile(tileImage, connectivity):
+    return cv2.connectedComponentsWithStatsWithAlgorithm(tileImage, connectivity, cv2.CV_32S, cv2.CCL_GRANA)
+
+
+# Gets the pairs of foreground labels that touch across a seam, given the
+# labels on both sides of it (0: background). 8-connectivity also joins the
+# diagonal neighbors:
+def seamPairs(sideLabels, otherLabels, connectivity):
+    seamOffsets = [0] if connectivity == 4 else [-1, 0, 1]
+    labelPairs = []
+    for offset in seamOffsets:
+        a = sideLabels[max(0, -offset):len(sideLabels) - max(0, offset)]
+        b = otherLabels[max(0, offset):len(otherLabels) - max(0, -offset)]
+        touching = (a > 0) & (b > 0)
+        labelPairs.append(np.column_stack((a[touching], b[touching])))
+    return np.concatenate(labelPairs)
+
+
+# Union-find over the seam pairs (hooking of the roots to the smallest one
+# and pointer jumping, vectorized). Returns the root of every label:
+def unionFind(totalLabels, labelPairs):
+    labelRoots = np.arange(totalLabels, dtype=np.int64)
+    labelPairs = np.unique(labelPairs, axis=0) if len(labelPairs) else labelPairs
+    while len(labelPairs):
+        rootsA, rootsB = labelRoots[labelPairs[:, 0]], labelRoots[labelPairs[:, 1]]
+        joined = rootsA != rootsB
+        if not joined.any():
+            break
+        # Hook both roots to the smaller one:
+        rootsA, rootsB = rootsA[joined], rootsB[joined]
+        smallerRoots = np.minimum(rootsA, rootsB)
+        np.minimum.at(labelRoots, rootsA, smallerRoots)
+        np.minimum.at(labelRoots, rootsB, smallerRoots)
+        # Pointer jumping until every label points at its root:
+        while True:
+            nextRoots = labelRoots[labelRoots]
+            if np.array_equal(nextRoots, labelRoots):
+                break
+            labelRoots = nextRoots
+        labelPairs = labelPairs[joined]
+    return labelRoots
+
+
+# Merges one row of tiles into the components that touched the previous
+# seam. labelAreas, labelBoxes ([x1, y1, x2, y2)) and labelMembers (label,
+# tileY, tileX, tile label) cover the active labels (1 to A) followed by the
+# labels of the row. Returns the root of every label and the per root areas
+# and boxes:
+def mergeLabels(labelAreas, labelBoxes, labelPairs):
+    totalLabels = len(labelAreas)
+    labelRoots = unionFind(totalLabels, labelPairs)
+    rootAreas = np.bincount(labelRoots[1:], weights=labelAreas[1:], minlength=totalLabels).astype(np.int64)
+    rootBoxes = np.empty((totalLabels, 4), np.int64)
+    rootBoxes[:, :2] = np.iinfo(np.int64).max
+    rootBoxes[:, 2:] = -1
+    np.minimum.at(rootBoxes[:, 0], labelRoots[1:], labelBoxes[1:, 0])
+    np.minimum.at(rootBoxes[:, 1], labelRoots[1:], labelBoxes[1:, 1])
+    np.maximum.at(rootBoxes[:, 2], labelRoots[1:], labelBoxes[1:, 2])
+    np.maximum.at(rootBoxes[:, 3], labelRoots[1:], labelBoxes[1:, 3])
+    return labelRoots, rootAreas, rootBoxes
+
+
+# Order key of a component as in the single labeling: its first 2 x 2 block
+# in raster order (tiles aligned to the blocks). componentMembers holds its
+# (tileY, tileX, tile label) rows. Only computed for the components tied on
+# the biggest area:
+def firstBlockKey(inputImage, componentMembers, tileSize, connectivity):
+    (imageHeight, imageWidth) = inputImage.shape[:2]
+    blocksPerRow = (imageWidth + 1) // 2
+    firstKey = None
+    for tileY, tileX in np.unique(componentMembers[:, :2], axis=0):
+        localLabels = componentMembers[(componentMembers[:, 0] == tileY) & (componentMembers[:, 1] == tileX), 2]
+        tileHeight, tileWidth = min(tileSize, imageHeight - tileY), min(tileSize, imageWidth - tileX)
+        tileImage = np.ascontiguousarray(inputImage[tileY:tileY + tileHeight, tileX:tileX + tileWidth])
+        _, labelImage, _, _ = labelTile(tileImage, connectivity)
+        pixelY, pixelX = np.nonzero(np.isin(labelImage, localLabels))
+        tileKey = np.min(((tileY + pixelY) // 2) * blocksPerRow + (tileX + pixelX) // 2)
+        firstKey = tileKey if firstKey is None else min(firstKey, tileKey)
+    return firstKey
+
+
+# First pass, one row of tiles at a time: every tile is labeled, the row is
+# merged (union-find) with the components touching the previous seam and
+# the labels are compacted. A component that no longer touches the seam is
+# complete: it replaces the running best if it is bigger (ties as in the
+# single labeling) and is dropped otherwise. Only the active components and
+# the best one are kept (areas, boxes and their tile labels), so the memory
+# is bounded by the tile row, not by the number of components. Returns the
+# best component: area, box [x1, y1, x2, y2) and members (tileY, tileX, tile
+# label), or None for an empty image:
+def scanTiles(inputImage, tileSize, connectivity):
+    (imageHeight, imageWidth) = inputImage.shape[:2]
+    # Active components (label 0 is the background):
+    activeAreas, activeBoxes = np.zeros(1, np.int64), np.zeros((1, 4), np.int64)
+    activeMembers = np.zeros((0, 4), np.int64)
+    previousBottom = np.zeros(imageWidth, np.int64)
+    bestBlob = None
+
+    for tileY in range(0, imageHeight, tileSize):
+        tileHeight = min(tileSize, imageHeight - tileY)
+        labelAreas, labelBoxes, labelMembers = [activeAreas], [activeBoxes], [activeMembers]
+        seamLabelPairs = []
+        totalLabels = len(activeAreas)
+        currentTop = np.zeros(imageWidth, np.int64)
+        currentBottom = np.zeros(imageWidth, np.int64)
+        previousRight = None
+
+        for tileX in range(0, imageWidth, tileSize):
+            tileWidth = min(tileSize, imageWidth - tileX)
+            tileImage = np.ascontiguousarray(inputImage[tileY:tileY + tileHeight, tileX:tileX + tileWidth])
+            tileLabels, labelImage, tileStats, _ = labelTile(tileImage, connectivity)
+
+            # Row labels: tile labels + offset (0 stays background):
+            globalLabels = np.arange(tileLabels, dtype=np.int64) + totalLabels - 1
+            globalLabels[0] = 0
+            totalLabels += tileLabels - 1
+
+            labelAreas.append(tileStats[1:, cv2.CC_STAT_AREA].astype(np.int64))
+            tileBoxes = tileStats[1:, :4].astype(np.int64)
+            tileBoxes[:, 0] += tileX
+            tileBoxes[:, 1] += tileY
+            tileBoxes[:, 2:] += tileBoxes[:, :2]
+            labelBoxes.append(tileBoxes)
+            localLabels = np.arange(1, tileLabels, dtype=np.int64)
+            labelMembers.append(np.column_stack((globalLabels[1:], np.full_like(localLabels, tileY),
+                                                 np.full_like(localLabels, tileX), localLabels)))
+
+            # Seam labels (left column against the previous tile):
+            leftColumn = globalLabels[labelImage[:, 0]]
+            if previousRight is not None:
+                seamLabelPairs.append(seamPairs(previousRight, leftColumn, connectivity))
+            previousRight = globalLabels[labelImage[:, -1]]
+            currentTop[tileX:tileX + tileWidth] = globalLabels[labelImage[0]]
+            currentBottom[tileX:tileX + tileWidth] = globalLabels[labelImage[-1]]
+
+        # Seam against the previous tile row (full width, tile corners included):
+        seamLabelPairs.append(seamPairs(previousBottom, currentTop, connectivity))
+
+        # Keep the resident memory bounded:
+        releaseRows(inputImage, tileY, tileY + tileHeight)
+
+        # Merge the row into the active components:
+        labelMembers = np.concatenate(labelMembers)
+        labelRoots, rootAreas, rootBoxes = mergeLabels(np.concatenate(labelAreas), np.concatenate(labelBoxes),
+                                                       np.concatenate(seamLabelPairs))
+        memberRoots = labelRoots[labelMembers[:, 0]]
+
+        # The components off the new seam (all of them after the last row) are complete:
+        lastRow = tileY + tileHeight == imageHeight
+        activeRoots = np.zeros(0, np.int64) if lastRow else np.unique(labelRoots[currentBottom])
+        activeRoots = activeRoots[activeRoots > 0]
+        completeRoots = np.setdiff1d(np.unique(labelRoots[1:]), activeRoots)
+        if len(completeRoots):
+            # Biggest complete area, ties with each other and with the best:
+            maxArea = rootAreas[completeRoots].max()
+            tiedRoots = completeRoots[rootAreas[completeRoots] == maxArea]
+            if bestBlob is None or maxArea >= bestBlob["Area"]:
+                tiedBlobs = [{"Area": int(maxArea), "Box": rootBoxes[r], "Members": labelMembers[memberRoots == r, 1:],
+                              "Key": None} for r in tiedRoots]
+                if bestBlob is not None and maxArea == bestBlob["Area"]:
+                    tiedBlobs.append(bestBlob)
+                if len(tiedBlobs) > 1:
+                    for tiedBlob in tiedBlobs:
+                        if tiedBlob["Key"] is None:
+                            tiedBlob["Key"] = firstBlockKey(inputImage, tiedBlob["Members"], tileSize, connectivity)
+                    tiedBlobs.sort(key=lambda b: b["Key"])
+                bestBlob = tiedBlobs[0]
+
+        # Compact the active labels to 1..A:
+        compactLabels = np.zeros(len(labelRoots), np.int64)
+        compactLabels[activeRoots] = np.arange(1, len(activeRoots) + 1)
+        activeAreas = np.concatenate(([0], rootAreas[activeRoots]))
+        activeBoxes = np.concatenate((np.zeros((1, 4), np.int64), rootBoxes[activeRoots]))
+        activeMembers = labelMembers[compactLabels[memberRoots] > 0]
+        activeMembers[:, 0] = compactLabels[labelRoots[activeMembers[:, 0]]]
+        previousBottom = compactLabels[labelRoots[currentBottom]]
+
+    return bestBlob
+
+
+# Gets the biggest blob of a mapped binary image (path or array, tiles of
+# tileSize x tileSize, even). Its mask (maskValue) is written into a new
+# image at outputPath (optional). Returns the area, the box (x, y, w, h)
+# and the timings:
+def largestBlobTiled(inputPath, imageShape=None, tileSize=2048, connectivity=8, outputPath=None, maskValue=255):
+    if tileSize % 2:
+        raise ValueError("largestBlobTiled>> Error: The tile size must be even (2 x 2 label blocks).")
+    inputImage = openImage(inputPath, imageShape) if isinstance(inputPath, str) else inputPath
+    (imageHeight, imageWidth) = inputImage.shape[:2]
+
+    # First pass, labels, seams and union-find per row of tiles:
+    startTime = time.perf_counter()
+    bestBlob = scanTiles(inputImage, tileSize, connectivity)
+    scanTime = time.perf_counter() - startTime
+    if bestBlob is None:
+        return {"Area": 0, "Box": None, "ScanSeconds": scanTime, "Seconds": time.perf_counter() - startTime}
+
+    # Second pass, only the tiles of the component:
+    if outputPath is not None:
+        outputImage = createImage(outputPath, (imageHeight, imageWidth))
+        blobMembers = bestBlob["Members"]
+        for tileY, tileX in np.unique(blobMembers[:, :2], axis=0):
+            tileHeight, tileWidth = min(tileSize, imageHeight - tileY), min(tileSize, imageWidth - tileX)
+            tileImage = np.ascontiguousarray(inputImage[tileY:tileY + tileHeight, tileX:tileX + tileWidth])
+            _, labelImage, _, _ = labelTile(tileImage, connectivity)
+            # Tile label -> mask value lookup:
+            localLabels = blobMembers[(blobMembers[:, 0] == tileY) & (blobMembers[:, 1] == tileX), 2]
+            tileValues = np.zeros(labelImage.max() + 1, np.uint8)
+            tileValues[localLabels] = maskValue
+            outputImage[tileY:tileY + tileHeight, tileX:tileX + tileWidth] = np.take(tileValues, labelImage)
+            releaseRows(inputImage, tileY, tileY + tileHeight)
+            releaseRows(outputImage, tileY, tileY + tileHeight)
+        outputImage.flush()
+        del outputImage
+
+    x1, y1, x2, y2 = bestBlob["Box"]
+    return {"Area": bestBlob["Area"],
+            "Box": (int(x1), int(y1), int(x2 - x1), int(y2 - y1)),
+            "ScanSeconds": scanTime,
+            "Seconds": time.perf_counter() - startTime}
@@ -0,0 +1,153 @@
+# File        :   batchBorders.py (Batch Border Removal over Image Stacks)
+# Version     :   1.2.0
+# Description :   Removes the borders of every frame of a memory-mapped stack
+#                 (.npy or raw uint8, N x H x W) with a pool of processes. Each
+#                 worker maps the input and the preallocated output stack itself
+#                 (mmap), reads frames as views (no copies) and writes the cleaned
+#                 frames straight into the output map. Reports frames per second and the
+#                 peak resident memory of the main process and the workers.
+#                 removalMethod picks the engine: "FloodFill" or "Components".
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import mmap
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from borderRemoval import removeBordersFloodFill, removeBordersComponents
+
+# Border removal engines:
+removalMethods = {"FloodFill": removeBordersFloodFill, "Components": removeBordersComponents}
+
+# Stacks mapped by this process (worker state):
+workerStacks = {}
+
+
+# Peak resident set size of this process in MB (None if not available,
+# e.g. on Windows):
+def peakRssMb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB on Linux:
+    return maxRss / 2 ** 20 if sys.platform == "darwin" else maxRss / 2 ** 10
+
+
+# Maps a stack without reading it. ".npy" files carry their own shape,
+# raw files need frameShape = (height, width):
+def openStack(stackPath, frameShape=None, mode="r"):
+    if stackPath.endswith(".npy"):
+        return np.load(stackPath, mmap_mode=mode)
+    if frameShape is None:
+        raise ValueError("openStack>> Error: Raw stacks need the frame shape.")
+    return np.memmap(stackPath, dtype=np.uint8, mode=mode).reshape((-1,) + tuple(frameShape))
+
+
+# Preallocates an output stack on disk (".npy" or raw):
+def createStack(stackPath, totalFrames, frameShape):
+    stackShape = (totalFrames,) + tuple(frameShape)
+    if stackPath.endswith(".npy"):
+        return np.lib.format.open_memmap(stackPath, mode="w+", dtype=np.uint8, shape=stackShape)
+    return np.memmap(stackPath, dtype=np.uint8, mode="w+", shape=stackShape)
+
+
+# Maps a stack with mmap (".npy" or raw, as openStack). Returns the frames
+# as an array over the map and the map itself (for releaseFrames):
+def mapStack(stackPath, frameShape=None, writable=False):
+    if not stackPath.endswith(".npy") and frameShape is None:
+        raise ValueError("mapStack>> Error: Raw stacks need the frame shape.")
+
+    with open(stackPath, "r+b" if writable else "rb") as stackFile:
+        # Shape, type and data offset from the ".npy" header:
+        stackShape, stackType, dataOffset = (-1,) + tuple(frameShape or ()), np.uint8, 0
+        if stackPath.endswith(".npy"):
+            if np.lib.format.read_magic(stackFile) == (1, 0):
+                stackShape, _, stackType = np.lib.format.read_array_header_1_0(stackFile)
+            else:
+                stackShape, _, stackType = np.lib.format.read_array_header_2_0(stackFile)
+            dataOffset = stackFile.tell()
+        mapBuffer = mmap.mmap(stackFile.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+    mappedStack = np.frombuffer(mapBuffer, stackType, offset=dataOffset).reshape(stackShape)
+    return mappedStack, mapBuffer
+
+
+# Drops the frames [start, stop) of a mapped stack from the resident memory
+# of this process (the data stays in the file / page cache). Without it the
+# mapped pages of every processed frame add up in the RSS. No-op where
+# madvise is not available (e.g. Windows):
+def releaseFrames(mapBuffer, mappedStack, start, stop):
+    if not hasattr(mmap, "MADV_DONTNEED"):
+        return
+    mapAddress = np.frombuffer(mapBuffer, np.uint8).ctypes.data
+    # Byte range of the frames in the map, aligned to the memory pages:
+    rangeStart = mappedStack[start].ctypes.data - mapAddress
+    rangeEnd = mappedStack[stop - 1].ctypes.data - mapAddress + mappedStack[stop - 1].nbytes
+    rangeStart -= rangeStart % mmap.PAGESIZE
+    mapBuffer.madvise(mmap.MADV_DONTNEED, rangeStart, rangeEnd - rangeStart)
+
+
+# Worker initializer, maps both stacks once per process:
+def initWorker(inputPath, outputPath, frameShape, removalMethod="FloodFill"):
+    workerStacks["Removal"] = removalMethods[removalMethod]
+    workerStacks["Input"], workerStacks["InputMap"] = mapStack(inputPath, frameShape)
+    workerStacks["Output"], workerStacks["OutputMap"] = mapStack(outputPath, frameShape, writable=True)
+
+
+# Processes the frames [start, stop), returns the frame count and the
+# peak RSS of the worker:
+def processChunk(frameRange):
+    inputStack, outputStack = workerStacks["Input"], workerStacks["Output"]
+    removeBorders = workerStacks["Removal"]
+    start, stop = frameRange
+    for i in range(start, stop):
+        # Input view in, result written into the output map:
+        removeBorders(inputStack[i], outputImage=outputStack[i])
+
+    # Keep the resident memory bounded:
+    releaseFrames(workerStacks["InputMap"], inputStack, start, stop)
+    releaseFrames(workerStacks["OutputMap"], outputStack, start, stop)
+    return stop - start, peakRssMb()
+
+
+# Removes the borders of all the frames of inputPath into a new stack at
+# outputPath. totalWorkers = 0 runs in this process. Returns the stats:
+def processStack(inputPath, outputPath, frameShape=None, totalWorkers=4, chunkSize=32, removalMethod="FloodFill"):
+    if removalMethod not in removalMethods:
+        raise ValueError("processStack>> Error: Unknown removal method: " + str(removalMethod))
+    inputStack = openStack(inputPath, frameShape, "r")
+    (totalFrames, frameHeight, frameWidth) = inputStack.shape
+    outputStack = createStack(outputPath, totalFrames, (frameHeight, frameWidth))
+    outputStack.flush()
+    del outputStack
+
+    frameRanges = [(s, min(s + chunkSize, totalFrames)) for s in range(0, totalFrames, chunkSize)]
+    workerPeaks = []
+
+    startTime = time.perf_counter()
+    if totalWorkers == 0:
+        initWorker(inputPath, outputPath, (frameHeight, frameWidth), removalMethod)
+        for frameRange in frameRanges:
+            processChunk(frameRange)
+        workerStacks["OutputMap"].flush()
+        workerStacks.clear()
+    else:
+        with Pool(totalWorkers, initializer=initWorker,
+                  initargs=(inputPath, outputPath, (frameHeight, frameWidth), removalMethod)) as workerPool:
+            for _, workerPeak in workerPool.imap_unordered(processChunk, frameRanges):
+                workerPeaks.append(workerPeak)
+    elapsedTime = time.perf_counter() - startTime
+
+    workerPeaks = [p for p in workerPeaks if p is not None]
+    return {"Frames": totalFrames,
+            "Seconds": elapsedTime,
+            "Fps": totalFrames / elapsedTime,
+            "PeakRssMb": peakRssMb(),
+            "WorkerPeakRssMb": max(workerPeaks) if workerPeaks else None}
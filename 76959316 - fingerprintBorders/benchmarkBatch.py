@@ -0,0 +1,65 @@
+# File        :   benchmarkBatch.py (Batch Border Removal Benchmark)
+# Version     :   1.0.0
+# Description :   Builds a synthetic stack of 500 dpi prints (.npy and raw), runs
+#                 the batch border removal with different worker counts and
+#                 reports frames per second and peak RSS. The output stack must
+#                 match the frame by frame in-memory result.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import os
+import tempfile
+
+import numpy as np
+
+from batchBorders import processStack, openStack, createStack, peakRssMb
+from borderRemoval import removeBordersFloodFill
+from syntheticPrints import makePrintStack
+
+# Stack size (frames of 750 x 800, ~0.6 MB each):
+totalFrames = 512
+frameShape = (800, 750)
+workerCounts = [0, 1, 2, 4]
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as stackFolder:
+        # Write the input stacks (.npy and raw), frames generated in place:
+        npyPath = os.path.join(stackFolder, "prints.npy")
+        rawPath = os.path.join(stackFolder, "prints.raw")
+        inputStack = createStack(npyPath, totalFrames, frameShape)
+        makePrintStack(totalFrames, frameShape[1], frameShape[0], outputStack=inputStack)
+        inputStack.flush()
+        inputStack.tofile(rawPath)
+        del inputStack
+
+        print("Stack: %d frames of %d x %d (%.0f MB), main process RSS before: %.0f MB" % (
+            totalFrames, frameShape[1], frameShape[0], totalFrames * frameShape[0] * frameShape[1] / 2 ** 20,
+            peakRssMb()))
+        print("%-5s | %7s | %8s | %9s | %15s" % ("stack", "workers", "fps", "time (s)", "worker RSS (MB)"))
+
+        # Reference result, 16 frames checked:
+        inputStack = openStack(npyPath)
+        checkFrames = np.linspace(0, totalFrames - 1, 16).astype(int)
+        referenceFrames = [removeBordersFloodFill(np.array(inputStack[i])) for i in checkFrames]
+        del inputStack
+
+        allMatch = True
+        for stackName, inputPath in [("npy", npyPath), ("raw", rawPath)]:
+            for totalWorkers in workerCounts:
+                outputPath = os.path.join(stackFolder, "clean-%d.%s" % (totalWorkers, stackName))
+                batchStats = processStack(inputPath, outputPath, frameShape, totalWorkers)
+
+                outputStack = openStack(outputPath, frameShape)
+                allMatch &= all(np.array_equal(outputStack[i], r) for i, r in zip(checkFrames, referenceFrames))
+                del outputStack
+                os.remove(outputPath)
+
+                workerRss = batchStats["WorkerPeakRssMb"]
+                print("%-5s | %7d | %8.1f | %9.2f | %15s" % (stackName, totalWorkers, batchStats["Fps"],
+                                                             batchStats["Seconds"],
+                                                             "-" if workerRss is None else "%.0f" % workerRss))
+
+        print("Main process peak RSS: %.0f MB" % peakRssMb())
+        print("Output matches the in-memory result: %s" % allMatch)
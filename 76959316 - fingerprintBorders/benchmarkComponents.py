@@ -0,0 +1,99 @@
+# File        :   benchmarkComponents.py (Border Removal Engines Benchmark)
+# Version     :   1.0.0
+# Description :   Milliseconds per frame and IoU against the ground truth border
+#                 mask of three border removal engines: the per-pixel loop and
+#                 BGR flood fill of main.py, the flood fill of borderRemoval.py
+#                 and the connected components engine (one labeling pass, one
+#                 label lookup). Frames: TIMu6.jpg (ground truth: the main.py
+#                 fill), synthetic prints and synthetic prints shifted down so
+#                 the border arc misses the top band.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from borderRemoval import removeBordersFloodFill, removeBordersComponents
+from syntheticPrints import makePrint
+
+
+# The border removal of main.py (per-pixel transition loop, flood fill on a
+# BGR copy), returning the binary image without the red pixels:
+def removeBordersLoop(grayImage, heightDivision=4):
+    binaryImage = cv2.threshold(grayImage, 0, 255, cv2.THRESH_OTSU + cv2.THRESH_BINARY)[1]
+    bgrCopy = cv2.cvtColor(binaryImage, cv2.COLOR_GRAY2BGR)
+
+    imageWidth = binaryImage.shape[1]
+    heightPortion = binaryImage.shape[0] // heightDivision
+    reducedImage = cv2.reduce(binaryImage[0:heightPortion], 0, cv2.REDUCE_MAX)
+
+    pastPixel = 0
+    pixelCoordinates = []
+    for i in range(imageWidth):
+        currentPixel = reducedImage[0][i]
+        if currentPixel == 255 and pastPixel == 0:
+            pixelCoordinates.append(i)
+        elif currentPixel == 0 and pastPixel == 255:
+            pixelCoordinates.append(i - 1)
+        pastPixel = currentPixel
+
+    for x in pixelCoordinates:
+        cv2.floodFill(bgrCopy, None, (x, heightPortion), (0, 0, 255))
+
+    redPixels = (bgrCopy[:, :, 2] == 255) & (bgrCopy[:, :, 0] == 0)
+    binaryImage[redPixels] = 0
+    return binaryImage
+
+
+# Shifts a frame and its mask down (background on top), so the border
+# starts below the top band:
+def shiftDown(frameImage, borderMask, shiftRows):
+    shiftedFrame = np.full_like(frameImage, 20)
+    shiftedFrame[shiftRows:] = frameImage[:-shiftRows]
+    shiftedMask = np.zeros_like(borderMask)
+    shiftedMask[shiftRows:] = borderMask[:-shiftRows]
+    return shiftedFrame, shiftedMask
+
+
+# Intersection over union of two boolean masks:
+def maskIou(maskA, maskB):
+    unionPixels = np.count_nonzero(maskA | maskB)
+    return 1.0 if unionPixels == 0 else np.count_nonzero(maskA & maskB) / unionPixels
+
+
+# Frames per synthetic set, timing repeats:
+totalPrints = 20
+timingRepeats = 5
+
+# Test sets: (gray frame, ground truth border mask):
+realImage = cv2.imread("TIMu6.jpg", cv2.IMREAD_GRAYSCALE)
+realBinary = cv2.threshold(realImage, 0, 255, cv2.THRESH_OTSU + cv2.THRESH_BINARY)[1]
+realMask = realBinary != removeBordersLoop(realImage)
+syntheticPrints = [makePrint(randomSeed=i) for i in range(totalPrints)]
+testSets = {"TIMu6.jpg": [(realImage, realMask)],
+            "synthetic": syntheticPrints,
+            "shifted down": [shiftDown(f, m, 240) for f, m in syntheticPrints]}
+
+removalEngines = [("main.py loop", removeBordersLoop),
+                  ("flood fill", removeBordersFloodFill),
+                  ("components", removeBordersComponents)]
+
+print("%-12s | %-12s | %8s | %8s | %8s" % ("frames", "engine", "ms/frame", "mean IoU", "min IoU"))
+for setName, testFrames in testSets.items():
+    for engineName, removeBorders in removalEngines:
+        frameIous, frameTimes = [], []
+        for grayImage, borderMask in testFrames:
+            binaryImage = cv2.threshold(grayImage, 0, 255, cv2.THRESH_OTSU + cv2.THRESH_BINARY)[1]
+            startTime = time.perf_counter()
+            for _ in range(timingRepeats):
+                outputImage = removeBorders(grayImage)
+            frameTimes.append((time.perf_counter() - startTime) / timingRepeats)
+            # Removed pixels against the ground truth:
+            frameIous.append(maskIou(binaryImage != outputImage, borderMask & (binaryImage > 0)))
+
+        print("%-12s | %-12s | %8.2f | %8.3f | %8.3f" % (setName, engineName, 1e3 * np.mean(frameTimes),
+                                                         np.mean(frameIous), np.min(frameIous)))
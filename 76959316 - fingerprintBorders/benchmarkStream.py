@@ -0,0 +1,74 @@
+# File        :   benchmarkStream.py (Sensor Stream Border Removal Benchmark)
+# Version     :   1.0.0
+# Description :   Per-frame latency percentiles of the border removal on a
+#                 synthetic sensor stream: everything computed on every frame
+#                 (borderRemoval.py) against the stream mode of borderStream.py
+#                 (cached threshold and seeds). Also reports the cached frames,
+#                 the failed checks, the border IoU against the ground truth and
+#                 the pixels that differ from the full recompute.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from borderRemoval import removeBordersFloodFill
+from borderStream import createStream, processFrame
+from syntheticPrints import makePrintStream
+
+# Stream length and finger placement interval (frames):
+totalFrames = 400
+placementInterval = 100
+
+# Latency percentiles:
+latencyPercentiles = [50, 90, 99, 100]
+
+
+# Intersection over union of two boolean masks:
+def maskIou(maskA, maskB):
+    unionPixels = np.count_nonzero(maskA | maskB)
+    return 1.0 if unionPixels == 0 else np.count_nonzero(maskA & maskB) / unionPixels
+
+
+# The stream is generated before timing:
+streamFrames = list(makePrintStream(totalFrames, placementInterval=placementInterval))
+totalPlacements = sum(placementChanged for _, _, placementChanged in streamFrames)
+print("Stream: %d frames of 750 x 800, %d finger placements" % (totalFrames, totalPlacements))
+
+# Full recompute on every frame:
+fullTimes, fullOutputs = [], []
+for grayImage, _, _ in streamFrames:
+    startTime = time.perf_counter()
+    fullOutputs.append(removeBordersFloodFill(grayImage))
+    fullTimes.append(time.perf_counter() - startTime)
+
+# Stream mode:
+stream = createStream()
+streamTimes, borderIous, differentPixels = [], [], []
+for (grayImage, borderMask, _), fullOutput in zip(streamFrames, fullOutputs):
+    startTime = time.perf_counter()
+    outputImage, frameMode = processFrame(stream, grayImage)
+    streamTimes.append(time.perf_counter() - startTime)
+
+    # Removed pixels against the ground truth (on the thresholded frame):
+    binaryImage = cv2.threshold(grayImage, stream["Threshold"], 255, cv2.THRESH_BINARY)[1] > 0
+    borderIous.append(maskIou(binaryImage & (outputImage == 0), binaryImage & borderMask))
+    differentPixels.append(np.mean(outputImage != fullOutput))
+
+print("%-14s | " % "mode" + " | ".join("%7s" % ("p%d ms" % p if p < 100 else "max ms") for p in latencyPercentiles)
+      + " | %7s" % "mean ms")
+for modeName, modeTimes in [("full recompute", fullTimes), ("stream", streamTimes)]:
+    modePercentiles = np.percentile(1e3 * np.array(modeTimes), latencyPercentiles)
+    print("%-14s | " % modeName + " | ".join("%7.3f" % t for t in modePercentiles) +
+          " | %7.3f" % (1e3 * np.mean(modeTimes)))
+
+streamStats = stream["Stats"]
+print("Cached frames: %d / %d (threshold check fails: %d, seed check fails: %d)" % (
+    streamStats["Cached"], streamStats["Frames"], streamStats["ThresholdFails"], streamStats["SeedFails"]))
+print("Border IoU vs ground truth: mean %.4f, min %.4f" % (np.mean(borderIous), np.min(borderIous)))
+print("Pixels different from the full recompute: mean %.3f%%, max %.3f%%" % (100 * np.mean(differentPixels),
+                                                                          100 * np.max(differentPixels)))
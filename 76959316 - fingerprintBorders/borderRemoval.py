@@ -0,0 +1,119 @@
+# File        :   borderRemoval.py (Fingerprint Border Removal)
+# Version     :   1.2.0
+# Description :   The border removal of main.py as a function for batch use: Otsu
+#                 threshold, the top portion reduced to a row, the first/last
+#                 white pixel of each run as seeds and a flood fill at each seed
+#                 (height of the first portion). The borders are filled with black
+#                 on the binary image. A connected components engine labels the
+#                 binary image once and removes the outermost components seen
+#                 from the frame sides with one label lookup.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Gets the x coordinates of the first and the last white pixels of the white
+# runs in a reduced row (a run reaching the end of the row has no last pixel,
+# as in the loop of main.py):
+def rowRuns(reducedRow):
+    whitePixels = reducedRow == 255
+    pastPixels = np.concatenate(([False], whitePixels[:-1]))
+    # Black to white, first white pixel:
+    firstPixels = np.flatnonzero(whitePixels & ~pastPixels)
+    # White to black, last white pixel:
+    lastPixels = np.flatnonzero(~whitePixels & pastPixels) - 1
+    return firstPixels, lastPixels
+
+
+# Gets the x coordinates of the first and last white pixels of every white
+# run in a reduced row (same transitions as the loop of main.py):
+def rowTransitions(reducedRow):
+    return np.sort(np.concatenate(rowRuns(reducedRow)))
+
+
+# Removes the borders of a grayscale fingerprint, returns the binary image
+# without them. outputImage (optional) receives the result:
+def removeBordersFloodFill(grayImage, heightDivision=4, fillValue=0, outputImage=None):
+    # Get binary image:
+    _, binaryImage = cv2.threshold(grayImage, 0, 255, cv2.THRESH_OTSU + cv2.THRESH_BINARY, dst=outputImage)
+
+    # Reduce the first portion to a row:
+    (imageHeight, imageWidth) = binaryImage.shape[:2]
+    heightPortion = imageHeight // heightDivision
+    reducedImage = cv2.reduce(binaryImage[0:heightPortion], 0, cv2.REDUCE_MAX)
+
+    # Flood fill at each transition, one portion down:
+    for x in rowTransitions(reducedImage[0]):
+        cv2.floodFill(binaryImage, None, (int(x), heightPortion), fillValue)
+
+    return binaryImage
+
+
+# Frame sides, scan axis and scan direction (reversed or not):
+frameSides = {"Top": (0, False), "Bottom": (0, True), "Left": (1, False), "Right": (1, True)}
+
+
+# Gets the labels to remove: the components first hit by the scan lines
+# coming from the selected frame sides (black padding is skipped) on at
+# least minCoverage of the side, and at least minThickness pixels thick
+# (thin scratches are kept):
+def borderLabels(binaryImage, labelImage, totalLabels, sides=("Top", "Left", "Right"), minCoverage=0.2,
+                 minThickness=1.0):
+    removeLabels = np.zeros(totalLabels, bool)
+
+    for side in sides:
+        scanAxis, reverseScan = frameSides[side]
+        sideBinary = np.flip(binaryImage, scanAxis) if reverseScan else binaryImage
+        sideLabels = np.flip(labelImage, scanAxis) if reverseScan else labelImage
+
+        # First white pixel of every scan line (label 0 if the line is empty):
+        firstHits = np.expand_dims(np.argmax(sideBinary, axis=scanAxis), scanAxis)
+        hitLabels = np.take_along_axis(sideLabels, firstHits, scanAxis).ravel()
+
+        # Scan lines won by each label:
+        sideCoverage = np.bincount(hitLabels, minlength=totalLabels) / len(hitLabels)
+        sideCandidates = np.flatnonzero(sideCoverage >= minCoverage)
+        sideCandidates = sideCandidates[sideCandidates > 0]
+
+        # A connected component is at least one pixel thick, only check the
+        # (few) candidates otherwise:
+        if minThickness > 1.0:
+            sideCandidates = [c for c in sideCandidates if
+                              componentThickness(labelImage == c) >= minThickness]
+        removeLabels[sideCandidates] = True
+
+    return removeLabels
+
+
+# Mean thickness of an elongated component mask: area over the longest
+# side of its bounding box:
+def componentThickness(componentMask):
+    componentPixels = cv2.findNonZero(componentMask.view(np.uint8))
+    _, _, boxWidth, boxHeight = cv2.boundingRect(componentPixels)
+    return len(componentPixels) / max(boxWidth, boxHeight)
+
+
+# Removes the borders of a grayscale fingerprint with connected components:
+# Otsu, one labeling pass, and the border components set to fillValue via a
+# label -> value lookup (one gather). Returns the binary image without them:
+def removeBordersComponents(grayImage, sides=("Top", "Left", "Right"), minCoverage=0.2, minThickness=1.0,
+                            connectivity=4, fillValue=0, outputImage=None):
+    # Get binary image:
+    _, binaryImage = cv2.threshold(grayImage, 0, 255, cv2.THRESH_OTSU + cv2.THRESH_BINARY)
+
+    # Label once:
+    totalLabels, labelImage = cv2.connectedComponents(binaryImage, connectivity=connectivity, ltype=cv2.CV_32S)
+    removeLabels = borderLabels(binaryImage, labelImage, totalLabels, sides, minCoverage, minThickness)
+
+    # Label -> output value lookup:
+    labelValues = np.full(totalLabels, 255, np.uint8)
+    labelValues[0] = 0
+    labelValues[removeLabels] = fillValue
+    if outputImage is None:
+        outputImage = np.empty_like(binaryImage)
+    np.take(labelValues, labelImage, out=outputImage)
+    return outputImage
@@ -0,0 +1,132 @@
+# File        :   borderStream.py (Fingerprint Border Removal on Sensor Streams)
+# Version     :   1.1.0
+# Description :   Frame-stream mode for the border removal of main.py. The flood
+#                 fill seeds (first/last white pixel of the runs of the reduced
+#                 top portion) and the Otsu threshold are cached. Each new frame
+#                 is thresholded with its own Otsu value (same binary image as
+#                 main.py), which must stay close to the cached one, and the
+#                 reduced top portion is computed only in small windows around
+#                 the cached seeds. Everything is computed again only when a
+#                 check fails (or every refreshInterval frames). A run that
+#                 splits between two cached seeds is not seen by the windows:
+#                 that frame keeps the old seeds.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+from borderRemoval import rowRuns
+
+
+# Creates the stream state dictionary:
+def createStream(heightDivision=4, thresholdTolerance=6, seedTolerance=3, refreshInterval=30):
+    streamParams = {"HeightDivision": heightDivision,  # Top portion: 1 / heightDivision of the frame
+                    "ThresholdTolerance": thresholdTolerance,  # Max change of the Otsu threshold
+                    "SeedTolerance": seedTolerance,  # Max seed displacement between frames (px)
+                    "RefreshInterval": refreshInterval}  # Full recompute every N cached frames (0: never)
+
+    stats = {"Frames": 0, "Cached": 0, "Full": 0, "ThresholdFails": 0, "SeedFails": 0}
+
+    return {"Params": streamParams, "Threshold": None, "FirstPixels": None, "LastPixels": None, "CachedFrames": 0,
+            "Stats": stats}
+
+
+# Relocates the cached seeds in the reduced top portion, reducing only the
+# windows of +/- seedTolerance pixels around them. Every window must hold
+# exactly one transition of its kind. Returns the new (first, last) pixels
+# or None:
+def relocateSeeds(binaryImage, heightPortion, firstPixels, lastPixels, seedTolerance):
+    imageWidth = binaryImage.shape[1]
+    windowOffsets = np.arange(-seedTolerance - 1, seedTolerance + 2)
+
+    # All the windows in one gather. Out of bounds columns: black on the left
+    # (as rowRuns), white on the right (a run reaching the end has no last
+    # pixel):
+    windowColumns = np.concatenate((firstPixels, lastPixels))[:, None] + windowOffsets
+    columnMax = binaryImage[0:heightPortion, np.clip(windowColumns, 0, imageWidth - 1).ravel()].max(axis=0)
+    whiteWindows = (columnMax.reshape(windowColumns.shape) == 255) & (windowColumns >= 0)
+    whiteWindows |= windowColumns >= imageWidth
+
+    # Transitions inside each window (index i: between columns i and i + 1):
+    risingEdges = whiteWindows[:, 1:] & ~whiteWindows[:, :-1]
+    fallingEdges = ~whiteWindows[:, 1:] & whiteWindows[:, :-1]
+    totalFirst = len(firstPixels)
+    windowEdges = np.concatenate((risingEdges[:totalFirst], fallingEdges[totalFirst:]))
+    if not np.all(windowEdges.sum(axis=1) == 1):
+        return None
+
+    # First pixel: right of the rising edge. Last pixel: left of the falling edge:
+    edgeIndex = np.argmax(windowEdges, axis=1)
+    newPixels = np.concatenate((firstPixels, lastPixels)) + windowOffsets[edgeIndex]
+    newPixels[:totalFirst] += 1
+    return newPixels[:totalFirst], newPixels[totalFirst:]
+
+
+# Thresholds a frame, finds the seeds in the full reduced top portion and
+# caches the threshold and the seeds:
+def recomputeBorders(stream, grayImage, outputImage=None):
+    streamParams = stream["Params"]
+    otsuThreshold, binaryImage = cv2.threshold(grayImage, 0, 255, cv2.THRESH_OTSU + cv2.THRESH_BINARY,
+                                               dst=outputImage)
+    heightPortion = binaryImage.shape[0] // streamParams["HeightDivision"]
+    reducedImage = cv2.reduce(binaryImage[0:heightPortion], 0, cv2.REDUCE_MAX)
+
+    stream["Threshold"] = otsuThreshold
+    stream["FirstPixels"], stream["LastPixels"] = rowRuns(reducedImage[0])
+    stream["CachedFrames"] = 0
+    return binaryImage
+
+
+# Thresholds a frame with its own Otsu value and checks the cache,
+# returns the binary image (seeds updated) or None if a check fails:
+def verifyBorders(stream, grayImage, outputImage=None):
+    streamParams = stream["Params"]
+
+    # Threshold check (Otsu of this frame against the cached one):
+    otsuThreshold, binaryImage = cv2.threshold(grayImage, 0, 255, cv2.THRESH_OTSU + cv2.THRESH_BINARY,
+                                               dst=outputImage)
+    if abs(otsuThreshold - stream["Threshold"]) > streamParams["ThresholdTolerance"]:
+        stream["Stats"]["ThresholdFails"] += 1
+        return None
+
+    # Seed check (reduced windows around the cached seeds):
+    heightPortion = binaryImage.shape[0] // streamParams["HeightDivision"]
+    newSeeds = relocateSeeds(binaryImage, heightPortion, stream["FirstPixels"], stream["LastPixels"],
+                             streamParams["SeedTolerance"])
+    if newSeeds is None:
+        stream["Stats"]["SeedFails"] += 1
+        return None
+
+    stream["Threshold"] = otsuThreshold
+    stream["FirstPixels"], stream["LastPixels"] = newSeeds
+    stream["CachedFrames"] += 1
+    return binaryImage
+
+
+# Removes the borders of the next frame of the stream. Returns the binary
+# image without them and the frame mode ("Cached" or "Full"):
+def processFrame(stream, grayImage, fillValue=0, outputImage=None):
+    streamParams = stream["Params"]
+    stream["Stats"]["Frames"] += 1
+
+    # Use the cache unless a refresh is due:
+    binaryImage = None
+    refreshDue = 0 < streamParams["RefreshInterval"] <= stream["CachedFrames"]
+    if stream["Threshold"] is not None and not refreshDue:
+        binaryImage = verifyBorders(stream, grayImage, outputImage)
+
+    frameMode = "Cached"
+    if binaryImage is None:
+        binaryImage = recomputeBorders(stream, grayImage, outputImage)
+        frameMode = "Full"
+    stream["Stats"][frameMode] += 1
+
+    # Flood fill at each seed, one portion down:
+    heightPortion = binaryImage.shape[0] // streamParams["HeightDivision"]
+    for x in np.sort(np.concatenate((stream["FirstPixels"], stream["LastPixels"]))):
+        cv2.floodFill(binaryImage, None, (int(x), heightPortion), fillValue)
+
+    return binaryImage, frameMode
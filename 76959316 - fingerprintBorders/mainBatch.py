@@ -0,0 +1,29 @@
+# File        :   mainBatch.py (Batch Fingerprint Border Removal)
+# Version     :   1.1.1
+# Description :   Batch version of main.py: removes the borders of every frame of a
+#                 memory-mapped grayscale stack (.npy, or raw uint8 with a known
+#                 frame size) with a pool of processes, into a preallocated output
+#                 stack. Prints frames per second and peak RSS. The border removal
+#                 engine is "FloodFill" (main.py) or "Components" (labels once).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+from batchBorders import processStack
+
+# Stack paths, frame size (only needed for raw stacks) and workers:
+inputPath = "D://opencvImages//prints.npy"
+outputPath = "D://opencvImages//printsClean.npy"
+frameShape = (800, 750)
+totalWorkers = 4
+
+# Border removal engine:
+removalMethod = "Components"
+
+# The guard is needed by the process pool (spawned workers re-import this file):
+if __name__ == "__main__":
+    batchStats = processStack(inputPath, outputPath, frameShape, totalWorkers, chunkSize=32,
+                              removalMethod=removalMethod)
+    print("Frames: " + str(batchStats["Frames"]) + ", fps: " + str(round(batchStats["Fps"], 1)))
+    print("Peak RSS (MB), main: " + str(batchStats["PeakRssMb"]) + ", workers: " + str(batchStats["WorkerPeakRssMb"]))
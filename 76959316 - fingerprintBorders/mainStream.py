@@ -0,0 +1,64 @@
+# File        :   mainStream.py (Fingerprint Border Removal on a Sensor Stream)
+# Version     :   1.0.0
+# Description :   Frame-stream version of main.py. The threshold and the flood
+#                 fill seeds are cached between frames and checked cheaply on
+#                 every new frame; everything is computed again only when a check
+#                 fails. Reads a camera, a video file or a synthetic sensor stream.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+# imports:
+import time
+
+import cv2
+
+from borderStream import createStream, processFrame
+from syntheticPrints import makePrintStream
+
+# Video source: camera index, video file path or "Synthetic":
+videoSource = "Synthetic"
+
+# Colors per frame mode:
+modeColors = {"Cached": (0, 255, 0), "Full": (0, 0, 255)}
+
+
+# Yields grayscale frames from the video source:
+def readFrames(videoSource):
+    if videoSource == "Synthetic":
+        for grayFrame, _, _ in makePrintStream(1000):
+            yield grayFrame
+        return
+
+    videoCapture = cv2.VideoCapture(videoSource)
+    while True:
+        frameRead, inputFrame = videoCapture.read()
+        if not frameRead:
+            break
+        yield cv2.cvtColor(inputFrame, cv2.COLOR_BGR2GRAY)
+    videoCapture.release()
+
+
+# Set the stream:
+stream = createStream(refreshInterval=30)
+
+cv2.namedWindow("No Borders", flags=cv2.WINDOW_GUI_NORMAL)
+
+for grayFrame in readFrames(videoSource):
+    startTime = time.perf_counter()
+    binaryImage, frameMode = processFrame(stream, grayFrame)
+    frameTime = time.perf_counter() - startTime
+
+    # Show the result and the frame mode:
+    bgrImage = cv2.cvtColor(binaryImage, cv2.COLOR_GRAY2BGR)
+    cv2.putText(bgrImage, "%s %.2f ms" % (frameMode, 1e3 * frameTime), (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1,
+                modeColors[frameMode], 2)
+    cv2.imshow("No Borders", bgrImage)
+
+    # Quit with Esc:
+    if cv2.waitKey(1) == 27:
+        break
+
+cv2.destroyAllWindows()
+print(stream["Stats"])
@@ -0,0 +1,80 @@
+# File        :   syntheticPrints.py (Synthetic Fingerprint Frames)
+# Version     :   1.1.0
+# Description :   Generates grayscale fingerprint-like frames: white ridges with a
+#                 smoothly varying orientation inside an elliptical finger area,
+#                 and the white sensor border arc (touching the top of the frame)
+#                 that main.py removes. Also returns the ground truth border mask.
+#                 A sensor stream keeps the border geometry between frames (new
+#                 ridges and noise per frame, slow gain drift) and changes it
+#                 every few frames (new finger placement).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Generates one frame (uint8) and its border mask (bool). Frame size
+# defaults to a 500 dpi print, about 1.5" x 1.6". The ellipse (center,
+# axes) is random unless given, frameGain scales the intensities:
+def makePrint(frameWidth=750, frameHeight=800, ridgePeriod=9.0, borderThickness=4, randomSeed=0, ellipseCenter=None,
+              ellipseAxes=None, frameGain=1.0):
+    randomGenerator = np.random.default_rng(randomSeed)
+
+    # Ridge orientation field: a few random smooth waves:
+    y, x = np.mgrid[0:frameHeight, 0:frameWidth].astype(np.float32)
+    fieldPhase = randomGenerator.uniform(0, 2 * np.pi, 3)
+    ridgeAngle = 0.6 * np.sin(x / frameWidth * 3 + fieldPhase[0]) + 0.5 * np.cos(y / frameHeight * 4 + fieldPhase[1])
+    ridgePhase = (x * np.cos(ridgeAngle) + y * np.sin(ridgeAngle)) * (2 * np.pi / ridgePeriod) + fieldPhase[2]
+    ridgeImage = 128 + 90 * np.sin(ridgePhase) + randomGenerator.normal(0, 20, (frameHeight, frameWidth))
+
+    # Finger area and border arc: an ellipse whose top is cut by the frame:
+    center = (int(frameWidth * randomGenerator.uniform(0.47, 0.53)), int(frameHeight * 0.58))
+    axes = (int(frameWidth * randomGenerator.uniform(0.40, 0.45)), int(frameHeight * 0.62))
+    if ellipseCenter is not None:
+        center, axes = tuple(ellipseCenter), tuple(ellipseAxes)
+    fingerMask = np.zeros((frameHeight, frameWidth), np.uint8)
+    cv2.ellipse(fingerMask, center, (axes[0] - 3 * borderThickness, axes[1] - 3 * borderThickness), 0, 0, 360,
+                255, -1)
+    borderMask = np.zeros((frameHeight, frameWidth), np.uint8)
+    cv2.ellipse(borderMask, center, axes, 0, 180, 360, 255, borderThickness)
+
+    # Dark background, ridges inside the finger, bright border:
+    frameImage = np.full((frameHeight, frameWidth), 20, np.float32)
+    frameImage[fingerMask > 0] = ridgeImage[fingerMask > 0]
+    frameImage[borderMask > 0] = 235
+    frameImage = np.clip(frameGain * frameImage, 0, 255).astype(np.uint8)
+
+    return frameImage, borderMask > 0
+
+
+# Stacks totalFrames prints into a (N, H, W) uint8 array (or writes them
+# into an existing array / memory map):
+def makePrintStack(totalFrames, frameWidth=750, frameHeight=800, outputStack=None, randomSeed=0):
+    if outputStack is None:
+        outputStack = np.empty((totalFrames, frameHeight, frameWidth), np.uint8)
+    for i in range(totalFrames):
+        outputStack[i], _ = makePrint(frameWidth, frameHeight, randomSeed=randomSeed + i)
+    return outputStack
+
+
+# Yields (frame, border mask, placement changed) for a sensor stream of
+# totalFrames. The finger is placed again every placementInterval frames
+# (on average), the gain drifts slowly in between:
+def makePrintStream(totalFrames, frameWidth=750, frameHeight=800, placementInterval=100, randomSeed=0):
+    randomGenerator = np.random.default_rng(randomSeed)
+    frameGain = 1.0
+    for i in range(totalFrames):
+        placementChanged = i == 0 or randomGenerator.random() < 1.0 / placementInterval
+        if placementChanged:
+            center = (int(frameWidth * randomGenerator.uniform(0.44, 0.56)),
+                      int(frameHeight * randomGenerator.uniform(0.55, 0.61)))
+            axes = (int(frameWidth * randomGenerator.uniform(0.38, 0.45)),
+                    int(frameHeight * randomGenerator.uniform(0.60, 0.64)))
+        frameGain = np.clip(frameGain + randomGenerator.normal(0, 0.01), 0.85, 1.1)
+
+        frameImage, borderMask = makePrint(frameWidth, frameHeight, randomSeed=randomSeed + i, ellipseCenter=center,
+                                           ellipseAxes=axes, frameGain=frameGain)
+        yield frameImage, borderMask, placementChanged
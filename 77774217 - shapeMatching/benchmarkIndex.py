@@ -0,0 +1,85 @@
+# File        :   benchmarkIndex.py (Shape Template Index Benchmark)
+# Version     :   1.0.1
+# Description :   Fills a template index (shapeIndex.py) with synthetic shapes of
+#                 a few known classes and reports insert time, single-contour
+#                 query latency (p50/p99) and classification accuracy.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import math
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from huMatcher import getScaledMomentsBatch
+from syntheticShapes import shapeClasses, makeShape
+from shapeIndex import createIndex, openIndex, closeIndex, insertTemplates, queryDescriptors, classifyContours
+
+
+def makeClassContours(vertices, totalContours, randomGenerator):
+    """Random scale/rotation/position instances of one shape class"""
+    return [makeShape(vertices, randomGenerator.uniform(40.0, 80.0), randomGenerator.uniform(0.0, 2.0 * math.pi),
+                      randomGenerator.uniform(200.0, 4000.0, size=2)) for _ in range(totalContours)]
+
+
+# Fixed seed so runs are comparable:
+randomGenerator = np.random.default_rng(77774217)
+
+# Query contours (same for every index size):
+queryContours = []
+queryLabels = []
+for className, vertices in shapeClasses.items():
+    queryContours.extend(makeClassContours(vertices, 50, randomGenerator))
+    queryLabels.extend([className] * 50)
+
+print("%9s | %12s | %10s %10s | %12s | %8s" % ("templates", "insert (ms)", "p50 (us)", "p99 (us)", "batch q/s",
+                                               "accuracy"))
+
+with tempfile.TemporaryDirectory() as tempDirectory:
+    indexPath = os.path.join(tempDirectory, "shapeIndex")
+    index = createIndex(indexPath, initialCapacity=1024)
+
+    totalTemplates = 0
+    for targetTemplates in [1000, 10000, 100000]:
+        # Incremental inserts, one batch per class:
+        perClass = (targetTemplates - totalTemplates) // len(shapeClasses)
+        newTemplates = {className: makeClassContours(vertices, perClass, randomGenerator)
+                        for className, vertices in shapeClasses.items()}
+        startTime = time.perf_counter()
+        for className, contourList in newTemplates.items():
+            insertTemplates(index, contourList, className)
+        insertTime = time.perf_counter() - startTime
+        totalTemplates = index["Metadata"]["Count"]
+
+        # Single contour classification latency (includes the descriptor):
+        latencies = []
+        predictedLabels = []
+        for contour in queryContours:
+            startTime = time.perf_counter()
+            predictedLabels.extend(classifyContours(index, [contour], k=5))
+            latencies.append(time.perf_counter() - startTime)
+        latencies = 1e6 * np.array(latencies)
+
+        # Batched query throughput:
+        queryMatrix = getScaledMomentsBatch(queryContours)
+        startTime = time.perf_counter()
+        queryDescriptors(index, queryMatrix, k=5)
+        batchTime = time.perf_counter() - startTime
+
+        accuracy = np.mean([p == t for p, t in zip(predictedLabels, queryLabels)])
+        print("%9d | %12.1f | %10.1f %10.1f | %12.0f | %8.3f" % (totalTemplates, 1e3 * insertTime,
+                                                                 np.percentile(latencies, 50),
+                                                                 np.percentile(latencies, 99),
+                                                                 len(queryContours) / batchTime, accuracy))
+
+    # Re-open from disk, the lookup must give the same answers:
+    closeIndex(index)
+    reopenedIndex = openIndex(indexPath)
+    reopenedLabels = classifyContours(reopenedIndex, queryContours, k=5)
+    print("Reopened index:", reopenedIndex["Metadata"]["Count"], "templates, same labels:",
+          reopenedLabels == predictedLabels)
+    closeIndex(reopenedIndex)
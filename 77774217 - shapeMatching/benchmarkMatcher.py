@@ -0,0 +1,88 @@
+# File        :   benchmarkMatcher.py (Shape Matching Benchmark)
+# Version     :   1.1.0
+# Description :   Compares the original one-vs-all Hu-moment matcher against the
+#                 batched median descriptor matcher (huMatcher.py) on synthetic
+#                 images with 10, 100 and 1000 contours.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import math
+import time
+
+import numpy as np
+import cv2
+
+from huMatcher import findOutliers
+from syntheticShapes import shapeClasses, makeShape
+
+
+def legacyScaledMoments(inputContour):
+    """Original per-element log scaling, kept here as the baseline"""
+    huMoments = cv2.HuMoments(cv2.moments(inputContour))
+    for m in range(0, 7):
+        huMoments[m, 0] = -1 * math.copysign(1.0, huMoments[m, 0]) * math.log10(abs(huMoments[m, 0]))
+    return huMoments
+
+
+def legacyMatcher(contourList, minSigma=1.0):
+    """Original matcher: contour 0 vs the rest, mean/std test on that row"""
+    huMomentsObjective = legacyScaledMoments(contourList[0]).T
+    contourDistances = []
+    for i in range(1, len(contourList)):
+        huMomentsTarget = legacyScaledMoments(contourList[i]).T
+        contourDistances.append([np.linalg.norm(huMomentsObjective - huMomentsTarget), i])
+
+    distanceArray = np.array(contourDistances)
+    contourIndex = 0
+    if np.std(distanceArray[:, 0]) > minSigma:
+        contourIndex = int(np.argmax(distanceArray[:, 0])) + 1
+    return contourIndex
+
+
+def makeContours(totalContours, outlierIndex, randomGenerator):
+    """Creates totalContours notched rectangles, one triangle at outlierIndex"""
+    contourList = []
+    for i in range(totalContours):
+        vertices = shapeClasses["Triangle" if i == outlierIndex else "Notched Rectangle"]
+        scale = randomGenerator.uniform(40.0, 80.0)
+        angle = randomGenerator.uniform(0.0, 2.0 * math.pi)
+        center = randomGenerator.uniform(200.0, 4000.0, size=2)
+        contourList.append(makeShape(vertices, scale, angle, center))
+
+    return contourList
+
+
+def timeIt(function, repeats):
+    """Returns the best wall time (seconds) and the last result of function()"""
+    bestTime = float("inf")
+    result = None
+    for _ in range(repeats):
+        startTime = time.perf_counter()
+        result = function()
+        bestTime = min(bestTime, time.perf_counter() - startTime)
+    return bestTime, result
+
+
+# Fixed seed so runs are comparable:
+randomGenerator = np.random.default_rng(77774217)
+
+print("%8s | %14s %8s | %14s %8s | %7s" % ("contours", "legacy c/s", "found", "batched c/s", "found", "speedup"))
+
+for totalContours in [10, 100, 1000]:
+    # Place the odd shape at index 0 for one run (the legacy matcher's weak spot)
+    # and somewhere in the middle for another:
+    for outlierIndex in [0, totalContours // 2]:
+        contourList = makeContours(totalContours, outlierIndex, randomGenerator)
+        repeats = 20 if totalContours < 1000 else 5
+
+        legacyTime, legacyIndex = timeIt(lambda: legacyMatcher(contourList), repeats)
+        batchedTime, (_, outlierIndices) = timeIt(lambda: findOutliers(contourList), repeats)
+        batchedIndex = int(outlierIndices[0]) if len(outlierIndices) > 0 else 0
+
+        print("%8d | %14.0f %8s | %14.0f %8s | %6.2fx" % (totalContours, totalContours / legacyTime,
+                                                          legacyIndex == outlierIndex,
+                                                          totalContours / batchedTime,
+                                                          batchedIndex == outlierIndex,
+                                                          legacyTime / batchedTime))
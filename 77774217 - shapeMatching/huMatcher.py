@@ -0,0 +1,191 @@
+# File        :   huMatcher.py (Batched Hu-moment Shape Matching)
+# Version     :   1.1.0
+# Description :   Computes log-scaled hu moments for a whole list of contours,
+#                 measures each one against the median descriptor (O(N), no
+#                 all-pairs matrix) and flags outliers via median/MAD (robust
+#                 z-score) scoring. Trade-off: with a handful of contours the
+#                 NumPy overhead makes it slightly slower than the one-vs-all
+#                 loop of main.py; it pays off from tens of contours on.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+def logScaleMoments(huMoments, minMagnitude=1e-30):
+    """Log-scales an array of hu moments (any shape), returns a new float64 array"""
+    huMoments = np.asarray(huMoments, dtype=np.float64)
+    # Clip the magnitude so exact zeros do not blow up the log:
+    magnitude = np.maximum(np.abs(huMoments), minMagnitude)
+    # -sign(h) * log10(|h|), same as the per-element loop (+ 0.0 turns -0.0 into 0.0):
+    return -1.0 * np.copysign(1.0, huMoments + 0.0) * np.log10(magnitude)
+
+
+def getScaledMoments(inputContour):
+    """Computes log-scaled hu moments of a contour array"""
+    # Calculate Moments
+    moments = cv2.moments(inputContour)
+    # Calculate Hu Moments
+    huMoments = cv2.HuMoments(moments)
+    # Log scale hu moments (7 x 1 column):
+    return logScaleMoments(huMoments)
+
+
+def polygonMoments(contourList):
+    """Computes the raw spatial moments (m00 ... m03) of a list of contours as a (N, 10) matrix"""
+    # Stack all the contour points in one array, remember where each contour starts:
+    contourLengths = np.array([len(c) for c in contourList], np.int64)
+    contourStarts = np.concatenate(([0], np.cumsum(contourLengths)[:-1]))
+    contourPoints = np.concatenate([np.asarray(c).reshape(-1, 2) for c in contourList]).astype(np.float64)
+
+    # Shift each contour to its first point, keeps the products small
+    # (central moments do not depend on the origin):
+    contourPoints -= np.repeat(contourPoints[contourStarts], contourLengths, axis=0)
+
+    # Index of the next vertex of every edge, wrapping around inside each contour:
+    nextIndex = np.arange(len(contourPoints)) + 1
+    nextIndex[contourStarts + contourLengths - 1] = contourStarts
+
+    # Edge end points:
+    x0 = contourPoints[:, 0]
+    y0 = contourPoints[:, 1]
+    x1 = contourPoints[nextIndex, 0]
+    y1 = contourPoints[nextIndex, 1]
+
+    # Green's theorem, per edge terms (same as cv2.moments on a contour):
+    a = x0 * y1 - x1 * y0
+    xs = x0 + x1
+    ys = y0 + y1
+    edgeTerms = np.stack([a,
+                          a * xs,
+                          a * ys,
+                          a * (x0 * x0 + x0 * x1 + x1 * x1),
+                          a * (x0 * (2 * y0 + y1) + x1 * (y0 + 2 * y1)),
+                          a * (y0 * y0 + y0 * y1 + y1 * y1),
+                          a * xs * (x0 * x0 + x1 * x1),
+                          a * (x0 * x0 * (3 * y0 + y1) + 2 * x0 * x1 * ys + x1 * x1 * (y0 + 3 * y1)),
+                          a * (y0 * y0 * (3 * x0 + x1) + 2 * y0 * y1 * xs + y1 * y1 * (x0 + 3 * x1)),
+                          a * ys * (y0 * y0 + y1 * y1)], axis=1)
+
+    # Sum the edges of each contour and scale:
+    rawMoments = np.add.reduceat(edgeTerms, contourStarts, axis=0)
+    rawMoments /= np.array([2, 6, 6, 12, 24, 12, 20, 60, 60, 20], np.float64)
+
+    # Orientation independent (clockwise contours give a negative area):
+    rawMoments *= np.where(rawMoments[:, :1] < 0, -1.0, 1.0)
+
+    return rawMoments
+
+
+def huMomentsBatch(contourList):
+    """Computes the (raw) hu moments of a list of contours as a (N, 7) matrix"""
+    m00, m10, m01, m20, m11, m02, m30, m21, m12, m03 = polygonMoments(contourList).T
+
+    # Degenerate contours (lines, points) get all-zero moments, like cv2.moments:
+    validArea = m00 > 0
+    m00 = np.where(validArea, m00, 1.0)
+
+    # Central moments:
+    cx = m10 / m00
+    cy = m01 / m00
+    mu20 = m20 - cx * m10
+    mu11 = m11 - cx * m01
+    mu02 = m02 - cy * m01
+    mu30 = m30 - cx * (3 * mu20 + cx * m10)
+    mu21 = m21 - cx * (2 * mu11 + cx * m01) - cy * mu20
+    mu12 = m12 - cy * (2 * mu11 + cy * m10) - cx * mu02
+    mu03 = m03 - cy * (3 * mu02 + cy * m01)
+
+    # Normalized central moments:
+    s2 = np.where(validArea, 1.0 / (m00 * m00), 0.0)
+    s3 = s2 / np.sqrt(m00)
+    nu20, nu11, nu02 = mu20 * s2, mu11 * s2, mu02 * s2
+    nu30, nu21, nu12, nu03 = mu30 * s3, mu21 * s3, mu12 * s3, mu03 * s3
+
+    # Hu invariants (same arrangement as cv2.HuMoments):
+    huMatrix = np.empty((len(m00), 7), np.float64)
+    t0 = nu30 + nu12
+    t1 = nu21 + nu03
+    q0 = t0 * t0
+    q1 = t1 * t1
+    n4 = 4 * nu11
+    s = nu20 + nu02
+    d = nu20 - nu02
+
+    huMatrix[:, 0] = s
+    huMatrix[:, 1] = d * d + n4 * nu11
+    huMatrix[:, 3] = q0 + q1
+    huMatrix[:, 5] = d * (q0 - q1) + n4 * t0 * t1
+
+    t0 = t0 * (q0 - 3 * q1)
+    t1 = t1 * (3 * q0 - q1)
+    q0 = nu30 - 3 * nu12
+    q1 = 3 * nu21 - nu03
+
+    huMatrix[:, 2] = q0 * q0 + q1 * q1
+    huMatrix[:, 4] = q0 * t0 + q1 * t1
+    huMatrix[:, 6] = q1 * t0 - q0 * t1
+
+    return huMatrix
+
+
+def getScaledMomentsBatch(contourList):
+    """Computes log-scaled hu moments of a list of contours into a (N, 7) matrix"""
+    if len(contourList) == 0:
+        return np.empty((0, 7), np.float64)
+
+    # All contours at once, no per-contour cv2.moments call:
+    return logScaleMoments(huMomentsBatch(contourList))
+
+
+def medianDistances(huMatrix):
+    """Computes the Euclidean distance of each row of huMatrix to the median descriptor (per column median)"""
+    huMatrix = np.asarray(huMatrix, dtype=np.float64)
+    # O(N): one reference descriptor instead of all the pairs:
+    medianDescriptor = np.median(huMatrix, axis=0)
+    return np.linalg.norm(huMatrix - medianDescriptor, axis=1)
+
+
+def robustScores(contourDistances):
+    """Scores each contour by its distance to the median descriptor, as a robust z-score"""
+    contourDistances = np.asarray(contourDistances, dtype=np.float64)
+    totalContours = len(contourDistances)
+    if totalContours < 3:
+        # Not enough contours to tell which one is different:
+        return np.zeros(totalContours, np.float64)
+
+    # Median absolute deviation of the distances:
+    distancesMedian = np.median(contourDistances)
+    absDeviation = np.abs(contourDistances - distancesMedian)
+    mad = np.median(absDeviation)
+
+    # 0.6745 makes the MAD consistent with the std dev of a normal distribution:
+    if mad > 0:
+        return 0.6745 * (contourDistances - distancesMedian) / mad
+
+    # More than half the contours are identical, fall back to the mean absolute deviation:
+    meanDeviation = np.mean(absDeviation)
+    if meanDeviation > 0:
+        return 0.7979 * (contourDistances - distancesMedian) / meanDeviation
+
+    # All contours are the same:
+    return np.zeros(totalContours, np.float64)
+
+
+def findOutliers(contourList, zThreshold=3.5):
+    """Matches all contours against the median descriptor, returns (scores, outlier indices sorted by score)"""
+    # Descriptors and distances to the median descriptor:
+    huMatrix = getScaledMomentsBatch(contourList)
+    contourDistances = medianDistances(huMatrix)
+
+    # Robust score per contour:
+    contourScores = robustScores(contourDistances)
+
+    # Outliers, most different first:
+    outlierIndices = np.flatnonzero(contourScores > zThreshold)
+    outlierIndices = outlierIndices[np.argsort(-contourScores[outlierIndices], kind="stable")]
+
+    return contourScores, outlierIndices
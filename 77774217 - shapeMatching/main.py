@@ -1,5 +1,5 @@
 # File        :   main.py (Shape Matching)
-# Version     :   1.0.0
+# Version     :   1.1.1
 # Description :   Script that finds a mismatched shaped in an image
 #                 Answer for: https://stackoverflow.com/q/77774217/
 
@@ -9,7 +9,9 @@
 
 import numpy as np
 import cv2
-import math
+
+from huMatcher import getScaledMoments, findOutliers
+from shapeIndex import openIndex, classifyContours
 
 
 def readImage(imagePath):
@@ -29,25 +31,19 @@ def showImage(imageName, inputImage):
     cv2.waitKey(0)
 
 
-def getScaledMoments(inputContour):
-    """Computes log-scaled hu moments of a contour array"""
-    # Calculate Moments
-    moments = cv2.moments(inputContour)
-    # Calculate Hu Moments
-    huMoments = cv2.HuMoments(moments)
-
-    # Log scale hu moments
-    for m in range(0, 7):
-        huMoments[m] = -1 * math.copysign(1.0, huMoments[m]) * math.log10(abs(huMoments[m]))
-
-    return huMoments
-
-
 # Set image path
 directoryPath = "D://opencvImages//shapes//"
 
 imageNames = ["01", "02", "03", "04", "05"]
 
+# (Optional) Classify the contours against a library of known-good shapes
+# (built with shapeIndex.createIndex/insertTemplates):
+useTemplateIndex = False
+templateIndexPath = directoryPath + "templateIndex"
+
+if useTemplateIndex:
+    templateIndex = openIndex(templateIndexPath)
+
 # Loop through the image file names:
 for imageName in imageNames:
 
@@ -100,6 +96,11 @@ for imageName in imageNames:
     # Get total contours in the list:
     totalContours = len(contourList)
 
+    # Look up every contour in the template library:
+    if useTemplateIndex:
+        templateLabels = classifyContours(templateIndex, [d["Contour"] for d in contourList])
+        print("Template labels:", templateLabels)
+
     # Deep copies of input image for results:
     inputCopy = inputImage.copy()
     contourCopy = inputImage.copy()
@@ -116,65 +117,88 @@ for imageName in imageNames:
     center = currentDict["Centroid"]
     cv2.putText(contourCopy, "0", center, cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
 
-    # Store contour distances here:
-    contourDistances = []
+    # (Optional) Use the batched matcher (all contours vs the median descriptor,
+    # median/MAD scoring), faster from tens of contours on:
+    useBatchMatcher = False
+
+    if useBatchMatcher:
+        # Draw every contour and its index:
+        for i in range(1, totalContours):
+            currentDict = contourList[i]
+            cv2.drawContours(contourCopy, [currentDict["Contour"]], 0, (0, 0, 255), 3)
+            cv2.putText(contourCopy, str(i), currentDict["Centroid"], cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+        showImage("Contours", contourCopy)
 
-    # Calculate log-scale hu moments of objective contour:
-    huMomentsObjective = getScaledMoments(objectiveContour)
+        # Score all the contours at once:
+        contourScores, outlierIndices = findOutliers([d["Contour"] for d in contourList])
+        print("Scores:", contourScores, "Outliers:", outlierIndices)
 
-    # Start from objectiveContour+1, get target contour, compute scaled moments and
-    # get Euclidean distance between the two scaled arrays:
+        # Set contour 0 (default) as the contour that is different from the rest,
+        # unless an outlier was found:
+        contourIndex = 0
+        if len(outlierIndices) > 0:
+            contourIndex = outlierIndices[0]
 
-    for i in range(1, totalContours):
-        # Set target contour:
-        currentDict = contourList[i]
-        # Get contour:
-        targetContour = currentDict["Contour"]
+    else:
+        # Store contour distances here:
+        contourDistances = []
 
-        # Draw target contour in red:
-        cv2.drawContours(contourCopy, [targetContour], 0, (0, 0, 255), 3)
+        # Calculate log-scale hu moments of objective contour:
+        huMomentsObjective = getScaledMoments(objectiveContour)
 
-        # Calculate log-scale hu moments of target contour:
-        huMomentsTarget = getScaledMoments(targetContour)
+        # Start from objectiveContour+1, get target contour, compute scaled moments and
+        # get Euclidean distance between the two scaled arrays:
 
-        # Compute Euclidean distance between the two arrays:
-        contourDistance = np.linalg.norm(np.transpose(huMomentsObjective) - np.transpose(huMomentsTarget))
-        print("contourDistance:", contourDistance)
+        for i in range(1, totalContours):
+            # Set target contour:
+            currentDict = contourList[i]
+            # Get contour:
+            targetContour = currentDict["Contour"]
 
-        # Store distance along contour index in distance list:
-        contourDistances.append([contourDistance, i])
+            # Draw target contour in red:
+            cv2.drawContours(contourCopy, [targetContour], 0, (0, 0, 255), 3)
 
-        # Draw contour index on image:
-        center = currentDict["Centroid"]
-        cv2.putText(contourCopy, str(i), center, cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+            # Calculate log-scale hu moments of target contour:
+            huMomentsTarget = getScaledMoments(targetContour)
 
-        # Show processed contours:
-        showImage("Contours", contourCopy)
+            # Compute Euclidean distance between the two arrays:
+            contourDistance = np.linalg.norm(np.transpose(huMomentsObjective) - np.transpose(huMomentsTarget))
+            print("contourDistance:", contourDistance)
+
+            # Store distance along contour index in distance list:
+            contourDistances.append([contourDistance, i])
+
+            # Draw contour index on image:
+            center = currentDict["Centroid"]
+            cv2.putText(contourCopy, str(i), center, cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+
+            # Show processed contours:
+            showImage("Contours", contourCopy)
 
-    # Get maximum distance,
-    # List to numpy array:
-    distanceArray = np.array(contourDistances)
+        # Get maximum distance,
+        # List to numpy array:
+        distanceArray = np.array(contourDistances)
 
-    # Get distance mean and std dev:
-    mean = np.mean(distanceArray[:, 0:1])
-    stdDev = np.std(distanceArray[:, 0:1])
+        # Get distance mean and std dev:
+        mean = np.mean(distanceArray[:, 0:1])
+        stdDev = np.std(distanceArray[:, 0:1])
 
-    print("M:", mean, "Std:", stdDev)
+        print("M:", mean, "Std:", stdDev)
 
-    # Set contour 0 (default) as the contour that is different from the rest:
-    contourIndex = 0
-    minSigma = 1.0
+        # Set contour 0 (default) as the contour that is different from the rest:
+        contourIndex = 0
+        minSigma = 1.0
 
-    # If std dev from the distance array is above a minimum variation,
-    # there's an outlier (max distance) in the array, thus, the real different
-    # contour we are looking for:
+        # If std dev from the distance array is above a minimum variation,
+        # there's an outlier (max distance) in the array, thus, the real different
+        # contour we are looking for:
 
-    if stdDev > minSigma:
-        # Get max distance:
-        maxDistance = np.max(distanceArray[:, 0:1])
-        # Set contour index (contour at index 0 was the objective!):
-        contourIndex = np.argmax(distanceArray[:, 0:1]) + 1
-        print("Max:", maxDistance, "Index:", contourIndex)
+        if stdDev > minSigma:
+            # Get max distance:
+            maxDistance = np.max(distanceArray[:, 0:1])
+            # Set contour index (contour at index 0 was the objective!):
+            contourIndex = np.argmax(distanceArray[:, 0:1]) + 1
+            print("Max:", maxDistance, "Index:", contourIndex)
 
     # Fetch dissimilar contour, if found,
     # Get boundingRect:
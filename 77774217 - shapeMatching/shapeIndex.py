@@ -0,0 +1,198 @@
+# File        :   shapeIndex.py (Persistent Shape Template Index)
+# Version     :   1.0.0
+# Description :   On-disk library of known-good shapes. The log-scaled hu moments
+#                 of every template live in a memory-mapped float32 array next to
+#                 a small json metadata file. New templates are appended without
+#                 rebuilding and new contours are classified via k-NN lookup.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import json
+import os
+
+import numpy as np
+
+from huMatcher import getScaledMomentsBatch
+
+# File names inside the index directory:
+metadataFile = "metadata.json"
+descriptorsFile = "descriptors.f32"
+labelsFile = "labels.i32"
+
+# Hu moments per template:
+descriptorSize = 7
+
+
+def readMetadata(indexPath):
+    """Reads the index metadata dictionary"""
+    with open(os.path.join(indexPath, metadataFile), "r") as metadataHandle:
+        return json.load(metadataHandle)
+
+
+def writeMetadata(indexPath, metadata):
+    """Writes the index metadata dictionary (atomic replace)"""
+    metadataPath = os.path.join(indexPath, metadataFile)
+    tempPath = metadataPath + ".tmp"
+    with open(tempPath, "w") as metadataHandle:
+        json.dump(metadata, metadataHandle, indent=2)
+    os.replace(tempPath, metadataPath)
+
+
+def resizeFile(filePath, totalBytes):
+    """Creates or grows a file to totalBytes (new space reads as zeros)"""
+    with open(filePath, "ab") as fileHandle:
+        fileHandle.truncate(totalBytes)
+
+
+def mapArrays(index):
+    """(Re)maps the descriptor and label files according to the current capacity"""
+    indexPath = index["Path"]
+    capacity = index["Metadata"]["Capacity"]
+    index["Descriptors"] = np.memmap(os.path.join(indexPath, descriptorsFile), dtype=np.float32, mode="r+",
+                                     shape=(capacity, descriptorSize))
+    index["Labels"] = np.memmap(os.path.join(indexPath, labelsFile), dtype=np.int32, mode="r+", shape=(capacity,))
+
+
+def createIndex(indexPath, initialCapacity=1024):
+    """Creates an empty index directory and returns the opened index"""
+    os.makedirs(indexPath, exist_ok=True)
+    initialCapacity = max(1, initialCapacity)
+
+    # Preallocate the arrays:
+    resizeFile(os.path.join(indexPath, descriptorsFile), initialCapacity * descriptorSize * 4)
+    resizeFile(os.path.join(indexPath, labelsFile), initialCapacity * 4)
+
+    metadata = {"Version": 1, "Count": 0, "Capacity": initialCapacity, "LabelNames": []}
+    writeMetadata(indexPath, metadata)
+
+    return openIndex(indexPath)
+
+
+def openIndex(indexPath):
+    """Opens an existing index, the arrays are memory-mapped (not loaded)"""
+    index = {"Path": indexPath, "Metadata": readMetadata(indexPath)}
+    mapArrays(index)
+
+    # Cache the squared descriptor norms for the distance computation:
+    count = index["Metadata"]["Count"]
+    validDescriptors = index["Descriptors"][:count]
+    index["SquaredNorms"] = np.einsum("ij,ij->i", validDescriptors, validDescriptors)
+
+    return index
+
+
+def closeIndex(index):
+    """Flushes and releases the memory maps"""
+    index["Descriptors"].flush()
+    index["Labels"].flush()
+    del index["Descriptors"]
+    del index["Labels"]
+
+
+def growIndex(index, requiredCapacity):
+    """Grows the index files in place (capacity doubles), existing rows are untouched"""
+    metadata = index["Metadata"]
+    newCapacity = max(2 * metadata["Capacity"], requiredCapacity)
+
+    # Release the current maps before resizing the files:
+    closeIndex(index)
+    resizeFile(os.path.join(index["Path"], descriptorsFile), newCapacity * descriptorSize * 4)
+    resizeFile(os.path.join(index["Path"], labelsFile), newCapacity * 4)
+
+    metadata["Capacity"] = newCapacity
+    mapArrays(index)
+
+
+def insertDescriptors(index, descriptorMatrix, labelName):
+    """Appends a (N, 7) matrix of log-scaled hu moments under labelName, returns their row indices"""
+    descriptorMatrix = np.asarray(descriptorMatrix, dtype=np.float32).reshape(-1, descriptorSize)
+    metadata = index["Metadata"]
+    count = metadata["Count"]
+    totalNew = descriptorMatrix.shape[0]
+
+    # Get (or register) the label id:
+    labelNames = metadata["LabelNames"]
+    if labelName not in labelNames:
+        labelNames.append(labelName)
+    labelId = labelNames.index(labelName)
+
+    # Make room if needed:
+    if count + totalNew > metadata["Capacity"]:
+        growIndex(index, count + totalNew)
+
+    # Write the new rows, then commit the new count:
+    index["Descriptors"][count:count + totalNew] = descriptorMatrix
+    index["Labels"][count:count + totalNew] = labelId
+    index["Descriptors"].flush()
+    index["Labels"].flush()
+
+    metadata["Count"] = count + totalNew
+    writeMetadata(index["Path"], metadata)
+
+    # Extend the norms cache:
+    newNorms = np.einsum("ij,ij->i", descriptorMatrix, descriptorMatrix)
+    index["SquaredNorms"] = np.concatenate((index["SquaredNorms"], newNorms))
+
+    return np.arange(count, count + totalNew)
+
+
+def insertTemplates(index, contourList, labelName):
+    """Appends the hu moments of a list of contours under labelName"""
+    return insertDescriptors(index, getScaledMomentsBatch(contourList), labelName)
+
+
+def queryDescriptors(index, descriptorMatrix, k=5):
+    """k-NN lookup, returns (template indices, distances), both (Q, k) sorted by distance"""
+    queryMatrix = np.asarray(descriptorMatrix, dtype=np.float32).reshape(-1, descriptorSize)
+    count = index["Metadata"]["Count"]
+    k = min(k, count)
+    if k == 0:
+        return np.empty((queryMatrix.shape[0], 0), np.int64), np.empty((queryMatrix.shape[0], 0), np.float32)
+
+    # Squared distances to every template, |q|^2 + |t|^2 - 2 q.t:
+    templateMatrix = index["Descriptors"][:count]
+    squaredDistances = queryMatrix @ templateMatrix.T
+    squaredDistances *= -2.0
+    squaredDistances += index["SquaredNorms"][None, :]
+    squaredDistances += np.einsum("ij,ij->i", queryMatrix, queryMatrix)[:, None]
+    np.maximum(squaredDistances, 0.0, out=squaredDistances)
+
+    # Get the k closest (unsorted), then sort only those:
+    if k < count:
+        nearestIndices = np.argpartition(squaredDistances, k - 1, axis=1)[:, :k]
+    else:
+        nearestIndices = np.broadcast_to(np.arange(count), squaredDistances.shape)
+    nearestDistances = np.take_along_axis(squaredDistances, nearestIndices, axis=1)
+    order = np.argsort(nearestDistances, axis=1)
+
+    nearestIndices = np.take_along_axis(nearestIndices, order, axis=1)
+    nearestDistances = np.sqrt(np.take_along_axis(nearestDistances, order, axis=1))
+
+    return nearestIndices, nearestDistances
+
+
+def classifyContours(index, contourList, k=5, maxDistance=1.0):
+    """Classifies each contour by an inverse-distance weighted vote of its k nearest
+    templates within maxDistance, returns a list of label names (None: no match)"""
+    nearestIndices, nearestDistances = queryDescriptors(index, getScaledMomentsBatch(contourList), k)
+    labelNames = index["Metadata"]["LabelNames"]
+    totalQueries = nearestIndices.shape[0]
+    if nearestIndices.shape[1] == 0:
+        return [None] * totalQueries
+
+    # Neighbour labels and vote weights (far neighbours do not vote):
+    neighbourLabels = np.asarray(index["Labels"][nearestIndices.ravel()]).reshape(nearestIndices.shape)
+    voteWeights = np.where(nearestDistances <= maxDistance, 1.0 / (nearestDistances + 1e-6), 0.0)
+
+    # Accumulate the votes per (query, label):
+    labelVotes = np.zeros((totalQueries, len(labelNames)), np.float64)
+    queryRows = np.repeat(np.arange(totalQueries), nearestIndices.shape[1])
+    np.add.at(labelVotes, (queryRows, neighbourLabels.ravel()), voteWeights.ravel())
+
+    # Winning label, if any neighbour voted:
+    winners = np.argmax(labelVotes, axis=1)
+    hasVotes = labelVotes[np.arange(totalQueries), winners] > 0
+
+    return [labelNames[w] if v else None for w, v in zip(winners, hasVotes)]
@@ -0,0 +1,27 @@
+# File        :   syntheticShapes.py (Synthetic Shape Contours)
+# Version     :   1.0.0
+# Description :   Polygon classes and the scaled, rotated and translated
+#                 contours built from them, shared by the matcher and the
+#                 template index benchmarks.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import math
+
+import numpy as np
+
+# Shape classes (unit coordinates):
+shapeClasses = {"Notched Rectangle": [(0, 0), (4, 0), (4, 2), (2.6, 2), (2.2, 1.2), (1.8, 2), (0, 2)],
+                "Triangle": [(0, 0), (4, 0), (2, 3)],
+                "L Shape": [(0, 0), (3, 0), (3, 1), (1, 1), (1, 3), (0, 3)],
+                "Arrow": [(0, 1), (2, 1), (2, 0), (4, 1.5), (2, 3), (2, 2), (0, 2)]}
+
+
+def makeShape(vertices, scale, angle, center):
+    """Scales, rotates and translates a polygon into an OpenCV contour"""
+    cosA, sinA = math.cos(angle), math.sin(angle)
+    rotation = np.array([[cosA, -sinA], [sinA, cosA]])
+    points = (np.asarray(vertices, np.float64) * scale) @ rotation.T + center
+    return np.round(points).astype(np.int32).reshape(-1, 1, 2)
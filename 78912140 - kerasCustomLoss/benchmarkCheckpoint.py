@@ -0,0 +1,153 @@
+# File        :   benchmarkCheckpoint.py (Checkpoint Blocking and Resume Benchmark)
+# Version     :   1.0.0
+# Description :   Measures how long each checkpoint blocks training and its size on
+#                 disk: a synchronous model.save (.keras, as main.py) against the
+#                 asynchronous checkpoints of checkpointManager.py, for the model of
+#                 main.py and a wider one. Then the resume: per-batch losses after
+#                 reloading as main.py (load_model(compile=False) + compile: new
+#                 Adam) and after restoreCheckpoint, against the same training
+#                 without interruption.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import keras
+
+from checkpointManager import createManager, saveCheckpoint, flushManager, closeManager, restoreCheckpoint, \
+    AsyncCheckpoint
+from compiledTraining import buildModel, customLoss
+
+# Data, training and checkpoint settings:
+totalSamples, batchSize = 32768, 100
+stepsPerEpoch = -(-totalSamples // batchSize)
+saveInterval = 50
+trainEpochs = 2
+resumeEpochs = 1
+modelSizes = [("main.py 100-5-1", 5), ("wide 100-4096-1", 4096)]
+
+
+# Synchronous save every saveInterval batches (as main.py, blocking):
+class SyncCheckpoint(keras.callbacks.Callback):
+    def __init__(self, checkpointPath):
+        super().__init__()
+        self.checkpointPath = checkpointPath
+        self.blockSeconds = []
+        self.trainStep = 0
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.trainStep += 1
+        if self.trainStep % saveInterval == 0:
+            startTime = time.perf_counter()
+            self.model.save(self.checkpointPath)
+            self.blockSeconds.append(time.perf_counter() - startTime)
+
+
+# Per-batch losses (Keras logs the running mean of the epoch):
+class BatchLosses(keras.callbacks.Callback):
+    def __init__(self):
+        super().__init__()
+        self.batchLosses = []
+        self.previousMean = 0.0
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.previousMean = 0.0
+
+    def on_train_batch_end(self, batch, logs=None):
+        runningMean = float(logs["loss"])
+        self.batchLosses.append((batch + 1) * runningMean - batch * self.previousMean)
+        self.previousMean = runningMean
+
+
+# New model compiled as main.py (Adam, custom loss):
+def compiledModel(hiddenUnits=5):
+    keras.utils.set_random_seed(0)
+    model = buildModel(hiddenUnits=hiddenUnits)
+    model.compile(optimizer="adam", loss=customLoss, metrics=["mean_squared_error"])
+    return model
+
+
+# Trains and returns the per-batch losses (fixed batch order):
+def trainLosses(model, x, y, totalEpochs, initialEpoch=0, callbacks=()):
+    lossRecorder = BatchLosses()
+    model.fit(x, y, batch_size=batchSize, epochs=initialEpoch + totalEpochs, initial_epoch=initialEpoch,
+              shuffle=False, verbose=0, callbacks=[lossRecorder, *callbacks])
+    return np.array(lossRecorder.batchLosses)
+
+
+# Some random inputs/targets (as main.py):
+randomGenerator = np.random.default_rng(0)
+x = randomGenerator.random((totalSamples, 100)).astype(np.float32)
+y = randomGenerator.random((totalSamples, 2)).astype(np.float32)
+
+with tempfile.TemporaryDirectory() as checkpointFolder:
+    # Blocking time and size per checkpoint:
+    print("%-17s | %-12s | %5s | %12s | %12s | %10s | %9s" % ("model", "checkpoint", "saves", "block p50 ms",
+                                                              "block max ms", "size (KB)", "train s"))
+    for modelName, hiddenUnits in modelSizes:
+        # No checkpoints:
+        model = compiledModel(hiddenUnits)
+        startTime = time.perf_counter()
+        trainLosses(model, x, y, trainEpochs)
+        print("%-17s | %-12s | %5d | %12s | %12s | %10s | %9.2f" % (modelName, "none", 0, "-", "-", "-",
+                                                                    time.perf_counter() - startTime))
+
+        # Synchronous .keras:
+        model = compiledModel(hiddenUnits)
+        syncPath = os.path.join(checkpointFolder, "sync.keras")
+        syncCheckpoint = SyncCheckpoint(syncPath)
+        startTime = time.perf_counter()
+        trainLosses(model, x, y, trainEpochs, callbacks=[syncCheckpoint])
+        trainTime = time.perf_counter() - startTime
+        print("%-17s | %-12s | %5d | %12.2f | %12.2f | %10.1f | %9.2f" % (
+            modelName, "sync .keras", len(syncCheckpoint.blockSeconds), 1e3 * np.median(syncCheckpoint.blockSeconds),
+            1e3 * np.max(syncCheckpoint.blockSeconds), os.path.getsize(syncPath) / 1024, trainTime))
+
+        # Asynchronous, weights and optimizer state:
+        model = compiledModel(hiddenUnits)
+        manager = createManager(os.path.join(checkpointFolder, "async-%d" % hiddenUnits), saveInterval, keepLast=3)
+        startTime = time.perf_counter()
+        trainLosses(model, x, y, trainEpochs, callbacks=[AsyncCheckpoint(manager)])
+        trainTime = time.perf_counter() - startTime
+        closeManager(manager)
+        managerStats = manager["Stats"]
+        print("%-17s | %-12s | %5d | %12.2f | %12.2f | %10.1f | %9.2f" % (
+            modelName, "async .npz", managerStats["Saves"], 1e3 * np.median(managerStats["BlockSeconds"]),
+            1e3 * np.max(managerStats["BlockSeconds"]), np.mean(managerStats["Bytes"]) / 1024, trainTime))
+
+    # Resume: uninterrupted reference:
+    referenceLosses = trainLosses(compiledModel(), x, y, trainEpochs + resumeEpochs)
+    resumeLosses = {"reference": referenceLosses[-stepsPerEpoch * resumeEpochs:]}
+
+    # Interrupted after trainEpochs, saved both ways:
+    model = compiledModel()
+    trainLosses(model, x, y, trainEpochs)
+    kerasPath = os.path.join(checkpointFolder, "myModel.keras")
+    model.save(kerasPath)
+    manager = createManager(os.path.join(checkpointFolder, "resume"), saveInterval)
+    saveCheckpoint(manager, model, int(model.optimizer.iterations.numpy()), trainEpochs)
+    flushManager(manager)
+    closeManager(manager)
+
+    # As main.py: reload without the optimizer and compile again:
+    model = keras.models.load_model(kerasPath, compile=False, custom_objects={"customLoss": customLoss})
+    model.compile(optimizer="adam", loss=customLoss, metrics=["mean_squared_error"])
+    resumeLosses["reload + compile"] = trainLosses(model, x, y, resumeEpochs, initialEpoch=trainEpochs)
+
+    # Checkpoint restore:
+    model = compiledModel()
+    restoredStep, restoredEpoch = restoreCheckpoint(model, os.path.join(checkpointFolder, "resume"))
+    resumeLosses["restoreCheckpoint"] = trainLosses(model, x, y, resumeEpochs, initialEpoch=restoredEpoch)
+
+    print("\nResume after %d epochs (step %d), per-batch loss of the next epoch:" % (trainEpochs, restoredStep))
+    print("%-17s | %11s | %13s | %12s | %15s" % ("resume", "first loss", "max first 20", "epoch mean",
+                                                 "max |d| vs ref"))
+    for resumeName, batchLosses in resumeLosses.items():
+        print("%-17s | %11.5f | %13.5f | %12.5f | %15.2e" % (
+            resumeName, batchLosses[0], np.max(batchLosses[:20]), np.mean(batchLosses),
+            np.max(np.abs(batchLosses - resumeLosses["reference"]))))
@@ -0,0 +1,139 @@
+# File        :   benchmarkNumpyInference.py (NumPy Inference Parity and Benchmark)
+# Version     :   1.0.1
+# Description :   Checks the numerical parity of numpyInference.py with Keras (the
+#                 model of main.py trained for a few epochs, and a deeper one with
+#                 every supported activation) for float32, float16 and int8
+#                 weights (exits with status 1 if any check fails), then compares
+#                 Keras and the NumPy runtime: cold start (new process: imports,
+#                 load, first prediction), peak RSS of that process, file size and
+#                 rows/sec per batch size.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import keras
+from keras import Sequential
+from keras.layers import Input, Dense, Activation
+
+from compiledTraining import buildModel, customLoss
+from numpyInference import exportModel, loadRuntime, predict
+
+# Max absolute difference allowed against Keras, per weight type (relative
+# to the output range):
+parityTolerances = {"float32": 1e-5, "float16": 5e-3, "int8": 5e-2}
+batchSizes = [1, 32, 1024, 65536]
+
+# Cold start of a new process: imports, load and one prediction, prints
+# the seconds and the peak RSS (MB) as JSON:
+coldStartCode = {"Keras": """
+import time, resource, json
+startTime = time.perf_counter()
+import numpy as np
+import keras
+model = keras.models.load_model(MODEL_PATH, compile=False)
+model.predict(np.zeros((1, 100), np.float32), verbose=0)
+print(json.dumps([time.perf_counter() - startTime, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024]))
+""", "NumPy": """
+import time, resource, json
+startTime = time.perf_counter()
+import numpy as np
+from numpyInference import loadRuntime, predict
+runtime = loadRuntime(MODEL_PATH)
+predict(runtime, np.zeros((1, 100), np.float32))
+print(json.dumps([time.perf_counter() - startTime, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024]))
+"""}
+
+
+# The model of main.py, trained for a few epochs on random data:
+def trainedModel():
+    keras.utils.set_random_seed(0)
+    model = buildModel()
+    model.compile(optimizer="adam", loss=customLoss)
+    model.fit(np.random.rand(3000, 100), np.random.rand(3000, 2), batch_size=100, epochs=5, verbose=0)
+    return model
+
+
+# A deeper Sequential with every supported activation (and an Activation
+# layer):
+def deepModel():
+    keras.utils.set_random_seed(1)
+    model = Sequential([Input(shape=(100,)), Dense(64, activation="relu"), Dense(32, activation="tanh"),
+                        Dense(16), Activation("sigmoid"), Dense(8, activation="softmax")])
+    return model
+
+
+# Best rows/sec of a prediction function over a few runs:
+def rowsPerSecond(predictFunction, inputRows, totalRuns=5):
+    bestTime = np.inf
+    for _ in range(totalRuns):
+        startTime = time.perf_counter()
+        predictFunction(inputRows)
+        bestTime = min(bestTime, time.perf_counter() - startTime)
+    return len(inputRows) / bestTime
+
+
+# Seconds and peak RSS of a cold start in a new process:
+def coldStart(runtimeName, modelPath):
+    processCode = coldStartCode[runtimeName].replace("MODEL_PATH", repr(modelPath))
+    processOutput = subprocess.run([sys.executable, "-c", processCode], capture_output=True, text=True, check=True,
+                                   cwd=os.path.dirname(os.path.abspath(__file__)))
+    return json.loads(processOutput.stdout.strip().splitlines()[-1])
+
+
+randomGenerator = np.random.default_rng(0)
+testRows = randomGenerator.random((10000, 100)).astype(np.float32)
+
+with tempfile.TemporaryDirectory() as modelFolder:
+    # Parity:
+    print("%-10s | %-8s | %10s | %12s | %9s | %s" % ("model", "weights", "size (B)", "max |d|", "tolerance",
+                                                     "parity"))
+    parityPassed = True
+    for modelName, model in [("main.py", trainedModel()), ("deep", deepModel())]:
+        kerasOutput = model(testRows, training=False).numpy()
+        outputRange = max(float(np.ptp(kerasOutput)), 1e-6)
+        for weightType, parityTolerance in parityTolerances.items():
+            modelPath = exportModel(model, os.path.join(modelFolder, "%s-%s.npz" % (modelName, weightType)),
+                                    weightType)
+            numpyOutput = predict(loadRuntime(modelPath), testRows)
+            maxDifference = float(np.max(np.abs(numpyOutput - kerasOutput)))
+            passed = maxDifference <= parityTolerance * max(outputRange, 1.0)
+            parityPassed &= passed
+            print("%-10s | %-8s | %10d | %12.3e | %9.0e | %s" % (modelName, weightType, os.path.getsize(modelPath),
+                                                                 maxDifference, parityTolerance,
+                                                                 "PASS" if passed else "FAIL"))
+    # A parity failure fails the run (exit status 1), before the timings:
+    if not parityPassed:
+        print("Parity: FAILED")
+        sys.exit(1)
+    print("Parity: all passed\n")
+
+    # Cold start and peak RSS (new processes):
+    model = trainedModel()
+    kerasPath = os.path.join(modelFolder, "myModel.keras")
+    model.save(kerasPath)
+    numpyPath = exportModel(model, os.path.join(modelFolder, "myModel.npz"))
+    print("%-7s | %12s | %13s | %10s" % ("runtime", "cold start s", "peak RSS (MB)", "file (KB)"))
+    for runtimeName, modelPath in [("Keras", kerasPath), ("NumPy", numpyPath)]:
+        startSeconds, peakRss = coldStart(runtimeName, modelPath)
+        print("%-7s | %12.3f | %13.0f | %10.1f" % (runtimeName, startSeconds, peakRss,
+                                                   os.path.getsize(modelPath) / 1024))
+
+    # Rows per second:
+    runtime = loadRuntime(numpyPath, maxBatchSize=1024)
+    print("\n%-6s | %16s | %16s | %16s" % ("batch", "Keras predict", "Keras call", "NumPy runtime"))
+    for batchSize in batchSizes:
+        inputRows = randomGenerator.random((batchSize, 100)).astype(np.float32)
+        outputArray = np.empty((batchSize, 1), np.float32)
+        print("%-6d | %16.0f | %16.0f | %16.0f" % (
+            batchSize, rowsPerSecond(lambda r: model.predict(r, batch_size=1024, verbose=0), inputRows),
+            rowsPerSecond(lambda r: model(r, training=False).numpy(), inputRows),
+            rowsPerSecond(lambda r: predict(runtime, r, outputArray), inputRows)))
@@ -0,0 +1,81 @@
+# File        :   benchmarkTraining.py (Keras Training Throughput Benchmark)
+# Version     :   1.0.0
+# Description :   CPU benchmark of the training of main.py: steps/sec, samples/sec
+#                 and first-step latency (graph tracing and XLA compilation
+#                 included) per batch size, for model.fit on NumPy arrays (as
+#                 main.py, Keras default compile settings) against the compiled
+#                 path of compiledTraining.py (tf.data, with and without XLA,
+#                 several steps per execution). The thread pools are set once, at
+#                 the top, before TensorFlow runs anything.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import keras
+
+from compiledTraining import configureThreads, buildModel, customLoss, makeDataset, compileModel
+
+# Thread pools (0: TensorFlow decides):
+intraOpThreads, interOpThreads = 0, 0
+threadPools = configureThreads(intraOpThreads, interOpThreads)
+
+# Dataset size, batch sizes and epochs of the steady-state measure:
+totalSamples = 65536
+batchSizes = [32, 100, 256, 1024]
+steadyEpochs = 3
+
+# Training modes: (name, input, jit_compile, steps per execution):
+trainingModes = [("fit NumPy (main.py)", "NumPy", "auto", 1),
+                 ("tf.data, no XLA", "Dataset", False, 1),
+                 ("tf.data, XLA", "Dataset", True, 1),
+                 ("tf.data, XLA, 16 steps", "Dataset", True, 16)]
+
+
+# Records the time of the first train batch (per fit call):
+class FirstStepTimer(keras.callbacks.Callback):
+    def __init__(self):
+        super().__init__()
+        self.firstStepTime = None
+
+    def on_train_batch_end(self, batch, logs=None):
+        if self.firstStepTime is None:
+            self.firstStepTime = time.perf_counter()
+
+
+# Some random inputs/targets (as main.py):
+randomGenerator = np.random.default_rng(0)
+x = randomGenerator.random((totalSamples, 100))
+y = randomGenerator.random((totalSamples, 2))
+
+print("Thread pools (intra, inter): %s" % (threadPools,))
+print("%-23s | %6s | %14s | %9s | %12s" % ("mode", "batch", "first step ms", "steps/s", "samples/s"))
+for batchSize in batchSizes:
+    stepsPerEpoch = totalSamples // batchSize
+    for modeName, inputType, jitCompile, stepsPerExecution in trainingModes:
+        keras.utils.set_random_seed(0)
+        model = buildModel()
+        if inputType == "NumPy":
+            model.compile(optimizer="adam", loss=customLoss, metrics=["mean_squared_error"])
+            trainData, trainArgs = x[:stepsPerEpoch * batchSize], {"y": y[:stepsPerEpoch * batchSize],
+                                                                    "batch_size": batchSize}
+        else:
+            compileModel(model, jitCompile=jitCompile, stepsPerExecution=stepsPerExecution)
+            trainData, trainArgs = makeDataset(x, y, batchSize), {}
+
+        # First step (tracing and compilation), the rest of the first epoch:
+        stepTimer = FirstStepTimer()
+        startTime = time.perf_counter()
+        model.fit(trainData, epochs=1, callbacks=[stepTimer], verbose=0, **trainArgs)
+        firstStepTime = stepTimer.firstStepTime - startTime
+
+        # Steady state (the compiled train function is reused):
+        startTime = time.perf_counter()
+        model.fit(trainData, epochs=steadyEpochs, verbose=0, **trainArgs)
+        stepsPerSecond = steadyEpochs * stepsPerEpoch / (time.perf_counter() - startTime)
+
+        print("%-23s | %6d | %14.1f | %9.0f | %12.0f" % (modeName, batchSize, 1e3 * firstStepTime, stepsPerSecond,
+                                                          stepsPerSecond * batchSize))
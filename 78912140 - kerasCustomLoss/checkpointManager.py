@@ -0,0 +1,161 @@
+# File        :   checkpointManager.py (Asynchronous Keras Checkpoints)
+# Version     :   1.0.1
+# Description :   Checkpoints with the optimizer state for the model of main.py.
+#                 The training thread only copies the weights and the optimizer
+#                 variables (Adam moments and iteration count) to NumPy; a
+#                 background thread writes them (.npz, atomic rename), keeps the
+#                 last N checkpoints and deletes the older ones. Resuming restores
+#                 the weights and the optimizer, so training continues without
+#                 re-warming Adam. Reports the blocking time and size per save.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import glob
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+import keras
+
+# Checkpoint file names (global train step, zero padded so they sort):
+checkpointPattern = "checkpoint-%010d.npz"
+
+
+# Creates the checkpoint manager and starts its writer thread. saveInterval:
+# train steps (batches) between saves; keepLast: checkpoints kept on disk;
+# maxPending: snapshots waiting for the writer before a save blocks:
+def createManager(checkpointFolder, saveInterval=100, keepLast=3, maxPending=2):
+    os.makedirs(checkpointFolder, exist_ok=True)
+    manager = {"Folder": checkpointFolder, "SaveInterval": saveInterval, "KeepLast": keepLast,
+               "Queue": queue.Queue(maxsize=maxPending), "Error": None,
+               "Stats": {"Saves": 0, "BlockSeconds": [], "WriteSeconds": [], "Bytes": []}}
+    manager["Writer"] = threading.Thread(target=writerLoop, args=(manager,), daemon=True)
+    manager["Writer"].start()
+    return manager
+
+
+# Writer thread: writes the queued snapshots and prunes the old files:
+def writerLoop(manager):
+    while True:
+        snapshot = manager["Queue"].get()
+        if snapshot is None:
+            manager["Queue"].task_done()
+            break
+        try:
+            startTime = time.perf_counter()
+            checkpointPath = os.path.join(manager["Folder"], checkpointPattern % snapshot["step"])
+            temporaryPath = checkpointPath + ".tmp"
+            with open(temporaryPath, "wb") as checkpointFile:
+                np.savez(checkpointFile, **snapshot)
+            os.replace(temporaryPath, checkpointPath)
+
+            manager["Stats"]["WriteSeconds"].append(time.perf_counter() - startTime)
+            manager["Stats"]["Bytes"].append(os.path.getsize(checkpointPath))
+            for oldPath in listCheckpoints(manager["Folder"])[:-manager["KeepLast"]]:
+                os.remove(oldPath)
+        except Exception as writeError:
+            manager["Error"] = writeError
+        finally:
+            manager["Queue"].task_done()
+
+
+# Checkpoint paths of a folder, oldest first:
+def listCheckpoints(checkpointFolder):
+    return sorted(glob.glob(os.path.join(checkpointFolder, checkpointPattern.replace("%010d", "[0-9]" * 10))))
+
+
+# Raises the error of a failed write, so it is not lost:
+def checkWriterError(manager, functionName):
+    if manager["Error"] is not None:
+        raise RuntimeError(functionName + ">> Error: Checkpoint writer failed: " + str(manager["Error"]))
+
+
+# Copies the model weights and optimizer variables to NumPy (the only work
+# done on the training thread) and queues them for the writer:
+def saveCheckpoint(manager, model, trainStep, trainEpoch=0):
+    checkWriterError(manager, "saveCheckpoint")
+
+    startTime = time.perf_counter()
+    snapshot = {"step": np.int64(trainStep), "epoch": np.int64(trainEpoch)}
+    for i, weightArray in enumerate(model.get_weights()):
+        snapshot["weight_%d" % i] = weightArray
+    if model.optimizer is not None and model.optimizer.built:
+        for i, optimizerVariable in enumerate(model.optimizer.variables):
+            snapshot["optimizer_%d" % i] = np.array(optimizerVariable.numpy())
+    manager["Queue"].put(snapshot)
+
+    manager["Stats"]["BlockSeconds"].append(time.perf_counter() - startTime)
+    manager["Stats"]["Saves"] += 1
+
+
+# Waits for the pending writes (raises if one failed):
+def flushManager(manager):
+    manager["Queue"].join()
+    checkWriterError(manager, "flushManager")
+
+
+# Writes the pending snapshots and stops the writer thread (raises if a
+# write failed, so an older checkpoint is not restored unnoticed):
+def closeManager(manager):
+    manager["Queue"].put(None)
+    manager["Writer"].join()
+    checkWriterError(manager, "closeManager")
+
+
+# Restores the weights and the optimizer state of the latest checkpoint
+# (or checkpointPath) into a compiled model. Returns (step, epoch), or None
+# if there is no checkpoint:
+def restoreCheckpoint(model, checkpointFolder, checkpointPath=None):
+    if checkpointPath is None:
+        checkpointPaths = listCheckpoints(checkpointFolder)
+        if not checkpointPaths:
+            return None
+        checkpointPath = checkpointPaths[-1]
+
+    with np.load(checkpointPath) as checkpointData:
+        totalWeights = sum(1 for k in checkpointData.files if k.startswith("weight_"))
+        model.set_weights([checkpointData["weight_%d" % i] for i in range(totalWeights)])
+
+        # The optimizer variables exist once it is built:
+        optimizerKeys = [k for k in checkpointData.files if k.startswith("optimizer_")]
+        if optimizerKeys:
+            if not model.optimizer.built:
+                model.optimizer.build(model.trainable_variables)
+            optimizerVariables = model.optimizer.variables
+            if len(optimizerVariables) != len(optimizerKeys):
+                raise ValueError("restoreCheckpoint>> Error: The checkpoint has %d optimizer variables, the "
+                                 "optimizer has %d." % (len(optimizerKeys), len(optimizerVariables)))
+            for i, optimizerVariable in enumerate(optimizerVariables):
+                optimizerVariable.assign(checkpointData["optimizer_%d" % i])
+
+        return int(checkpointData["step"]), int(checkpointData["epoch"])
+
+
+# Keras callback: saves every saveInterval train steps (the optimizer
+# iteration count, so it also holds after resuming and with several steps
+# per execution) and waits for the writer at the end of training:
+class AsyncCheckpoint(keras.callbacks.Callback):
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+        self.trainEpoch = 0
+        self.lastSaved = None
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.trainEpoch = epoch
+
+    def on_train_batch_end(self, batch, logs=None):
+        trainStep = int(self.model.optimizer.iterations.numpy())
+        if self.lastSaved is None:
+            self.lastSaved = trainStep - trainStep % self.manager["SaveInterval"]
+        if trainStep - self.lastSaved >= self.manager["SaveInterval"]:
+            saveCheckpoint(self.manager, self.model, trainStep, self.trainEpoch)
+            self.lastSaved = trainStep
+
+    def on_train_end(self, logs=None):
+        flushManager(self.manager)
@@ -0,0 +1,69 @@
+# File        :   compiledTraining.py (Compiled Keras Training)
+# Version     :   1.0.1
+# Description :   Opt-in compiled training path for the model of main.py: the
+#                 model and the custom loss compiled with XLA (jit_compile), a
+#                 tf.data input pipeline (float32, cached, shuffled, batched and
+#                 prefetched) instead of NumPy arrays, several steps per
+#                 execution and configurable intra/inter-op thread pools.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import tensorflow as tf
+
+import keras
+from keras import Sequential
+from keras.layers import Input, Dense
+
+
+# Sets the TensorFlow thread pools (0: TensorFlow decides). Must run before
+# TensorFlow executes anything, the pools can not change afterwards:
+def configureThreads(intraOpThreads=0, interOpThreads=0):
+    tf.config.threading.set_intra_op_parallelism_threads(intraOpThreads)
+    tf.config.threading.set_inter_op_parallelism_threads(interOpThreads)
+    intraOpThreads = tf.config.threading.get_intra_op_parallelism_threads()
+    interOpThreads = tf.config.threading.get_inter_op_parallelism_threads()
+    return intraOpThreads, interOpThreads
+
+
+# The model of main.py:
+def buildModel(inputSize=100, hiddenUnits=5, outputUnits=1):
+    model = Sequential()
+    model.add(Input(shape=(inputSize,)))
+    model.add(Dense(units=hiddenUnits, activation="relu"))
+    model.add(Dense(units=outputUnits))
+    return model
+
+
+# Custom loss of main.py (only TensorFlow ops, XLA compiles it with the
+# model):
+@keras.saving.register_keras_serializable(package="kerasCustomLoss")
+def customLoss(y_true, y_pred):
+    squaredDifference = tf.math.square(y_true - y_pred)
+    return tf.reduce_mean(squaredDifference, axis=-1)
+
+
+# tf.data pipeline for the (x, y) arrays: float32, cached, shuffled every
+# epoch, batched and prefetched. dropRemainder keeps every batch the same
+# shape (a smaller last batch would trigger one more XLA compilation):
+def makeDataset(x, y, batchSize, shuffleData=True, dropRemainder=True, randomSeed=0):
+    dataset = tf.data.Dataset.from_tensor_slices((np.asarray(x, np.float32), np.asarray(y, np.float32))).cache()
+    if shuffleData:
+        dataset = dataset.shuffle(len(x), seed=randomSeed, reshuffle_each_iteration=True)
+    return dataset.batch(batchSize, drop_remainder=dropRemainder).prefetch(tf.data.AUTOTUNE)
+
+
+# Compiles the model for the compiled path: Adam, customLoss, XLA (or not)
+# and stepsPerExecution train steps per call of the compiled function:
+def compileModel(model, jitCompile=True, stepsPerExecution=1, learningRate=1e-3):
+    model.compile(optimizer=keras.optimizers.Adam(learning_rate=learningRate), loss=customLoss,
+                  metrics=["mean_squared_error"], jit_compile=jitCompile, steps_per_execution=stepsPerExecution)
+    return model
+
+
+# Trains with the compiled path. Returns the Keras history:
+def fitCompiled(model, x, y, batchSize=100, totalEpochs=5, callbacks=None, verbose="auto"):
+    dataset = makeDataset(x, y, batchSize, dropRemainder=len(x) >= batchSize)
+    return model.fit(dataset, epochs=totalEpochs, callbacks=callbacks, verbose=verbose)
@@ -0,0 +1,170 @@
+# File        :   inferenceServer.py (Dynamic Batching Inference Server)
+# Version     :   1.0.0
+# Description :   Local HTTP inference server for the model of main.py. The saved
+#                 model is loaded once; every request (one row of features, JSON
+#                 or raw float32) is queued and a batcher thread collects the
+#                 concurrent requests into one batch (up to maxBatchSize rows or
+#                 maxWaitMs after the first row), runs one forward pass and
+#                 answers each caller with its row of the output.
+#                 POST /predict  body: {"features": [...]} -> {"prediction": [...]}
+#                                or float32 bytes (application/octet-stream)
+#                                -> float32 bytes
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import tensorflow as tf
+
+import keras
+
+from compiledTraining import customLoss
+
+
+# Loads the saved model once (no optimizer, inference only):
+def loadModel(modelPath):
+    return keras.models.load_model(modelPath, compile=False,
+                                   custom_objects={"custom_loss": customLoss, "customLoss": customLoss})
+
+
+# Creates the batcher: the model as one traced function for any batch size
+# ("Batch") or model.predict per request ("Predict", the old way):
+def createBatcher(model, maxBatchSize=64, maxWaitMs=2.0, inferenceMode="Batch"):
+    inputSize = model.input_shape[-1]
+    forwardPass = tf.function(lambda batchRows: model(batchRows, training=False),
+                              input_signature=[tf.TensorSpec([None, inputSize], tf.float32)])
+    batcher = {"Model": model, "Forward": forwardPass, "InputSize": inputSize, "MaxBatchSize": maxBatchSize,
+               "MaxWait": maxWaitMs / 1e3, "Mode": inferenceMode, "Queue": queue.Queue(),
+               "Batch": np.zeros((maxBatchSize, inputSize), np.float32),
+               "Stats": {"Requests": 0, "Batches": 0}}
+    batcher["Thread"] = threading.Thread(target=batcherLoop, args=(batcher,), daemon=True)
+    batcher["Thread"].start()
+    return batcher
+
+
+# Queues one row (inputSize values), returns a Future with its output row:
+def submitRow(batcher, inputRow):
+    inputRow = np.asarray(inputRow, np.float32).reshape(-1)
+    if inputRow.size != batcher["InputSize"]:
+        raise ValueError("submitRow>> Error: Expected %d features, got %d." % (batcher["InputSize"], inputRow.size))
+    outputFuture = Future()
+    batcher["Queue"].put((inputRow, outputFuture))
+    return outputFuture
+
+
+# Collects up to maxBatchSize requests (waiting at most maxWait after the
+# first one) and answers them with one forward pass:
+def batcherLoop(batcher):
+    requestQueue, batchRows = batcher["Queue"], batcher["Batch"]
+    while True:
+        pendingRequests = [requestQueue.get()]
+        if pendingRequests[0] is None:
+            break
+        deadline = time.perf_counter() + batcher["MaxWait"]
+        while len(pendingRequests) < batcher["MaxBatchSize"]:
+            remainingTime = deadline - time.perf_counter()
+            try:
+                nextRequest = requestQueue.get(timeout=remainingTime) if remainingTime > 0 else \
+                    requestQueue.get_nowait()
+            except queue.Empty:
+                break
+            if nextRequest is None:
+                requestQueue.put(None)
+                break
+            pendingRequests.append(nextRequest)
+
+        # One forward pass for the batch:
+        batchSize = len(pendingRequests)
+        for i, (inputRow, _) in enumerate(pendingRequests):
+            batchRows[i] = inputRow
+        try:
+            if batcher["Mode"] == "Predict":
+                batchOutput = np.concatenate([batcher["Model"].predict(batchRows[i:i + 1], verbose=0)
+                                              for i in range(batchSize)])
+            else:
+                batchOutput = batcher["Forward"](batchRows[:batchSize]).numpy()
+            for i, (_, outputFuture) in enumerate(pendingRequests):
+                outputFuture.set_result(batchOutput[i])
+        except Exception as inferenceError:
+            for _, outputFuture in pendingRequests:
+                outputFuture.set_exception(inferenceError)
+
+        batcher["Stats"]["Requests"] += batchSize
+        batcher["Stats"]["Batches"] += 1
+
+
+# Stops the batcher thread (after the queued requests):
+def stopBatcher(batcher):
+    batcher["Queue"].put(None)
+    batcher["Thread"].join()
+
+
+# HTTP handler: POST /predict, JSON or raw float32 rows:
+class PredictHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    batcher = None
+
+    def do_POST(self):
+        requestBody = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path != "/predict":
+            self.sendBody(404, b"", "text/plain")
+            return
+        rawRows = self.headers.get("Content-Type", "") == "application/octet-stream"
+        try:
+            if rawRows:
+                inputRow = np.frombuffer(requestBody, np.float32)
+            else:
+                inputRow = json.loads(requestBody)["features"]
+            outputRow = submitRow(self.batcher, inputRow).result()
+        except (ValueError, KeyError, TypeError) as requestError:
+            self.sendBody(400, json.dumps({"error": str(requestError)}).encode(), "application/json")
+            return
+        except Exception as inferenceError:
+            self.sendBody(500, json.dumps({"error": str(inferenceError)}).encode(), "application/json")
+            return
+
+        if rawRows:
+            self.sendBody(200, outputRow.astype(np.float32).tobytes(), "application/octet-stream")
+        else:
+            self.sendBody(200, json.dumps({"prediction": outputRow.tolist()}).encode(), "application/json")
+
+    def sendBody(self, statusCode, responseBody, contentType):
+        self.send_response(statusCode)
+        self.send_header("Content-Type", contentType)
+        self.send_header("Content-Length", str(len(responseBody)))
+        self.end_headers()
+        self.wfile.write(responseBody)
+
+    def log_message(self, *logArgs):
+        pass
+
+
+# Loads the model and serves it on host:port until interrupted:
+def runServer(modelPath, host="127.0.0.1", port=8500, maxBatchSize=64, maxWaitMs=2.0, inferenceMode="Batch"):
+    batcher = createBatcher(loadModel(modelPath), maxBatchSize, maxWaitMs, inferenceMode)
+    # Trace the forward pass before the first request:
+    submitRow(batcher, np.zeros(batcher["InputSize"], np.float32)).result()
+
+    handlerClass = type("BoundPredictHandler", (PredictHandler,), {"batcher": batcher})
+    httpServer = ThreadingHTTPServer((host, port), handlerClass)
+    httpServer.daemon_threads = True
+    try:
+        httpServer.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpServer.server_close()
+        stopBatcher(batcher)
+
+
+if __name__ == "__main__":
+    # Model saved by main.py:
+    runServer("saved_model/myModel.keras", maxBatchSize=64, maxWaitMs=2.0)
@@ -0,0 +1,125 @@
+# File        :   loadGenerator.py (Inference Server Load Generator)
+# Version     :   1.0.0
+# Description :   Load test of inferenceServer.py: for every batching setting a
+#                 server process is started on a model like the one of main.py,
+#                 then client processes (several caller threads each, persistent
+#                 HTTP connections) send single rows of 100 features as fast as
+#                 they get answers. Reports p50/p99 latency and throughput per
+#                 setting, against model.predict per request.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import http.client
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# Server address, load and duration:
+serverHost, serverPort = "127.0.0.1", 8500
+clientProcesses, callerThreads = 4, 8
+testSeconds = 10.0
+
+# Batching settings: (name, max batch size, max wait ms, inference mode):
+batchingSettings = [("predict per request", 1, 0.0, "Predict"),
+                    ("no batching", 1, 0.0, "Batch"),
+                    ("batch 16, wait 1 ms", 16, 1.0, "Batch"),
+                    ("batch 64, wait 2 ms", 64, 2.0, "Batch"),
+                    ("batch 256, wait 5 ms", 256, 5.0, "Batch")]
+
+
+# Saves a model like the one of main.py (random weights) and returns its path:
+def saveTestModel(modelFolder):
+    from compiledTraining import buildModel
+    modelPath = os.path.join(modelFolder, "myModel.keras")
+    buildModel().save(modelPath)
+    return modelPath
+
+
+# Server process (TensorFlow is only imported here, the clients stay light):
+def serveModel(*serverArgs):
+    from inferenceServer import runServer
+    runServer(*serverArgs)
+
+
+# Waits until the server answers (returns False after timeoutSeconds):
+def waitForServer(timeoutSeconds=60.0):
+    deadline = time.perf_counter() + timeoutSeconds
+    while time.perf_counter() < deadline:
+        try:
+            httpConnection = http.client.HTTPConnection(serverHost, serverPort, timeout=1.0)
+            httpConnection.request("POST", "/predict", np.zeros(100, np.float32).tobytes(),
+                                   {"Content-Type": "application/octet-stream"})
+            httpConnection.getresponse().read()
+            httpConnection.close()
+            return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+# One caller: sends rows one after the other until the end time, appends
+# the latencies (seconds):
+def callerLoop(endTime, randomSeed, callerLatencies):
+    randomGenerator = np.random.default_rng(randomSeed)
+    httpConnection = http.client.HTTPConnection(serverHost, serverPort)
+    requestHeaders = {"Content-Type": "application/octet-stream"}
+    while time.perf_counter() < endTime:
+        requestBody = randomGenerator.random(100, np.float32).tobytes()
+        startTime = time.perf_counter()
+        httpConnection.request("POST", "/predict", requestBody, requestHeaders)
+        httpResponse = httpConnection.getresponse()
+        httpResponse.read()
+        if httpResponse.status != 200:
+            raise RuntimeError("callerLoop>> Error: HTTP status %d" % httpResponse.status)
+        callerLatencies.append(time.perf_counter() - startTime)
+    httpConnection.close()
+
+
+# One client process: callerThreads callers for testSeconds. Returns the
+# latencies of all its requests:
+def clientProcess(processIndex):
+    endTime = time.perf_counter() + testSeconds
+    callerLatencies = []
+    callers = [threading.Thread(target=callerLoop, args=(endTime, 1000 * processIndex + i, callerLatencies))
+               for i in range(callerThreads)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+    return callerLatencies
+
+
+if __name__ == "__main__":
+    # Spawned processes (forking after TensorFlow started is not safe):
+    processContext = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as modelFolder:
+        modelPath = saveTestModel(modelFolder)
+        print("%d client processes x %d callers, %.0f s per setting" % (clientProcesses, callerThreads, testSeconds))
+        print("%-22s | %9s | %9s | %12s" % ("setting", "p50 ms", "p99 ms", "requests/s"))
+
+        for settingName, maxBatchSize, maxWaitMs, inferenceMode in batchingSettings:
+            serverProcess = processContext.Process(target=serveModel, args=(modelPath, serverHost, serverPort,
+                                                                            maxBatchSize, maxWaitMs, inferenceMode))
+            serverProcess.start()
+            if not waitForServer():
+                serverProcess.terminate()
+                raise RuntimeError("Server did not start.")
+
+            # Load (throughput over the test window of the callers):
+            with processContext.Pool(clientProcesses) as clientPool:
+                processLatencies = clientPool.map(clientProcess, range(clientProcesses))
+            allLatencies = np.concatenate([np.asarray(p) for p in processLatencies])
+
+            serverProcess.terminate()
+            serverProcess.join()
+
+            print("%-22s | %9.2f | %9.2f | %12.0f" % (settingName, 1e3 * np.percentile(allLatencies, 50),
+                                                      1e3 * np.percentile(allLatencies, 99),
+                                                      len(allLatencies) / testSeconds))
@@ -1,7 +1,10 @@
 # File        :   main.py
-# Version     :   1.0.1 (Keras Custom Loss)
+# Version     :   1.3.0 (Keras Custom Loss)
 # Description :   Keras model saving/reloading with custom loss
 #                 Answer for: https://stackoverflow.com/q/78912140/12728244
+#                 Opt-in compiled training: XLA, tf.data input, thread pools.
+#                 Opt-in asynchronous checkpoints that keep the optimizer state.
+#                 Optional export for TensorFlow-free NumPy inference.
 
 # Date:       :   Aug 28, 2024
 # Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
@@ -13,6 +16,28 @@ import tensorflow as tf
 from keras import Sequential
 from keras.layers import Input, Dense
 
+from compiledTraining import configureThreads, buildModel, compileModel, fitCompiled
+from checkpointManager import createManager, saveCheckpoint, closeManager, restoreCheckpoint, AsyncCheckpoint
+from numpyInference import exportModel
+
+# Training path: "Default" (fit on NumPy arrays) or "Compiled" (XLA, tf.data):
+trainingPath = "Default"
+
+# Thread pools of the compiled path (0: TensorFlow decides), set before
+# TensorFlow runs anything:
+intraOpThreads, interOpThreads = 0, 0
+if trainingPath == "Compiled":
+    configureThreads(intraOpThreads, interOpThreads)
+
+# Checkpoints: "Keras" (.keras archive, the optimizer is created again) or
+# "Async" (background checkpoints of the weights and the optimizer state):
+checkpointMode = "Keras"
+checkpointFolder = 'saved_model/checkpoints'
+
+# Export the trained model for numpyInference.py ("float32", "float16",
+# "int8" weights, None: no export):
+exportWeights = None
+
 # Model architecture:
 model = Sequential()
 model.add(Input(shape=(100,)))
@@ -25,7 +50,10 @@ def custom_loss(y_true, y_pred):
     return tf.reduce_mean(squared_difference, axis=-1)  
 
 # Compile model:
-model.compile(optimizer="adam", loss=custom_loss, metrics= ["mean_squared_error"])
+if trainingPath == "Compiled":
+    compileModel(model, jitCompile=True)
+else:
+    model.compile(optimizer="adam", loss=custom_loss, metrics= ["mean_squared_error"])
 
 # Show summary:
 model.summary()
@@ -34,24 +62,61 @@ model.summary()
 x=np.random.rand(300,100)
 y=np.random.rand(300,2)
 
+# Checkpoints every 2 steps in the background (weights and optimizer):
+fitCallbacks = None
+if checkpointMode == "Async":
+    checkpointManager = createManager(checkpointFolder, saveInterval=2, keepLast=3)
+    fitCallbacks = [AsyncCheckpoint(checkpointManager)]
+
 # Fit the model for 5 epochs:
-model.fit(x,y,batch_size=100, epochs=5)
+if trainingPath == "Compiled":
+    fitCompiled(model, x, y, batchSize=100, totalEpochs=5, callbacks=fitCallbacks)
+else:
+    model.fit(x,y,batch_size=100, epochs=5, callbacks=fitCallbacks)
+
+if checkpointMode == "Async":
+    # Last checkpoint, written before the writer stops:
+    saveCheckpoint(checkpointManager, model, int(model.optimizer.iterations.numpy()), 5)
+    closeManager(checkpointManager)
+    print("Checkpoints saved, blocking ms:", [round(1e3 * t, 2) for t in checkpointManager["Stats"]["BlockSeconds"]])
 
-# Save model:
-path = 'saved_model/myModel.keras'
+    # Resume: same model, compiled, weights and Adam state restored:
+    del model
+    model = buildModel()
+    if trainingPath == "Compiled":
+        compileModel(model, jitCompile=True)
+    else:
+        model.compile(optimizer="adam", loss=custom_loss, metrics= ["mean_squared_error"])
+    restoredStep, restoredEpoch = restoreCheckpoint(model, checkpointFolder)
+    print("Model restored at step", restoredStep)
 
-# Explicit deletion of the model object:
-model.save(path)
-print("Model saved")
+else:
+    # Save model:
+    path = 'saved_model/myModel.keras'
 
-# Load model:
-del model
-model = tf.keras.models.load_model(path, compile=False, custom_objects={"custom_loss": custom_loss})
-print("Model reloaded")
+    # Explicit deletion of the model object:
+    model.save(path)
+    print("Model saved")
 
-# Compile:
-model.compile(optimizer="adam", loss=custom_loss, metrics= ["mean_squared_error"])
+    # Load model:
+    del model
+    model = tf.keras.models.load_model(path, compile=False, custom_objects={"custom_loss": custom_loss})
+    print("Model reloaded")
+
+    # Compile:
+    if trainingPath == "Compiled":
+        compileModel(model, jitCompile=True)
+    else:
+        model.compile(optimizer="adam", loss=custom_loss, metrics= ["mean_squared_error"])
 
 # Continue training for 5 more epochs:
-model.fit(x, y, batch_size=100, epochs=5)
-print("Done fitting")
\ No newline at end of file
+if trainingPath == "Compiled":
+    fitCompiled(model, x, y, batchSize=100, totalEpochs=5)
+else:
+    model.fit(x, y, batch_size=100, epochs=5)
+print("Done fitting")
+
+# (Optional) Export for TensorFlow-free inference:
+if exportWeights is not None:
+    exportModel(model, 'saved_model/myModel.npz', weightType=exportWeights)
+    print("Model exported")
@@ -0,0 +1,154 @@
+# File        :   numpyInference.py (TensorFlow-free NumPy Inference)
+# Version     :   1.0.1
+# Description :   Exports a trained Keras Sequential of Dense/Activation layers
+#                 (as the 100 -> 5 -> 1 network of main.py) to an .npz (float32,
+#                 float16 or int8 weights with per-column scales) and
+#                 runs batched inference on it with NumPy only: weights as
+#                 float32 at load time, preallocated per-layer buffers, in-place
+#                 bias and activations. Neither the export nor the runtime
+#                 imports TensorFlow.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+
+# Format version of the exported file:
+formatVersion = 1
+
+
+# In-place activations (on a float32 buffer):
+def reluActivation(layerBuffer):
+    np.maximum(layerBuffer, 0, out=layerBuffer)
+
+
+def sigmoidActivation(layerBuffer):
+    np.negative(layerBuffer, out=layerBuffer)
+    np.exp(layerBuffer, out=layerBuffer)
+    layerBuffer += 1
+    np.reciprocal(layerBuffer, out=layerBuffer)
+
+
+def tanhActivation(layerBuffer):
+    np.tanh(layerBuffer, out=layerBuffer)
+
+
+def softmaxActivation(layerBuffer):
+    layerBuffer -= layerBuffer.max(axis=-1, keepdims=True)
+    np.exp(layerBuffer, out=layerBuffer)
+    layerBuffer /= layerBuffer.sum(axis=-1, keepdims=True)
+
+
+activationFunctions = {"linear": None, "relu": reluActivation, "sigmoid": sigmoidActivation,
+                       "tanh": tanhActivation, "softmax": softmaxActivation}
+
+
+# Activation name of a Keras layer config (string or serialized object):
+def activationName(layerConfig):
+    layerActivation = layerConfig.get("activation", "linear")
+    if isinstance(layerActivation, dict):
+        layerActivation = layerActivation.get("config", {}).get("name", layerActivation.get("class_name"))
+    if layerActivation not in activationFunctions:
+        raise ValueError("activationName>> Error: Unsupported activation: " + str(layerActivation))
+    return layerActivation
+
+
+# Exports a Sequential of Dense/Activation layers to outputPath (.npz).
+# weightType: "float32", "float16" or "int8" (symmetric, one scale per
+# output column). Biases stay float32. The int8 scales are one more .npz
+# member per layer, so int8 only beats float16 on size from a few thousand
+# weights: the 100 -> 5 -> 1 net of main.py is 2873 bytes in int8 against
+# 2874 in float16 (3884 in float32):
+def exportModel(model, outputPath, weightType="float32"):
+    if weightType not in ("float32", "float16", "int8"):
+        raise ValueError("exportModel>> Error: Unknown weight type: " + str(weightType))
+
+    exportArrays = {"format": np.int64(formatVersion), "weightType": np.array(weightType)}
+    layerActivations = []
+    for layer in model.layers:
+        layerType = layer.__class__.__name__
+        if layerType == "InputLayer":
+            continue
+        if layerType == "Activation":
+            # Folded into the previous layer (which must be linear):
+            if not layerActivations or layerActivations[-1] != "linear":
+                raise ValueError("exportModel>> Error: Activation layer without a linear Dense before it.")
+            layerActivations[-1] = activationName(layer.get_config())
+            continue
+        if layerType != "Dense":
+            raise ValueError("exportModel>> Error: Unsupported layer: " + layerType)
+
+        i = len(layerActivations)
+        layerWeights = layer.get_weights()
+        layerKernel = np.asarray(layerWeights[0], np.float32)
+        layerBias = np.asarray(layerWeights[1], np.float32) if len(layerWeights) > 1 else \
+            np.zeros(layerKernel.shape[1], np.float32)
+
+        if weightType == "int8":
+            kernelScale = np.abs(layerKernel).max(axis=0) / 127.0
+            kernelScale[kernelScale == 0] = 1.0
+            exportArrays["kernel_%d" % i] = np.round(layerKernel / kernelScale).astype(np.int8)
+            exportArrays["scale_%d" % i] = kernelScale.astype(np.float32)
+        else:
+            exportArrays["kernel_%d" % i] = layerKernel.astype(weightType)
+        exportArrays["bias_%d" % i] = layerBias
+        layerActivations.append(activationName(layer.get_config()))
+
+    exportArrays["activations"] = np.array(layerActivations)
+    with open(outputPath, "wb") as outputFile:
+        np.savez(outputFile, **exportArrays)
+    return outputPath
+
+
+# Loads an exported model: float32 kernels (dequantized once) and buffers
+# for up to maxBatchSize rows. Returns the runtime dictionary:
+def loadRuntime(modelPath, maxBatchSize=1024):
+    with np.load(modelPath) as modelData:
+        if int(modelData["format"]) != formatVersion:
+            raise ValueError("loadRuntime>> Error: Unknown format version: " + str(modelData["format"]))
+        runtimeLayers = []
+        for i, layerActivation in enumerate(modelData["activations"].tolist()):
+            layerKernel = modelData["kernel_%d" % i].astype(np.float32)
+            if "scale_%d" % i in modelData.files:
+                layerKernel *= modelData["scale_%d" % i]
+            runtimeLayers.append({"Kernel": np.ascontiguousarray(layerKernel), "Bias": modelData["bias_%d" % i],
+                                  "Activation": activationFunctions[layerActivation]})
+
+    for runtimeLayer in runtimeLayers:
+        runtimeLayer["Buffer"] = np.empty((maxBatchSize, runtimeLayer["Kernel"].shape[1]), np.float32)
+    return {"Layers": runtimeLayers, "MaxBatchSize": maxBatchSize, "InputSize": runtimeLayers[0]["Kernel"].shape[0],
+            "OutputSize": runtimeLayers[-1]["Kernel"].shape[1]}
+
+
+# Forward pass of up to maxBatchSize rows (float32), into the layer
+# buffers. Returns a view of the last buffer:
+def forwardChunk(runtime, inputRows):
+    totalRows = inputRows.shape[0]
+    layerInput = inputRows
+    for runtimeLayer in runtime["Layers"]:
+        layerOutput = runtimeLayer["Buffer"][:totalRows]
+        np.matmul(layerInput, runtimeLayer["Kernel"], out=layerOutput)
+        layerOutput += runtimeLayer["Bias"]
+        if runtimeLayer["Activation"] is not None:
+            runtimeLayer["Activation"](layerOutput)
+        layerInput = layerOutput
+    return layerInput
+
+
+# Batched inference of any number of rows (in chunks of maxBatchSize). The
+# result goes into outputArray if given (rows x output size, float32):
+def predict(runtime, inputRows, outputArray=None):
+    inputRows = np.asarray(inputRows, np.float32)
+    if inputRows.ndim == 1:
+        inputRows = inputRows[None]
+    if inputRows.shape[1] != runtime["InputSize"]:
+        raise ValueError("predict>> Error: Expected %d features, got %d." % (runtime["InputSize"], inputRows.shape[1]))
+
+    if outputArray is None:
+        outputArray = np.empty((inputRows.shape[0], runtime["OutputSize"]), np.float32)
+    maxBatchSize = runtime["MaxBatchSize"]
+    for chunkStart in range(0, inputRows.shape[0], maxBatchSize):
+        chunkRows = inputRows[chunkStart:chunkStart + maxBatchSize]
+        outputArray[chunkStart:chunkStart + len(chunkRows)] = forwardChunk(runtime, chunkRows)
+    return outputArray
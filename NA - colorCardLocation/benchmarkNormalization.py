@@ -0,0 +1,87 @@
+# File        :   benchmarkNormalization.py (Gain Division Benchmark)
+# Version     :   1.0.0
+# Description :   Compares the original gain division (full resolution closing,
+#                 float64 division) against illuminationNormalization.py on
+#                 synthetic unevenly-lit charts. Reports latency, peak traced
+#                 memory and the difference against the original output.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+import tracemalloc
+
+import numpy as np
+import cv2
+
+from illuminationNormalization import gainDivisionReference, normalizeIllumination
+
+
+# Creates a synthetic chart: color patches on a white card under a
+# strong illumination falloff, plus noise:
+def makeChart(megaPixels, randomGenerator):
+    imageHeight = int(np.sqrt(megaPixels * 1e6 * 2 / 3))
+    imageWidth = int(imageHeight * 3 / 2)
+    chartImage = np.full((imageHeight, imageWidth, 3), 240, np.uint8)
+
+    # Random patches, smaller than the closing kernel (like the chart cells):
+    for _ in range(400):
+        x, y = randomGenerator.integers(0, imageWidth - 90), randomGenerator.integers(0, imageHeight - 90)
+        size = int(randomGenerator.integers(30, 90))
+        chartImage[y:y + size, x:x + size] = randomGenerator.integers(20, 220, size=3)
+
+    # Radial falloff (60% at the corners) and noise:
+    yy, xx = np.mgrid[0:imageHeight, 0:imageWidth].astype(np.float32)
+    radius = np.hypot((xx - imageWidth / 2) / imageWidth, (yy - imageHeight / 2) / imageHeight)
+    falloff = 1.0 - 0.4 * (radius / radius.max()) ** 2
+    chartImage = chartImage * falloff[:, :, None] + randomGenerator.normal(0, 3, chartImage.shape)
+
+    return np.clip(chartImage, 0, 255).astype(np.uint8)
+
+
+# Runs function(), returns (seconds, peak traced bytes, result):
+def measure(function):
+    tracemalloc.start()
+    startTime = time.perf_counter()
+    result = function()
+    elapsedTime = time.perf_counter() - startTime
+    _, peakBytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsedTime, peakBytes, result
+
+
+# Fixed seed so runs are comparable:
+randomGenerator = np.random.default_rng(4)
+
+# Chart sizes to test:
+chartSizes = [2.0, 8.0]
+
+print("%5s | %-24s | %9s | %10s | %9s %9s" % ("MP", "method", "time (ms)", "peak (MB)", "mean diff", "p99 diff"))
+
+for megaPixels in chartSizes:
+    inputImage = makeChart(megaPixels, randomGenerator)
+
+    referenceTime, referencePeak, referenceOutput = measure(lambda: gainDivisionReference(inputImage))
+    print("%5.1f | %-24s | %9.1f | %10.1f | %9s %9s" % (megaPixels, "reference (float64)", 1e3 * referenceTime,
+                                                       referencePeak / 2 ** 20, "-", "-"))
+
+    # The output buffer and the work buffers are preallocated (as in a video/batch loop):
+    outputImage = np.empty_like(inputImage)
+    runs = [("full res, exact", 1, "float32"),
+            ("1/4 res, float32", 4, "float32"),
+            ("1/4 res, uint16 fixed", 4, "uint16"),
+            ("1/8 res, float32", 8, "float32")]
+
+    for runName, downscale, precision in runs:
+        buffers = {}
+        # Warm-up call allocates the work buffers:
+        normalizeIllumination(inputImage, 100, downscale, precision, outputImage, buffers)
+        runTime, runPeak, _ = measure(lambda: normalizeIllumination(inputImage, 100, downscale, precision,
+                                                                    outputImage, buffers))
+
+        # Output difference against the original implementation:
+        absDifference = cv2.absdiff(outputImage, referenceOutput)
+        print("%5.1f | %-24s | %9.1f | %10.1f | %9.2f %9d" % (megaPixels, runName, 1e3 * runTime, runPeak / 2 ** 20,
+                                                             absDifference.mean(),
+                                                             np.percentile(absDifference, 99)))
@@ -0,0 +1,97 @@
+# File        :   benchmarkPalette.py (Palette Assignment Benchmark)
+# Version     :   1.0.0
+# Description :   Compares k-means quantization + distance filter against the
+#                 direct palette lookup table mode of colorQuantization.py on
+#                 synthetic charts. Reports latency and agreement with an exact
+#                 per-pixel nearest-palette classification.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+
+from colorQuantization import imageQuantization, buildPaletteLut, paletteLabels, nearestPaletteLabels, \
+    paletteLutCache, noMatchLabel
+
+
+# Creates a synthetic chart: cells with palette colors and random colors
+# on a gray card, plus noise:
+def makeChart(megaPixels, paletteColors, randomGenerator):
+    imageHeight = int(np.sqrt(megaPixels * 1e6 * 3 / 4))
+    imageWidth = int(imageHeight * 4 / 3)
+    chartImage = np.full((imageHeight, imageWidth, 3), 128.0, np.float32)
+
+    rows, cols = 6, 8
+    cellHeight, cellWidth = imageHeight // rows, imageWidth // cols
+    for r in range(rows):
+        for c in range(cols):
+            if (r + c) % 3 == 0:
+                cellColor = paletteColors[(r * cols + c) % len(paletteColors)]
+            else:
+                cellColor = randomGenerator.uniform(0, 255, size=3)
+            chartImage[r * cellHeight + 4:(r + 1) * cellHeight - 4, c * cellWidth + 4:(c + 1) * cellWidth - 4] = \
+                cellColor
+
+    chartImage += randomGenerator.normal(0, 6, chartImage.shape).astype(np.float32)
+    return np.clip(chartImage, 0, 255).astype(np.uint8)
+
+
+# Runs function() a few times, returns the best time and the last result:
+def timeIt(function, repeats=3):
+    bestTime = np.inf
+    for _ in range(repeats):
+        startTime = time.perf_counter()
+        result = function()
+        bestTime = min(bestTime, time.perf_counter() - startTime)
+    return bestTime, result
+
+
+# Fixed seed so runs are comparable:
+randomGenerator = np.random.default_rng(5)
+
+# Same palette/filter as the "Strip" in main.py:
+colorData = {"Threshold": [[245, 245, 245], [90, 84, 174]], "High": [255, 255, 255], "Low": [0, 0, 0]}
+minDistance = 30
+k = 10
+
+# Chart sizes (the full k-means fit is only run on the small ones):
+chartSizes = [0.5, 2.0, 8.0]
+maxFullKmeansSize = 2.0
+
+print("%5s | %-22s | %10s | %9s | %9s" % ("MP", "method", "time (ms)", "speedup", "agreement"))
+
+for megaPixels in chartSizes:
+    inputImage = makeChart(megaPixels, colorData["Threshold"], randomGenerator)
+
+    # Exact per-pixel palette match (the ground truth for the lookup table):
+    exactMatch = nearestPaletteLabels(inputImage.reshape(-1, 3), colorData["Threshold"], minDistance)
+    exactMatch = (exactMatch != noMatchLabel).reshape(inputImage.shape[:2])
+
+    runs = [("k-means Histogram", "Histogram")]
+    if megaPixels <= maxFullKmeansSize:
+        runs.insert(0, ("k-means Full (cv2)", "Full"))
+
+    baseTime = None
+    for runName, fitMode in runs:
+        runTime, (segmentedImage, _) = timeIt(lambda: imageQuantization(inputImage, k, True, colorData, minDistance,
+                                                                        fitMode=fitMode), repeats=1)
+        baseTime = baseTime or runTime
+        agreement = np.mean((segmentedImage[:, :, 0] == 255) == exactMatch)
+        print("%5.1f | %-22s | %10.1f | %8.2fx | %8.2f%%" % (megaPixels, runName, 1e3 * runTime, baseTime / runTime,
+                                                            100 * agreement))
+
+    for lutBits in [5, 6]:
+        # Table build (first chart only, then cached):
+        paletteLutCache.clear()
+        buildTime, paletteLut = timeIt(lambda: buildPaletteLut(colorData["Threshold"], minDistance, lutBits), 1)
+
+        runTime, labels = timeIt(lambda: paletteLabels(inputImage, paletteLut, lutBits))
+        agreement = np.mean((labels != noMatchLabel) == exactMatch)
+        print("%5.1f | %-22s | %10.1f | %8.2fx | %8.2f%%   (table build %.1f ms)" % (megaPixels,
+                                                                                    "palette LUT %d bits" % lutBits,
+                                                                                    1e3 * runTime, baseTime / runTime,
+                                                                                    100 * agreement,
+                                                                                    1e3 * buildTime))
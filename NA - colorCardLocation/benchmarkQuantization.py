@@ -0,0 +1,144 @@
+# File        :   benchmarkQuantization.py (Color Quantization Benchmark)
+# Version     :   1.1.0
+# Description :   Compares the original full-pixel cv2.kmeans fit against the
+#                 histogram, subsample and warm-started fits of colorQuantization.py
+#                 on synthetic color charts. Reports latency, speedup, compactness,
+#                 how well the centers agree with the full fit and the label
+#                 agreement (permutation invariant) with the chart's ground truth.
+#                 The truth has 10 classes (9 patches + card) for k = 10, but
+#                 the illumination gradient makes splitting the card (79% of the
+#                 pixels) in two clusters tighter than keeping two patches apart,
+#                 so every fit tops out near 60%. The full fit from random
+#                 centers lands in a worse local minimum (more patches merged,
+#                 higher compactness), at about 45%.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+
+from colorQuantization import fitCenters
+
+
+# Creates a synthetic color chart: a grid of flat color patches over a white
+# card, with a soft illumination gradient and sensor noise. Returns the chart
+# and the true labels (0: card, i + 1: patch i):
+def makeChart(megaPixels, patchColors, randomGenerator, colorShift=0.0):
+    imageHeight = int(np.sqrt(megaPixels * 1e6 * 3 / 4))
+    imageWidth = int(imageHeight * 4 / 3)
+    chartImage = np.full((imageHeight, imageWidth, 3), 235.0, np.float32)
+    truthLabels = np.zeros((imageHeight, imageWidth), np.int64)
+
+    # Patches on a 4 x 6 grid:
+    rows, cols = 4, 6
+    cellHeight, cellWidth = imageHeight // rows, imageWidth // cols
+    for i, patchColor in enumerate(patchColors):
+        r, c = divmod(i, cols)
+        y, x = r * cellHeight + cellHeight // 8, c * cellWidth + cellWidth // 8
+        chartImage[y:y + 3 * cellHeight // 4, x:x + 3 * cellWidth // 4] = np.asarray(patchColor) + colorShift
+        truthLabels[y:y + 3 * cellHeight // 4, x:x + 3 * cellWidth // 4] = i + 1
+
+    # Illumination gradient and noise:
+    gradient = np.linspace(0.9, 1.0, imageWidth, dtype=np.float32)[None, :, None]
+    chartImage *= gradient
+    chartImage += randomGenerator.normal(0.0, 4.0, chartImage.shape).astype(np.float32)
+
+    return np.clip(chartImage, 0, 255).astype(np.uint8), truthLabels.ravel()
+
+
+# Sum of squared distances of every pixel to its center (k-means compactness):
+def compactness(pixelValues, centers, labels):
+    residuals = np.float32(pixelValues) - np.asarray(centers, np.float32)[labels]
+    return float(np.sum(np.einsum("ij,ij->i", residuals, residuals), dtype=np.float64))
+
+
+# Greedily matches every center to its closest (unused) reference center,
+# returns the mapping and the matched distances:
+def matchCenters(centers, referenceCenters):
+    pairDistances = np.linalg.norm(centers[:, None, :] - referenceCenters[None, :, :], axis=2)
+    mapping = np.full(len(centers), -1)
+    matchedDistances = np.zeros(len(centers))
+    for flatIndex in np.argsort(pairDistances, axis=None):
+        i, j = divmod(int(flatIndex), len(referenceCenters))
+        if mapping[i] == -1 and j not in mapping:
+            mapping[i] = j
+            matchedDistances[i] = pairDistances[i, j]
+    return mapping, matchedDistances
+
+
+# Fraction of the pixels with the same label in both labelings, after the
+# best one-to-one match of the labels (greedy on the contingency table):
+def labelAgreement(labels, truthLabels, k):
+    contingency = np.bincount(np.asarray(labels, np.int64) * k + truthLabels, minlength=k * k).reshape(k, k)
+    matchedPixels = 0
+    usedRows, usedColumns = set(), set()
+    for flatIndex in np.argsort(contingency, axis=None)[::-1]:
+        i, j = divmod(int(flatIndex), k)
+        if i not in usedRows and j not in usedColumns:
+            usedRows.add(i)
+            usedColumns.add(j)
+            matchedPixels += contingency[i, j]
+    return matchedPixels / len(truthLabels)
+
+
+# Fixed seed so runs are comparable:
+randomGenerator = np.random.default_rng(1234)
+
+# 9 patch colors + the white card = 10 clusters (the strip setting in main.py):
+patchColors = randomGenerator.uniform(20, 220, size=(9, 3))
+k = 10
+
+# Chart sizes to test (24 MP takes minutes with the full fit):
+chartSizes = [0.5, 2.0]
+
+# compact: compactness relative to the full fit (< 1 is a tighter clustering)
+# mean/max dist: distance between matched centers, vs truth: pixels in the matched true cluster
+print("%6s | %-16s | %10s | %8s | %8s | %10s %10s | %9s" % ("MP", "fit", "time (s)", "speedup", "compact",
+                                                            "mean dist", "max dist", "vs truth"))
+
+for megaPixels in chartSizes:
+    # The "previous" chart has slightly different colors:
+    previousChart, _ = makeChart(megaPixels, patchColors, randomGenerator, colorShift=6.0)
+    currentChart, truthLabels = makeChart(megaPixels, patchColors, randomGenerator)
+    previousPixels = previousChart.reshape(-1, 3)
+    pixelValues = currentChart.reshape(-1, 3)
+
+    # Reference (original) fit:
+    startTime = time.perf_counter()
+    referenceCenters, referenceLabels = fitCenters(pixelValues, k, "Full")
+    referenceLabels = referenceLabels.ravel()
+    referenceTime = time.perf_counter() - startTime
+    referenceCompactness = compactness(pixelValues, referenceCenters, referenceLabels)
+    print("%6.1f | %-16s | %10.3f | %8s | %8s | %10s %10s | %8.2f%%" % (
+        megaPixels, "Full (cv2)", referenceTime, "1.00x", "1.000", "-", "-",
+        100 * labelAgreement(referenceLabels, truthLabels, k)))
+
+    # Warm start centers, from the previous chart:
+    previousCenters, _ = fitCenters(previousPixels, k, "Histogram", randomSeed=0)
+
+    fitRuns = [("Full (warm)", "Full", previousCenters),
+               ("Histogram", "Histogram", None),
+               ("Histogram (warm)", "Histogram", previousCenters),
+               ("Subsample", "Subsample", None),
+               ("Subsample (warm)", "Subsample", previousCenters)]
+
+    for runName, fitMode, initialCenters in fitRuns:
+        startTime = time.perf_counter()
+        centers, labels = fitCenters(pixelValues, k, fitMode, initialCenters, randomSeed=0)
+        fitTime = time.perf_counter() - startTime
+
+        # Center agreement with the full fit, label agreement with the truth:
+        _, matchedDistances = matchCenters(np.asarray(centers), np.asarray(referenceCenters))
+        truthAgreement = labelAgreement(labels, truthLabels, k)
+
+        relativeCompactness = compactness(pixelValues, centers, labels) / referenceCompactness
+
+        print("%6.1f | %-16s | %10.3f | %7.2fx | %8.3f | %10.2f %10.2f | %8.2f%%" % (megaPixels, runName, fitTime,
+                                                                                     referenceTime / fitTime,
+                                                                                     relativeCompactness,
+                                                                                     matchedDistances.mean(),
+                                                                                     matchedDistances.max(),
+                                                                                     100 * truthAgreement))
@@ -0,0 +1,67 @@
+# File        :   benchmarkSegmentation.py (HSV Segmentation Benchmark)
+# Version     :   1.0.0
+# Description :   Compares cvtColor + one inRange per range against the compiled
+#                 BGR -> label lookup table of colorSegmentation.py, scaling the
+#                 number of HSV ranges from 1 to 16. The lookup table output must
+#                 match the reference exactly.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import time
+
+import numpy as np
+import cv2
+
+from colorSegmentation import compileHsvRanges, segmentLabels, segmentLabelsReference, segmentationLutCache
+
+
+# Runs function() a few times, returns the best time and the last result:
+def timeIt(function, repeats=3):
+    bestTime = np.inf
+    for _ in range(repeats):
+        startTime = time.perf_counter()
+        result = function()
+        bestTime = min(bestTime, time.perf_counter() - startTime)
+    return bestTime, result
+
+
+# N hue ranges evenly spread over the hue circle, the first one
+# wraps around (reds):
+def makeRanges(totalRanges):
+    hueStep = 180 / totalRanges
+    hsvRanges = []
+    for i in range(totalRanges):
+        lowerHue = int(round(i * hueStep - 0.3 * hueStep)) % 180
+        upperHue = int(round(i * hueStep + 0.3 * hueStep)) % 180
+        hsvRanges.append({"Label": i + 1, "Lower": [lowerHue, 70, 60], "Upper": [upperHue, 255, 255]})
+    return hsvRanges
+
+
+# Fixed seed so runs are comparable:
+randomGenerator = np.random.default_rng(6)
+
+# Smooth random color field, 8 MP:
+smallImage = randomGenerator.integers(0, 256, size=(60, 80, 3), dtype=np.uint8)
+inputImage = cv2.resize(smallImage, (3264, 2448), interpolation=cv2.INTER_CUBIC)
+outputImage = np.empty(inputImage.shape[:2], np.uint8)
+
+print("Image: %d x %d" % (inputImage.shape[1], inputImage.shape[0]))
+print("%6s | %14s | %9s | %11s | %9s | %9s" % ("ranges", "reference (ms)", "lut (ms)", "build (ms)", "speedup",
+                                                 "lut exact"))
+
+for totalRanges in [1, 2, 4, 8, 16]:
+    hsvRanges = makeRanges(totalRanges)
+
+    referenceTime, referenceLabels = timeIt(lambda: segmentLabelsReference(inputImage, hsvRanges))
+
+    # One-off table build (cached afterwards):
+    segmentationLutCache.clear()
+    buildTime, segmentationLut = timeIt(lambda: compileHsvRanges(hsvRanges), repeats=1)
+
+    lutTime, lutLabels = timeIt(lambda: segmentLabels(inputImage, segmentationLut, outputImage))
+    exactMatch = np.array_equal(lutLabels, referenceLabels)
+
+    print("%6d | %14.1f | %9.1f | %11.1f | %8.2fx | %9s" % (totalRanges, 1e3 * referenceTime, 1e3 * lutTime,
+                                                           1e3 * buildTime, referenceTime / lutTime, exactMatch))
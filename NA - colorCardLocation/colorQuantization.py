@@ -0,0 +1,294 @@
+# File        :   colorQuantization.py (Color Card Quantization)
+# Version     :   1.0.3
+# Description :   k-means color quantization for the color card crops. Besides the
+#                 original full-pixel cv2.kmeans fit, the centers can be fitted on
+#                 a weighted color histogram or a random pixel subsample, optionally
+#                 warm-started from the previous chart's centers. For known
+#                 palettes, a quantized BGR lookup table skips k-means entirely.
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+
+# Packs BGR pixels into histogram bin indices, keeping the
+# top histogramBits of each channel:
+def colorBinIndices(pixelValues, histogramBits):
+    shift = 8 - histogramBits
+    binIndices = (pixelValues[:, 0] >> shift).astype(np.int32) << (2 * histogramBits)
+    binIndices |= (pixelValues[:, 1] >> shift).astype(np.int32) << histogramBits
+    binIndices |= (pixelValues[:, 2] >> shift).astype(np.int32)
+    return binIndices
+
+
+# Builds a weighted color histogram: the mean color of every
+# non-empty bin and the number of pixels in it:
+def colorHistogram(pixelValues, histogramBits=5):
+    totalBins = 1 << (3 * histogramBits)
+    binIndices = colorBinIndices(pixelValues, histogramBits)
+
+    # Pixel count and per-channel color sums of each bin:
+    binCounts = np.bincount(binIndices, minlength=totalBins)
+    binColors = np.empty((totalBins, 3), np.float64)
+    for c in range(3):
+        binColors[:, c] = np.bincount(binIndices, weights=pixelValues[:, c], minlength=totalBins)
+
+    # Keep the non-empty bins, get their mean color:
+    usedBins = binCounts > 0
+    binCounts = binCounts[usedBins].astype(np.float64)
+    binColors = binColors[usedBins] / binCounts[:, None]
+
+    return binColors.astype(np.float32), binCounts
+
+
+# Squared distances between every point and every center, (N, k):
+def squaredDistances(points, centers):
+    pointDistances = points @ centers.T
+    pointDistances *= -2.0
+    pointDistances += np.einsum("ij,ij->i", centers, centers)[None, :]
+    pointDistances += np.einsum("ij,ij->i", points, points)[:, None]
+    return pointDistances
+
+
+# Picks k initial centers via weighted k-means++:
+def kmeansPlusPlus(points, weights, k, randomGenerator):
+    probabilities = weights / weights.sum()
+    centers = np.empty((k, points.shape[1]), np.float32)
+    centers[0] = points[randomGenerator.choice(len(points), p=probabilities)]
+    closestDistance = squaredDistances(points, centers[:1])[:, 0]
+
+    for i in range(1, k):
+        # Far away (and heavy) points are more likely to be picked:
+        pickWeights = weights * np.maximum(closestDistance, 0.0)
+        totalWeight = pickWeights.sum()
+        if totalWeight > 0:
+            centers[i] = points[randomGenerator.choice(len(points), p=pickWeights / totalWeight)]
+        else:
+            centers[i] = points[randomGenerator.choice(len(points), p=probabilities)]
+        closestDistance = np.minimum(closestDistance, squaredDistances(points, centers[i:i + 1])[:, 0])
+
+    return centers
+
+
+# Weighted Lloyd k-means, same criteria/attempts semantics as cv2.kmeans.
+# Returns the compactness and the (k, 3) float32 centers:
+def weightedKmeans(points, weights, k, criteria, attempts, initialCenters=None, randomSeed=None):
+    points = np.asarray(points, np.float32)
+    weights = np.asarray(weights, np.float64)
+    _, maxIterations, epsilon = criteria
+    randomGenerator = np.random.default_rng(randomSeed)
+
+    # A warm start needs a single attempt:
+    if initialCenters is not None:
+        attempts = 1
+
+    bestCompactness = np.inf
+    bestCenters = None
+
+    for _ in range(attempts):
+        # Initial centers:
+        if initialCenters is not None:
+            centers = np.array(initialCenters, np.float32).reshape(k, 3)
+        else:
+            centers = kmeansPlusPlus(points, weights, k, randomGenerator)
+
+        for _ in range(maxIterations):
+            # Assign every point to its closest center:
+            labels = np.argmin(squaredDistances(points, centers), axis=1)
+
+            # Weighted mean of every cluster, empty clusters keep their center:
+            clusterWeights = np.bincount(labels, weights=weights, minlength=k)
+            newCenters = centers.copy()
+            nonEmpty = clusterWeights > 0
+            for c in range(3):
+                channelSums = np.bincount(labels, weights=weights * points[:, c], minlength=k)
+                newCenters[nonEmpty, c] = channelSums[nonEmpty] / clusterWeights[nonEmpty]
+
+            # Stop when the centers stop moving:
+            centerShift = np.max(np.linalg.norm(newCenters - centers, axis=1))
+            centers = newCenters
+            if centerShift < epsilon:
+                break
+
+        # Keep the tightest clustering:
+        compactness = np.sum(weights * np.min(squaredDistances(points, centers), axis=1))
+        if compactness < bestCompactness:
+            bestCompactness = compactness
+            bestCenters = centers
+
+    return bestCompactness, bestCenters
+
+
+# Assigns every pixel to its closest center (in chunks, to bound the
+# size of the distance matrix), returns a flat uint8 label array:
+def assignLabels(pixelValues, centers, chunkSize=1 << 20):
+    centers = np.asarray(centers, np.float32)
+    centerNorms = np.einsum("ij,ij->i", centers, centers)
+    labels = np.empty(len(pixelValues), np.uint8)
+
+    for start in range(0, len(pixelValues), chunkSize):
+        chunk = pixelValues[start:start + chunkSize].astype(np.float32)
+        # |p|^2 is the same for every center, it does not change the argmin:
+        chunkDistances = chunk @ centers.T
+        chunkDistances *= -2.0
+        chunkDistances += centerNorms[None, :]
+        labels[start:start + chunkSize] = np.argmin(chunkDistances, axis=1)
+
+    return labels
+
+
+# Fits the k centers according to fitMode (initialCenters: warm start, one
+# attempt from them):
+# "Full": cv2.kmeans on every pixel (original behaviour), a warm start
+# seeds the labels from the initial centers (KMEANS_USE_INITIAL_LABELS)
+# "Histogram": weighted k-means on the color histogram
+# "Subsample": cv2.kmeans on a random pixel subsample
+def fitCenters(pixelValues, k, fitMode="Full", initialCenters=None, histogramBits=5, sampleSize=20000,
+               randomSeed=None):
+    # Define stopping criteria
+    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 50, 0.2)
+    attempts = 10
+
+    if fitMode == "Full":
+        # Run k-means, get cluster centers:
+        if initialCenters is not None:
+            initialLabels = assignLabels(pixelValues, np.asarray(initialCenters, np.float32).reshape(k, 3))
+            _, labels, centers = cv2.kmeans(np.float32(pixelValues), k, initialLabels.astype(np.int32)[:, None],
+                                            criteria, 1, cv2.KMEANS_USE_INITIAL_LABELS)
+        else:
+            _, labels, centers = cv2.kmeans(np.float32(pixelValues), k, None, criteria, attempts,
+                                            cv2.KMEANS_RANDOM_CENTERS)
+        return centers, labels.flatten()
+
+    elif fitMode == "Histogram":
+        # Fit on the (few thousand) histogram bins, weighted by pixel count:
+        binColors, binCounts = colorHistogram(pixelValues, histogramBits)
+        _, centers = weightedKmeans(binColors, binCounts, k, criteria, attempts, initialCenters, randomSeed)
+
+    elif fitMode == "Subsample":
+        # Fit on a random subset of the pixels:
+        randomGenerator = np.random.default_rng(randomSeed)
+        sampleSize = min(sampleSize, len(pixelValues))
+        sampleIndices = randomGenerator.choice(len(pixelValues), sampleSize, replace=False)
+        samplePixels = np.float32(pixelValues[sampleIndices])
+        if initialCenters is not None:
+            _, centers = weightedKmeans(samplePixels, np.ones(sampleSize), k, criteria, 1, initialCenters)
+        else:
+            _, _, centers = cv2.kmeans(samplePixels, k, None, criteria, attempts, cv2.KMEANS_PP_CENTERS)
+
+    else:
+        raise ValueError("fitCenters>> Error: Unknown fit mode: " + str(fitMode))
+
+    # One assignment pass over all the pixels:
+    return centers, assignLabels(pixelValues, centers)
+
+
+# Nearest palette entry of every color (N, 3), 255 if no entry is
+# closer than minDistance. The labels are uint8, so the palette can have
+# at most 255 entries (labels 0-254, 255 is the no match label):
+def nearestPaletteLabels(colorValues, paletteColors, minDistance):
+    paletteColors = np.asarray(paletteColors, np.float32).reshape(-1, 3)
+    if len(paletteColors) > noMatchLabel:
+        raise ValueError("nearestPaletteLabels>> Error: Palette has more than " + str(noMatchLabel) +
+                         " entries: " + str(len(paletteColors)))
+    colorDistances = squaredDistances(np.asarray(colorValues, np.float32), paletteColors)
+    labels = np.argmin(colorDistances, axis=1).astype(np.uint8)
+    closestDistance = colorDistances[np.arange(len(labels)), labels]
+    labels[closestDistance >= minDistance * minDistance] = noMatchLabel
+    return labels
+
+
+# Label used for "no palette entry within minDistance":
+noMatchLabel = 255
+
+# Built lookup tables, by (palette, minDistance, lutBits), least recently
+# used first. At most paletteLutCacheSize are kept:
+paletteLutCache = {}
+paletteLutCacheSize = 8
+
+
+# Builds (or fetches) the quantized BGR -> palette label lookup table: a flat
+# array with one entry per (2^lutBits)^3 color bin, each bin labeled by
+# the palette entry closest to the bin center:
+def buildPaletteLut(paletteColors, minDistance, lutBits=5):
+    cacheKey = (tuple(np.asarray(paletteColors, np.float32).ravel()), float(minDistance), lutBits)
+    paletteLut = paletteLutCache.pop(cacheKey, None)
+    if paletteLut is not None:
+        # Most recently used goes last:
+        paletteLutCache[cacheKey] = paletteLut
+        return paletteLut
+
+    # Center color of every bin, in bin index order (B major, R minor):
+    binSize = 1 << (8 - lutBits)
+    binCenters = np.arange(1 << lutBits, dtype=np.float32) * binSize + 0.5 * (binSize - 1)
+    blueCenters, greenCenters, redCenters = np.meshgrid(binCenters, binCenters, binCenters, indexing="ij")
+    binColors = np.stack((blueCenters.ravel(), greenCenters.ravel(), redCenters.ravel()), axis=1)
+
+    paletteLut = nearestPaletteLabels(binColors, paletteColors, minDistance)
+    paletteLutCache[cacheKey] = paletteLut
+    # Drop the least recently used tables:
+    while len(paletteLutCache) > paletteLutCacheSize:
+        paletteLutCache.pop(next(iter(paletteLutCache)))
+
+    return paletteLut
+
+
+# Labels every pixel of a BGR image with a single lookup table gather,
+# returns a (height, width) uint8 label image:
+def paletteLabels(inputImage, paletteLut, lutBits=5):
+    pixelValues = inputImage.reshape((-1, 3))
+    binIndices = colorBinIndices(pixelValues, lutBits)
+    return paletteLut[binIndices].reshape(inputImage.shape[:2])
+
+
+# Applies k-means for image segmentation. Returns the segmented image and the
+# fitted (float) centers, which can warm-start the next call via initialCenters.
+# fitMode "Palette" skips k-means: every pixel is matched against the
+# filterParams["Threshold"] palette through a lookup table (no centers returned):
+def imageQuantization(inputImage, k, runDistanceFilter, filterParams, minDistance, fitMode="Full",
+                      initialCenters=None):
+    # Get dict lower and upper thresholds:
+    targetColor = np.asarray(filterParams["Threshold"], np.float32).reshape(-1, 3)
+
+    if fitMode == "Palette":
+        # Label image, straight from the lookup table:
+        paletteLut = buildPaletteLut(targetColor, minDistance)
+        labels = paletteLabels(inputImage, paletteLut)
+
+        # Label -> color table (no match -> "Low"):
+        labelColors = np.empty((256, 3), np.uint8)
+        labelColors[:] = filterParams["Low"]
+        if runDistanceFilter:
+            labelColors[:len(targetColor)] = filterParams["High"]
+        else:
+            labelColors[:len(targetColor)] = np.uint8(targetColor)
+
+        return labelColors[labels], None
+
+    # Reshape the image to a 2D array of pixels and 3 color values (RGB)
+    pixelValues = inputImage.reshape((-1, 3))
+
+    # Fit the centers and label every pixel:
+    fittedCenters, labels = fitCenters(pixelValues, k, fitMode, initialCenters)
+
+    # Convert back to 8 bit values:
+    centers = np.uint8(np.clip(fittedCenters, 0, 255))
+
+    # Run distance filter:
+    if runDistanceFilter:
+        # Centers within minDistance of any target get the "High" color,
+        # the rest get the "Low" color:
+        centerLabels = nearestPaletteLabels(centers, targetColor, minDistance)
+        centers[:] = filterParams["Low"]
+        centers[centerLabels != noMatchLabel] = filterParams["High"]
+
+    # Convert all pixels to the color of the centroids:
+    segmentedImage = centers[labels]
+    # Reshape back to the original image dimension
+    segmentedImage = segmentedImage.reshape(inputImage.shape)
+
+    # Ready:
+    return segmentedImage, fittedCenters
@@ -0,0 +1,109 @@
+# File        :   illuminationNormalization.py (Gain Division Stage)
+# Version     :   1.2.0
+# Description :   Illumination normalization via gain division. By default the
+#                 background (local maximum, via morphological closing) is taken
+#                 at full resolution and divided in integer arithmetic with the
+#                 same output as the original float64 formula. Opt-in: the
+#                 background is estimated on a max-pooled, downscaled image and
+#                 upsampled, then the input is divided by it in a single
+#                 saturating pass into a uint8 buffer (approximate).
+
+# Date:       :   Oct 18, 2026
+# Author      :   Ricardo Acevedo-Avila (racevedoaa@gmail.com)
+# License     :   Creative Commons CC0
+
+import numpy as np
+import cv2
+
+from morphology import getKernel, morphology
+
+
+# Original gain division: full resolution closing and float64 division:
+def gainDivisionReference(inputImage, kernelSize=100):
+    # Get local maximum:
+    maxKernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernelSize, kernelSize))
+    localMax = cv2.morphologyEx(inputImage, cv2.MORPH_CLOSE, maxKernel, None, None, 1, cv2.BORDER_REFLECT101)
+
+    # Perform gain division
+    gainDivision = np.where(localMax == 0, 0, (inputImage / localMax))
+
+    # Clip the values to [0,255]
+    gainDivision = np.clip((255 * gainDivision), 0, 255)
+
+    # Convert the mat type from float to uint8:
+    return gainDivision.astype("uint8")
+
+
+# Gets (or creates) a named work buffer of the given shape and type:
+def getBuffer(buffers, bufferName, bufferShape, bufferType):
+    if buffers is None:
+        return np.empty(bufferShape, bufferType)
+
+    currentBuffer = buffers.get(bufferName)
+    if currentBuffer is None or currentBuffer.shape != bufferShape or currentBuffer.dtype != bufferType:
+        currentBuffer = np.empty(bufferShape, bufferType)
+        buffers[bufferName] = currentBuffer
+    return currentBuffer
+
+
+# Estimates the illumination (local maximum) at 1/downscale resolution and
+# upsamples it into a full size background of the given precision:
+# "float32": float background
+# "uint16": fixed-point background (8 fractional bits)
+def estimateBackground(inputImage, kernelSize=100, downscale=4, precision="float32", buffers=None):
+    imageHeight, imageWidth = inputImage.shape[:2]
+
+    # Max-pool down to the small image (averaging would lower the local maxima):
+    poolKernel = getKernel(downscale, "Rect")
+    pooledImage = getBuffer(buffers, "Pooled", inputImage.shape, inputImage.dtype)
+    cv2.dilate(inputImage, poolKernel, dst=pooledImage, anchor=(0, 0), borderType=cv2.BORDER_REPLICATE)
+    smallImage = np.ascontiguousarray(pooledImage[::downscale, ::downscale])
+
+    # Close on the small image, with a proportionally smaller kernel:
+    smallKernelSize = max(1, int(round(kernelSize / downscale)))
+    smallBackground = morphology(smallImage, "Closing", smallKernelSize, borderType=cv2.BORDER_REFLECT101)
+
+    if precision == "float32":
+        smallBackground = smallBackground.astype(np.float32)
+        backgroundType = np.float32
+    elif precision == "uint16":
+        # 8.8 fixed point:
+        smallBackground = smallBackground.astype(np.uint16) << 8
+        backgroundType = np.uint16
+    else:
+        raise ValueError("estimateBackground>> Error: Unknown precision: " + str(precision))
+
+    # Upsample into the (reused) full size buffer:
+    background = getBuffer(buffers, "Background", inputImage.shape, backgroundType)
+    cv2.resize(smallBackground, (imageWidth, imageHeight), dst=background, interpolation=cv2.INTER_LINEAR)
+
+    return background
+
+
+# Normalizes the illumination of a uint8 image: 255 * input / background,
+# saturated to [0, 255] and 0 where the background is 0. The result is written
+# into outputImage (if given) and no full size float64 temporary is created.
+# downscale=1 gives the same output as gainDivisionReference, a larger
+# downscale is faster but approximate (rounded division, smoothed background):
+def normalizeIllumination(inputImage, kernelSize=100, downscale=1, precision="float32", outputImage=None,
+                          buffers=None):
+    if downscale <= 1:
+        # Full resolution background. The original float64 formula equals
+        # min(255 * input // background, 255) (0 where the background is 0),
+        # computed in a uint16 work buffer:
+        background = morphology(inputImage, "Closing", kernelSize, borderType=cv2.BORDER_REFLECT101)
+        gainDivision = getBuffer(buffers, "Division", inputImage.shape, np.uint16)
+        np.multiply(inputImage, 255, out=gainDivision, dtype=np.uint16)
+        with np.errstate(divide="ignore"):
+            np.floor_divide(gainDivision, background, out=gainDivision, dtype=np.uint16)
+        np.minimum(gainDivision, 255, out=gainDivision)
+        if outputImage is None:
+            outputImage = np.empty(inputImage.shape, np.uint8)
+        np.copyto(outputImage, gainDivision, casting="unsafe")
+        return outputImage
+
+    background = estimateBackground(inputImage, kernelSize, downscale, precision, buffers)
+
+    # Fixed-point background carries a 256 factor:
+    divisionScale = 255.0 if precision == "float32" else 255.0 * 256.0
+    return cv2.divide(inputImage, background, dst=outputImage, scale=divisionScale, dtype=cv2.CV_8U)
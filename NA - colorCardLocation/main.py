@@ -1,5 +1,5 @@
 # File        :   main.py (Color Cell Location)
-# Version     :   0.5.1
+# Version     :   0.7.5
 # Description :   Script that locates color cells from a color card picture.
 #                 Partial Answer for: ???
 
@@ -10,6 +10,11 @@
 import numpy as np
 import cv2
 
+from colorQuantization import imageQuantization
+from illuminationNormalization import getBuffer, normalizeIllumination
+from colorSegmentation import segmentHsvRanges
+from morphology import morphology
+
 
 # Reads image via OpenCV:
 def readImage(imagePath):
@@ -64,57 +69,25 @@ def getCombinedRectangle(rectangleList):
     return compX, compY, compW, compH
 
 
-# Applies k-means for image segmentation:
-def imageQuantization(inputImage, k, runDistanceFilter, filterParams, minDistance):
-    # Reshape the image to a 2D array of pixels and 3 color values (RGB)
-    pixelValues = inputImage.reshape((-1, 3))
-    # Convert to float
-    pixelValues = np.float32(pixelValues)
-
-    # Define stopping criteria
-    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 50, 0.2)
-
-    # Run k-means, get cluster centers:
-    _, labels, (centers) = cv2.kmeans(pixelValues, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
-    # Convert back to 8 bit values:
-    centers = np.uint8(centers)
-
-    # Run distance filter:
-    if runDistanceFilter:
-        # Loop through the centers array and look for the filter targets
-        # Apply colors according to the dict params:
-        for i in range(k):
-            # Get current center:
-            currentPixel = centers[i]
-            # Get dict lower and upper thresholds:
-            targetColor = filterParams["Threshold"]
-            subColor = filterParams["Low"]
-            # Check if current center is within threshold range:
-            for currentTarget in targetColor:
-                currentDistance = np.linalg.norm(currentPixel - currentTarget)
-                if currentDistance < minDistance:
-                    subColor = filterParams["High"]
-            # Default value:
-            centers[i] = subColor
-
-    # Flatten the labels array:
-    labels = labels.flatten()
-
-    # Convert all pixels to the color of the centroids:
-    segmentedImage = centers[labels.flatten()]
-    # Reshape back to the original image dimension
-    segmentedImage = segmentedImage.reshape(inputImage.shape)
-
-    # Ready:
-    return segmentedImage
-
-
 # Set image path
 directoryPath = "D://opencvImages//"
 
 # Set image names:
 imagesList = ["chart-01.jpg", "chart-02.jpg", "chart-03.jpg"]
 
+# k-means fit mode: "Full" (all pixels), "Histogram" (weighted color histogram)
+# or "Subsample" (random pixels). "Palette" skips k-means and matches every pixel
+# against the colorData thresholds through a lookup table:
+fitMode = "Full"
+# Warm-start each shape's k-means from the previous chart's centers (opt-in):
+warmStart = False
+previousCenters = {"Strip": None, "Card": None}
+
+# Gain division background resolution (1: full, as the original; 4: 1/4, opt-in)
+# and its output/work buffers:
+normalizationDownscale = 1
+normalizationBuffers = {}
+
 for currentImage in imagesList:
 
     # Set image path:
@@ -128,32 +101,25 @@ for currentImage in imagesList:
     # Deep copy for results:
     inputImageCopy = inputImage.copy()
 
-    # Get local maximum:
+    # Gain division: the output and work buffers are reused between charts.
+    # normalizationDownscale > 1 estimates the background at reduced
+    # resolution (faster, but the output differs slightly):
     kernelSize = 100
-    maxKernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernelSize, kernelSize))
-    localMax = cv2.morphologyEx(inputImage, cv2.MORPH_CLOSE, maxKernel, None, None, 1, cv2.BORDER_REFLECT101)
-
-    # Perform gain division
-    gainDivision = np.where(localMax == 0, 0, (inputImage / localMax))
-
-    # Clip the values to [0,255]
-    gainDivision = np.clip((255 * gainDivision), 0, 255)
-
-    # Convert the mat type from float to uint8:
-    gainDivision = gainDivision.astype("uint8")
+    gainDivision = getBuffer(normalizationBuffers, "Output", inputImage.shape, np.uint8)
+    normalizeIllumination(inputImage, kernelSize, downscale=normalizationDownscale, outputImage=gainDivision,
+                          buffers=normalizationBuffers)
 
     # showImage("Gain Div", gainDivision)
 
-    # Convert the BGR pixel to HSV:
-    hsvImage = cv2.cvtColor(gainDivision, cv2.COLOR_BGR2HSV)
-
-    # Threshold on red:
+    # HSV ranges to segment (label 1 is red), more colors can be added
+    # here. One range runs cvtColor + inRange as the original; from 4 ranges
+    # on they are all labeled in one lookup table pass (no HSV image):
     rangeThreshold = 5
-    lowerValues = np.array([159, 70, 109])
-    upperValues = np.array([179, 255, 255])
+    hsvRanges = [{"Label": 1, "Lower": [159, 70, 109], "Upper": [179, 255, 255]}]
 
-    # Create HSV mask:
-    redMask = cv2.inRange(hsvImage, lowerValues, upperValues)
+    # Create the label image and get the red mask:
+    labelImage = segmentHsvRanges(gainDivision, hsvRanges)
+    redMask = cv2.compare(labelImage, 1, cv2.CMP_EQ)
     # showImage("Red Mask", redMask)
 
     # Use a little bit of morphology to clean the mask:
@@ -162,11 +128,9 @@ for currentImage in imagesList:
     # Set morph operation iterations:
     opIterations = 5
 
-    # Get the structuring element:
-    morphKernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernelSize, kernelSize))
-    # Perform closing:
-    redMask = cv2.morphologyEx(redMask, cv2.MORPH_CLOSE, morphKernel, None, None, opIterations,
-                               cv2.BORDER_REFLECT101)
+    # Perform closing (cached kernel):
+    redMask = morphology(redMask, "Closing", kernelSize, opIterations, borderType=cv2.BORDER_REFLECT101,
+                         binaryInput=True)
 
     # Deep copy for results:
     binaryColor = redMask.copy()
@@ -281,8 +245,12 @@ for currentImage in imagesList:
         minDistance = shapeParams[currentShape]["Distance"]
 
         # Segment image by grouping colors into k colors, apply distance filter:
-        segmentedImage = imageQuantization(currentCrop, k, runDistanceFilter=True, filterParams=colorData,
-                                           minDistance=minDistance)
+        initialCenters = previousCenters[currentShape] if warmStart else None
+        segmentedImage, fittedCenters = imageQuantization(currentCrop, k, runDistanceFilter=True,
+                                                          filterParams=colorData, minDistance=minDistance,
+                                                          fitMode=fitMode, initialCenters=initialCenters)
+        # Keep the centers for the next chart:
+        previousCenters[currentShape] = fittedCenters
 
         showImage("K-means: " + currentShape, segmentedImage)
 